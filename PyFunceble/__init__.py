@@ -396,6 +396,32 @@ def dns_lookup(
     return None
 
 
+def dns_lookup_many(
+    subjects, dns_server=None, complete=False, lifetime=3, concurrency=10
+):  # pragma: no cover
+    """
+    Make a DNS lookup of each of the given subjects concurrently.
+
+    :param subjects: The subjects we are working with.
+    :type subjects: list|tuple|generator
+    :param dns_server: A (or list of) DNS server to use while resolving.
+    :type dns_server: str|int
+    :param bool complete:
+        Tell us to look for everything instead of :code:`NS` only.
+    :param int lifetime: The query lifetime.
+    :param int concurrency: The maximal number of concurrent lookups.
+
+    :return:
+        A generator of :code:`(subject, result)` in the order the lookups
+        are finished. The results are in the format given by :func:`dns_lookup`.
+    :rtype: generator
+    """
+
+    return lookup.Dns(dns_server=dns_server, lifetime=lifetime).request_many(
+        (x for x in subjects if x), complete=complete, concurrency=concurrency
+    )
+
+
 def whois(subject, server=None, timeout=3):  # pragma: no cover
     """
     Request the WHOIS record of the given subject.
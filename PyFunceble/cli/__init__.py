@@ -397,6 +397,30 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                dns_control_group.add_argument(
+                    "--dns-cache",
+                    action="store_true",
+                    help="Switch the value of the usage of the cache of the "
+                    "DNS answers. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_cache)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                dns_control_group.add_argument(
+                    "--dns-cache-size",
+                    type=int,
+                    help="Set the maximal number of DNS answers to keep "
+                    "into the cache. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.dns_cache_size)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 dns_control_group.add_argument(
                     "--dns-lookup-over-tcp",
                     action="store_true",
@@ -425,7 +449,7 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     "--database-type",
                     type=str,
                     help="Tell us the type of database to use. "
-                    "\nYou can choose between the following: `json | mariadb | mysql` %s"
+                    "\nYou can choose between the following: `json | json_journal | mariadb | mysql | sqlite` %s"
                     % (
                         current_value_format
                         + repr(PyFunceble.CONFIGURATION.db_type)
@@ -496,6 +520,18 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                output_control_group.add_argument(
+                    "--export",
+                    type=str,
+                    help="Set the (Parquet or CSV) file to export the results into. "
+                    "Parquet requires pyarrow. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.export_file)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 output_control_group.add_argument(
                     "--hierarchical",
                     action="store_true",
@@ -671,6 +707,32 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                multiprocessing_group.add_argument(
+                    "--threaded",
+                    action="store_true",
+                    help="Switch the value of the usage of the threaded "
+                    "(single process) engine for file testing. "
+                    "It is not an asynchronous engine: it runs our blocking "
+                    "lookups into a pool of threads. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.threaded)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                multiprocessing_group.add_argument(
+                    "--threads",
+                    type=int,
+                    help="Set the number of threads to use while "
+                    "using the threaded engine (hard capped to 50). %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.maximal_threads)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 multiprocessing_group.add_argument(
                     "-m",
                     "--multiprocess",
@@ -695,6 +757,30 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     ),
                 )
 
+                multiprocessing_group.add_argument(
+                    "--multiprocess-chunk-size",
+                    type=int,
+                    help="Set the number of subjects to send at once to "
+                    "a worker of the pool. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.multiprocess_chunk_size)
+                        + Style.RESET_ALL
+                    ),
+                )
+
+                multiprocessing_group.add_argument(
+                    "--multiprocess-worker-pool",
+                    action="store_true",
+                    help="Switch the value of the usage of long-lived workers "
+                    "(pool) instead of one process per subject. %s"
+                    % (
+                        current_value_format
+                        + repr(PyFunceble.CONFIGURATION.multiprocess_worker_pool)
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 multiprocessing_group.add_argument(
                     "-p",
                     "--processes",
@@ -840,6 +926,13 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     "not exist in the current directory.",
                 )
 
+                unique_group.add_argument(
+                    "--export-from-database",
+                    type=str,
+                    help="Export the results stored into the (MariaDB, MySQL or SQLite) "
+                    "database into the given (Parquet or CSV) file.",
+                )
+
                 unique_group.add_argument(
                     "--iana", action="store_true", help=argparse.SUPPRESS,
                 )
@@ -942,7 +1035,13 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                     )
 
                 if args.database_type:
-                    if args.database_type.lower() in ["json", "mariadb", "mysql"]:
+                    if args.database_type.lower() in [
+                        "json",
+                        "json_journal",
+                        "mariadb",
+                        "mysql",
+                        "sqlite",
+                    ]:
                         PyFunceble.CONFIGURATION.db_type = args.database_type.lower()
                     else:
                         print(
@@ -967,6 +1066,12 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                 if args.dns:
                     PyFunceble.CONFIGURATION.dns_server = args.dns
 
+                if args.dns_cache:
+                    PyFunceble.CONFIGURATION.dns_cache = preset.switch("dns_cache")
+
+                if args.dns_cache_size:
+                    PyFunceble.CONFIGURATION.dns_cache_size = args.dns_cache_size
+
                 if args.dns_lookup_over_tcp:
                     PyFunceble.CONFIGURATION.dns_lookup_over_tcp = preset.switch(
                         "dns_lookup_over_tcp"
@@ -977,6 +1082,9 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         "show_execution_time"
                     )
 
+                if args.export:
+                    PyFunceble.CONFIGURATION.export_file = args.export
+
                 if args.filter:
                     PyFunceble.CONFIGURATION.filter = args.filter
 
@@ -1034,6 +1142,16 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                         )
                         sys.exit(1)
 
+                if args.multiprocess_chunk_size:
+                    PyFunceble.CONFIGURATION.multiprocess_chunk_size = (
+                        args.multiprocess_chunk_size
+                    )
+
+                if args.multiprocess_worker_pool:
+                    PyFunceble.CONFIGURATION.multiprocess_worker_pool = preset.switch(
+                        "multiprocess_worker_pool"
+                    )
+
                 if args.no_files:
                     PyFunceble.CONFIGURATION.no_files = preset.switch("no_files")
 
@@ -1085,6 +1203,12 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                 if args.syntax:
                     PyFunceble.CONFIGURATION.syntax = preset.switch("syntax")
 
+                if args.threaded:
+                    PyFunceble.CONFIGURATION.threaded = preset.switch("threaded")
+
+                if args.threads:
+                    PyFunceble.CONFIGURATION.maximal_threads = args.threads
+
                 if args.timeout >= 0:
                     PyFunceble.CONFIGURATION.timeout = args.timeout
 
@@ -1131,6 +1255,7 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                 preset.timeout()
                 preset.cooldown_time()
                 preset.dns_lookup_over_tcp()
+                preset.dns_cache()
 
                 if args.clean:
                     PyFunceble.output.Clean()
@@ -1150,6 +1275,13 @@ def tool():  # pragma: no cover pylint: disable=too-many-branches,too-many-state
                 if args.public_suffix:
                     PublicSuffix().update()
 
+                if args.export_from_database:
+                    preset.engine_limits()
+
+                    PyFunceble.output.ResultsExport(
+                        args.export_from_database
+                    ).export_database()
+
                 PyFunceble.LOGGER.info(f"ARGS:\n{args}")
 
                 # We compare the versions (upstream and local) and in between.
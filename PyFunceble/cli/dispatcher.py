@@ -186,6 +186,15 @@ class Dispatcher:  # pylint: disable=too-few-public-methods, too-many-arguments
                 )
             else:
                 PyFunceble.core.Multiprocess(file_path, "domain").generate_files()
+        elif PyFunceble.CONFIGURATION.threaded:
+            if not generate_results_only and not generate_all_results_only:
+                PyFunceble.core.ThreadedFile(file_path, "domain").run_test()
+            elif generate_all_results_only:
+                PyFunceble.core.ThreadedFile(file_path, "domain").generate_files(
+                    include_entries_without_changes=True
+                )
+            else:
+                PyFunceble.core.ThreadedFile(file_path, "domain").generate_files()
         else:
             if not generate_results_only and not generate_all_results_only:
                 PyFunceble.core.File(file_path, "domain").run_test()
@@ -220,6 +229,15 @@ class Dispatcher:  # pylint: disable=too-few-public-methods, too-many-arguments
                 )
             else:
                 PyFunceble.core.Multiprocess(url_file_path, "url").generate_files()
+        elif PyFunceble.CONFIGURATION.threaded:
+            if not generate_results_only and not generate_all_results_only:
+                PyFunceble.core.ThreadedFile(url_file_path, "url").run_test()
+            elif generate_all_results_only:
+                PyFunceble.core.ThreadedFile(url_file_path, "url").generate_files(
+                    include_entries_without_changes=True
+                )
+            else:
+                PyFunceble.core.ThreadedFile(url_file_path, "url").generate_files()
         else:
             if not generate_results_only and not generate_all_results_only:
                 PyFunceble.core.File(url_file_path, "url").run_test()
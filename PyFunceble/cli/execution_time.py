@@ -120,8 +120,8 @@ class ExecutionTime:  # pylint: disable=too-few-public-methods
             file_instance = PyFunceble.helpers.File(percentage_output)
 
             if PyFunceble.CONFIGURATION.show_percentage and file_instance.exists():
-                file_instance.write(
-                    "\nExecution time: {0}".format(formatted_time), overwrite=False
+                PyFunceble.output.OutputSink.write(
+                    percentage_output, "\nExecution time: {0}".format(formatted_time)
                 )
 
         self.save(last=last)
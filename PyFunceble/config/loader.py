@@ -499,6 +499,10 @@ class Loader:
             dns_server=PyFunceble.CONFIGURATION.dns_server,
             lifetime=PyFunceble.CONFIGURATION.timeout,
             tcp=PyFunceble.CONFIGURATION.dns_lookup_over_tcp,
+            cache_size=PyFunceble.CONFIGURATION.dns_cache_size
+            if PyFunceble.CONFIGURATION.dns_cache
+            else None,
+            negative_ttl=PyFunceble.CONFIGURATION.dns_cache_negative_ttl,
         )
         PyFunceble.DNSLOOKUP = self.dns_lookup
         PyFunceble.LOADER = self
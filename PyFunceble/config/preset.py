@@ -67,11 +67,13 @@ from colorama import Fore, Style
 import PyFunceble
 
 
-class Preset:  # pragma: no cover
+class Preset:  # pragma: no cover pylint: disable=too-many-public-methods
     """
     Checks or update the global configuration based on some events.
     """
 
+    # Note: Each preset is a public method so that it can be applied on its own.
+
     # List all index which can be superset.
     # In other words if an index which is listed here
     # is also listed into PyFunceble.INTERN["custom_config_loaded"],
@@ -89,6 +91,28 @@ class Preset:  # pragma: no cover
         "whois_database",
     ]
 
+    # List all index which only have to be of the right type and above
+    # a minimal value. A minimal value of None means that we only check the type.
+    # Format: {index: (accepted types, minimal value, default value)}
+    limits = {
+        "auto_continue_journal_size": (int, 1, 1000),
+        "db_batch_insert_size": (int, 1, 500),
+        "db_write_behind_interval": ((int, float), 0, 60.0),
+        "db_write_behind_size": (int, 1, 100),
+        "dedupe": (bool, None, True),
+        "dedupe_bloom": (bool, None, False),
+        "dedupe_max_exact": (int, 1, 100000),
+        "export_chunk_size": (int, 1, 10000),
+        "multiprocess_chunk_size": (int, 1, 1),
+        "multiprocess_worker_pool": (bool, None, True),
+        "mysql_pool_idle_timeout": ((int, float), 0, 300.0),
+        "mysql_pool_size": (int, 0, 5),
+        "output_buffer_interval": ((int, float), 0, 10.0),
+        "output_buffer_size": (int, 1, 1000),
+        "output_max_open_files": (int, 1, 64),
+        "sqlite_batch_size": (int, 1, 100),
+    }
+
     def init_all(self):
         """
         Initiate all presets which are independent from others.
@@ -97,13 +121,17 @@ class Preset:  # pragma: no cover
         self.timeout()
         self.dns_lookup_over_tcp()
         self.dns_nameserver()
+        self.dns_cache()
+        self.whois()
 
         self.cooldown_time()
         self.multiprocess()
+        self.threaded()
 
         self.syntax_test()
         self.reputation_data()
 
+        self.engine_limits()
         self.db_types()
 
     @classmethod
@@ -295,6 +323,29 @@ class Preset:  # pragma: no cover
         if PyFunceble.CONFIGURATION.maximal_processes < 1:
             PyFunceble.CONFIGURATION.maximal_processes = 1
 
+    @classmethod
+    def engine_limits(cls):
+        """
+        Ensures that valid values are given to the settings of our databases,
+        deduplication, outputs and workers.
+        """
+
+        # pylint: disable=unsupported-membership-test,unsubscriptable-object,unsupported-assignment-operation
+
+        for index, (types, minimum, default) in cls.limits.items():
+            if (
+                index not in PyFunceble.CONFIGURATION
+                or not isinstance(PyFunceble.CONFIGURATION[index], types)
+                or (minimum is not None and PyFunceble.CONFIGURATION[index] < minimum)
+            ):
+                PyFunceble.CONFIGURATION[index] = default
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.dedupe_bloom_error_rate, float)
+            or not 0 < PyFunceble.CONFIGURATION.dedupe_bloom_error_rate < 1
+        ):
+            PyFunceble.CONFIGURATION.dedupe_bloom_error_rate = 0.001
+
     @classmethod
     def db_types(cls):
         """
@@ -317,7 +368,7 @@ class Preset:  # pragma: no cover
         ]:
             PyFunceble.CONFIGURATION.multiprocess_merging_mode = "end"
 
-        if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]:
             PyFunceble.CONFIGURATION.multiprocess_merging_mode = "end"
 
     def simple_domain(self):
@@ -389,7 +440,11 @@ class Preset:  # pragma: no cover
                 and not PyFunceble.CONFIGURATION.simple
                 and not PyFunceble.CONFIGURATION.quiet
             ):
-                if PyFunceble.CONFIGURATION.db_type not in ["mysql", "mariadb"]:
+                if PyFunceble.CONFIGURATION.db_type not in [
+                    "mysql",
+                    "mariadb",
+                    "sqlite",
+                ]:
                     print(
                         f"{Fore.RED + Style.BRIGHT}The "
                         f"{repr(PyFunceble.CONFIGURATION.db_type)} database type "
@@ -409,6 +464,25 @@ class Preset:  # pragma: no cover
             self.maximal_processes()
             self.multiprocess_merging_mode()
 
+    def threaded(self):
+        """
+        Prepares the global configuration for a test with the threaded engine.
+        """
+
+        if PyFunceble.CONFIGURATION.threaded:
+            if PyFunceble.CONFIGURATION.multiprocess:
+                # The multiprocessing mode takes the precedence.
+                PyFunceble.CONFIGURATION.threaded = False
+            elif (
+                not isinstance(PyFunceble.CONFIGURATION.maximal_threads, int)
+                or PyFunceble.CONFIGURATION.maximal_threads < 1
+            ):
+                PyFunceble.CONFIGURATION.maximal_threads = 1
+            elif PyFunceble.CONFIGURATION.maximal_threads > 50:
+                # Each thread waits for the (blocking) lookups of its own subject.
+                # Beyond that, we only add contention on the shared locks.
+                PyFunceble.CONFIGURATION.maximal_threads = 50
+
     @classmethod
     def timeout(cls):
         """
@@ -449,6 +523,65 @@ class Preset:  # pragma: no cover
 
         PyFunceble.DNSLOOKUP.update_nameserver(PyFunceble.CONFIGURATION.dns_server)
 
+    @classmethod
+    def dns_cache(cls):
+        """
+        Ensures that the DNS cache is proprely set.
+        """
+
+        if PyFunceble.CONFIGURATION.dns_cache is None:
+            PyFunceble.CONFIGURATION.dns_cache = True
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.dns_cache_size, int)
+            or PyFunceble.CONFIGURATION.dns_cache_size < 1
+        ):
+            PyFunceble.CONFIGURATION.dns_cache_size = 10000
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.dns_cache_negative_ttl, int)
+            or PyFunceble.CONFIGURATION.dns_cache_negative_ttl < 0
+        ):
+            PyFunceble.CONFIGURATION.dns_cache_negative_ttl = 300
+
+        PyFunceble.DNSLOOKUP.update_cache(
+            PyFunceble.CONFIGURATION.dns_cache_size
+            if PyFunceble.CONFIGURATION.dns_cache
+            else None,
+            negative_ttl=PyFunceble.CONFIGURATION.dns_cache_negative_ttl,
+        )
+
+    @classmethod
+    def whois(cls):
+        """
+        Ensures that the cache and the scheduler of the WHOIS
+        requests are proprely set.
+        """
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.whois_cache_ttl, int)
+            or PyFunceble.CONFIGURATION.whois_cache_ttl < 0
+        ):
+            PyFunceble.CONFIGURATION.whois_cache_ttl = 3600
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.whois_server_concurrency, int)
+            or PyFunceble.CONFIGURATION.whois_server_concurrency < 0
+        ):
+            PyFunceble.CONFIGURATION.whois_server_concurrency = 5
+
+        if (
+            not isinstance(PyFunceble.CONFIGURATION.whois_server_interval, (int, float))
+            or PyFunceble.CONFIGURATION.whois_server_interval < 0
+        ):
+            PyFunceble.CONFIGURATION.whois_server_interval = 0.0
+
+        PyFunceble.lookup.Whois.update_cache(PyFunceble.CONFIGURATION.whois_cache_ttl)
+        PyFunceble.lookup.Whois.update_scheduler(
+            concurrency=PyFunceble.CONFIGURATION.whois_server_concurrency,
+            interval=PyFunceble.CONFIGURATION.whois_server_interval,
+        )
+
     def reputation_data(self):
         """
         Ensures that the usage of reputation data is activated when needed.
@@ -63,3 +63,4 @@ from .cli import CLICore as CLI
 from .file import FileCore as File
 from .multiprocess import MultiprocessCore as Multiprocess
 from .simple import SimpleCore as Simple
+from .threaded_file import ThreadedFileCore as ThreadedFile
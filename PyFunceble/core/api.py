@@ -107,6 +107,9 @@ class APICore:
         # We share the db file name.
         self.db_file_name = db_file_name
 
+        # We share the process state.
+        self.is_parent = is_parent
+
         # We load the global configuration
         # if it was not alreay done.
         PyFunceble.load_config(
@@ -158,6 +161,19 @@ class APICore:
                 # We add it into the database.
                 self.inactive_db.add(subject, status)
 
+    def __consolidate_json_lines(self):
+        """
+        Consolidates the JSON Lines files we appended to into
+        their JSON file.
+
+        .. note::
+            When we are run from a child process, our parent does it
+            once all its children are done.
+        """
+
+        if self.is_parent and PyFunceble.CONFIGURATION.generate_json:
+            PyFunceble.output.Prints.consolidate_pending_json_lines()
+
     def reputation(self, subject_type):
         """
         Make a reputation check.
@@ -197,6 +213,7 @@ class APICore:
 
         self.__inactive_database_management(self.subject, data["status"])
         CLICore.save_into_database(data, self.db_file_name)
+        self.__consolidate_json_lines()
 
         if self.complete:
             # The user want a copy of the compelte data.
@@ -262,6 +279,7 @@ class APICore:
 
         self.__inactive_database_management(self.subject, data["status"])
         CLICore.save_into_database(data, self.db_file_name)
+        self.__consolidate_json_lines()
 
         if self.complete:
             # The user want a copy of the compelte data.
@@ -300,6 +318,7 @@ class APICore:
 
         self.__inactive_database_management(self.subject, data["status"])
         CLICore.save_into_database(data, self.db_file_name)
+        self.__consolidate_json_lines()
 
         if self.complete:
             # The user want a copy of the compelte data.
@@ -491,6 +510,7 @@ class APICore:
 
         self.__inactive_database_management(self.subject, data["status"])
         CLICore.save_into_database(data, self.db_file_name)
+        self.__consolidate_json_lines()
 
         if self.complete:
             # The user want a complete copy of the data.
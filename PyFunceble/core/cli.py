@@ -99,6 +99,10 @@ class CLICore:
 
         header_limit = 3
 
+        # We write what's pending and release our handles before
+        # reading our files.
+        PyFunceble.output.OutputSink.close_all()
+
         for root, _, files in walk(
             PyFunceble.OUTPUT_DIRECTORY + PyFunceble.OUTPUTS.parent_directory
         ):
@@ -128,6 +132,18 @@ class CLICore:
 
                     continue
 
+                if file.endswith(".jsonl"):
+                    # The currently read filename ends
+                    # with .jsonl.
+
+                    # We consolidate it into its JSON file.
+                    PyFunceble.output.Prints.consolidate_json_lines(
+                        "{0}{1}{2}".format(root, directory_separator, file[:-1])
+                    )
+
+                    # We continue the loop.
+                    continue
+
                 if f"{directory_separator}splited" in root:
                     header_limit += 1
 
@@ -166,64 +182,54 @@ class CLICore:
         Saves the current status inside the database.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-            table_name = PyFunceble.engine.MySQL.tables["tested"]
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            table_name = PyFunceble.engine.SQL.tables["tested"]
 
             if not filename:
                 filename = "simple"
 
-            to_insert = (
-                "INSERT INTO {0} "
-                "(tested, file_path, _status, status, _status_source, status_source, "
-                "domain_syntax_validation, expiration_date, http_status_code, "
-                "ipv4_range_syntax_validation, ipv4_syntax_validation, "
-                "ipv6_range_syntax_validation, ipv6_syntax_validation, "
-                "subdomain_syntax_validation, url_syntax_validation, whois_server, digest) "
-                "VALUES (%(tested)s, %(file_path)s, %(_status)s, %(status)s, %(_status_source)s, "
-                "%(status_source)s, %(domain_syntax_validation)s, "
-                "%(expiration_date)s, %(http_status_code)s, "
-                "%(ipv4_range_syntax_validation)s, %(ipv4_syntax_validation)s, "
-                "%(ipv6_range_syntax_validation)s, %(ipv6_syntax_validation)s, "
-                "%(subdomain_syntax_validation)s, "
-                "%(url_syntax_validation)s, %(whois_server)s, %(digest)s)"
-            ).format(table_name)
-
-            to_update = (
-                "UPDATE {0} SET _status = %(_status)s, status = %(status)s, "
-                "_status_source = %(_status_source)s, status_source = %(status_source)s, "
-                "domain_syntax_validation = %(domain_syntax_validation)s, "
-                "expiration_date = %(expiration_date)s, http_status_code = %(http_status_code)s, "
-                "ipv4_range_syntax_validation = %(ipv4_range_syntax_validation)s, "
-                "ipv4_syntax_validation = %(ipv4_syntax_validation)s, "
-                "ipv6_range_syntax_validation = %(ipv6_range_syntax_validation)s, "
-                "ipv6_syntax_validation = %(ipv6_syntax_validation)s, "
-                "subdomain_syntax_validation = %(subdomain_syntax_validation)s, "
-                "url_syntax_validation = %(url_syntax_validation)s, "
-                "whois_server = %(whois_server)s "
-                "WHERE digest = %(digest)s"
-            ).format(table_name)
-
-            with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
-                to_set = PyFunceble.helpers.Merge({"file_path": filename}).into(output)
-
-                to_set["digest"] = PyFunceble.helpers.Hash(algo="sha256").data(
-                    bytes(to_set["file_path"] + to_set["tested"], "utf-8")
-                )
+            # The columns to update when the subject is already known.
+            to_update = [
+                "_status",
+                "status",
+                "_status_source",
+                "status_source",
+                "domain_syntax_validation",
+                "expiration_date",
+                "http_status_code",
+                "ipv4_range_syntax_validation",
+                "ipv4_syntax_validation",
+                "ipv6_range_syntax_validation",
+                "ipv6_syntax_validation",
+                "subdomain_syntax_validation",
+                "url_syntax_validation",
+                "whois_server",
+            ]
+
+            to_set = {
+                x: y
+                for x, y in PyFunceble.helpers.Merge({"file_path": filename})
+                .into(output)
+                .items()
+                if x in to_update or x in ["tested", "file_path"]
+            }
+
+            to_set["digest"] = PyFunceble.helpers.Hash(algo="sha256").data(
+                bytes(to_set["file_path"] + to_set["tested"], "utf-8")
+            )
 
-                if (
-                    isinstance(to_set["http_status_code"], str)
-                    and not to_set["http_status_code"].isdigit()
-                ):
-                    to_set["http_status_code"] = None
+            if (
+                isinstance(to_set["http_status_code"], str)
+                and not to_set["http_status_code"].isdigit()
+            ):
+                to_set["http_status_code"] = None
 
-                try:
-                    cursor.execute(to_insert, to_set)
-                except PyFunceble.engine.MySQL.errors:
-                    cursor.execute(to_update, to_set)
+            # We let our writer save it with the next batch.
+            PyFunceble.engine.SQLWriter.add(table_name, to_set, update=to_update)
 
-                PyFunceble.LOGGER.debug(
-                    f"Saved into the {repr(table_name)} table:\n{to_set}"
-                )
+            PyFunceble.LOGGER.debug(
+                f"Queued for the {repr(table_name)} table:\n{to_set}"
+            )
 
     @classmethod
     def get_simple_coloration(cls, status):
@@ -58,8 +58,6 @@ License:
     SOFTWARE.
 """
 
-from tempfile import NamedTemporaryFile
-
 from domain2idna import get as domain2idna
 
 import PyFunceble
@@ -105,6 +103,14 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         self.autocontinue = PyFunceble.engine.AutoContinue(
             self.file, parent_process=True
         )
+        self.dedupe = PyFunceble.engine.Dedupe()
+
+        if PyFunceble.CONFIGURATION.export_file:
+            self.export = PyFunceble.output.ResultsExport(
+                PyFunceble.CONFIGURATION.export_file
+            )
+        else:
+            self.export = None
 
     @classmethod
     def download_link(cls, input_file):  # pragma: no cover
@@ -144,9 +150,10 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         """
 
         if self.complements_test_started:
-            PyFunceble.output.Generate(
-                subject, f"file_{self.file_type}", status
-            ).complements_file()
+            with PyFunceble.output.Generate.lock:
+                PyFunceble.output.Generate(
+                    subject, f"file_{self.file_type}", status
+                ).complements_file()
 
     @classmethod
     def get_complements(cls, auto_continue_db):
@@ -178,51 +185,65 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         :param bool include_entries_without_changes: Descriptive enough.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            PyFunceble.engine.SQLWriter.flush(PyFunceble.engine.SQL.tables["tested"])
 
             to_select = (
                 "SELECT tested as subject, status, status_source, expiration_date, "
                 "http_status_code, whois_server, file_path "
                 "FROM {0} WHERE status = %(official_status)s "
                 "AND file_path = %(file_path)s ORDER BY subject ASC"
-            ).format(PyFunceble.engine.MySQL.tables["tested"])
+            ).format(PyFunceble.engine.SQL.tables["tested"])
 
-            with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    to_select, {"official_status": status, "file_path": self.file}
-                )
+            # We collect the lines to write file by file.
+            collector = PyFunceble.output.OutputCollector()
+
+            with PyFunceble.engine.SQL() as connection:
+                with PyFunceble.engine.SQL.get_streaming_cursor(connection) as cursor:
+                    cursor.execute(
+                        to_select, {"official_status": status, "file_path": self.file}
+                    )
 
-                fetched = cursor.fetchall()
-
-                if fetched:
-                    for data in fetched:
-                        generate = PyFunceble.output.Generate(
-                            data["subject"],
-                            f"file_{self.file_type}",
-                            data["status"],
-                            source=data["status_source"],
-                            expiration_date=data["expiration_date"],
-                            http_status_code=data["http_status_code"],
-                            whois_server=data["whois_server"],
-                            filename=self.file,
-                            end=True,
+                    while True:
+                        fetched = cursor.fetchmany(
+                            PyFunceble.CONFIGURATION.output_buffer_size
                         )
 
-                        if include_entries_without_changes:
-                            generate.status_file(exclude_file_generation=False)
-                        else:
-                            generate.status_file(
-                                exclude_file_generation=self.inactive_db.authorized
-                                and data["status"] not in self.list_of_up_statuses
-                                and data["subject"] in self.inactive_db.to_retest
+                        if not fetched:
+                            break
+
+                        for data in fetched:
+                            generate = PyFunceble.output.Generate(
+                                data["subject"],
+                                f"file_{self.file_type}",
+                                data["status"],
+                                source=data["status_source"],
+                                expiration_date=data["expiration_date"],
+                                http_status_code=data["http_status_code"],
+                                whois_server=data["whois_server"],
+                                filename=self.file,
+                                end=True,
+                                collector=collector,
                             )
 
+                            if include_entries_without_changes:
+                                generate.status_file(exclude_file_generation=False)
+                            else:
+                                generate.status_file(
+                                    exclude_file_generation=self.inactive_db.authorized
+                                    and data["status"] not in self.list_of_up_statuses
+                                    and data["subject"] in self.inactive_db.to_retest
+                                )
+
+                        # We write the fetched rows, file by file.
+                        collector.print_collected()
+
     def generate_files(self, include_entries_without_changes=False):  # pragma: no cover
         """
         Generates all needed files.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             self.preset.reset_counters()
 
             if PyFunceble.CONFIGURATION.syntax:
@@ -338,7 +359,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             )
             return True
 
-        if auto_continue_db and subject in auto_continue_db.get_already_tested():
+        if auto_continue_db and auto_continue_db.is_already_tested(subject):
             PyFunceble.LOGGER.debug(
                 f"Ignored {subject} because it is into the list of already tested (autocontinue)."
             )
@@ -347,7 +368,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         if (
             not ignore_inactive_db_check
             and inactive_db
-            and subject in inactive_db.get_already_tested()
+            and inactive_db.is_already_tested(subject)
         ):
             PyFunceble.LOGGER.debug(
                 f"Ignored {subject} because it is into the list of already tested (inactive_db)."
@@ -415,15 +436,9 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
         if (
             auto_continue_db
             and complements_test_started
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
-            if "complements" in auto_continue_db.database:
-
-                while test_output["tested"] in auto_continue_db.database["complements"]:
-                    auto_continue_db.database["complements"].remove(
-                        test_output["tested"]
-                    )
-                    auto_continue_db.save()
+            auto_continue_db.remove_complement(test_output["tested"])
 
         if (
             whois_db
@@ -438,7 +453,7 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             )
 
         if (
-            PyFunceble.CONFIGURATION.db_type == "json"
+            PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
             and PyFunceble.CONFIGURATION.multiprocess
         ):
             generate = PyFunceble.output.Generate(
@@ -456,6 +471,54 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             generate.prints_status_file()
             generate.unified_file()
 
+        if self.export:
+            self.export.add(test_output, file_path=self.file)
+
+    def replay_duplicate(self, result):
+        """
+        Replays the given (already known) result of a duplicate
+        into our output files.
+        """
+
+        PyFunceble.LOGGER.info(f"Replaying the result of {result['tested']!r}.")
+
+        PyFunceble.output.Generate(
+            result["tested"],
+            f"file_{self.file_type}",
+            result["status"],
+            source=result["status_source"],
+            expiration_date=result["expiration_date"],
+            http_status_code=result["http_status_code"],
+            whois_server=result["whois_server"],
+            filename=self.file,
+            ip_validation=result["ipv4_syntax_validation"]
+            or result["ipv6_syntax_validation"],
+        ).status_file()
+
+    def skip_duplicate(self, subject):
+        """
+        Skips the test of the given duplicate.
+
+        .. note::
+            If we know the result of its first test, we replay it.
+            If its first test is still running, its result is replayed
+            once we get it.
+        """
+
+        PyFunceble.output.Percentage.count_duplicate()
+
+        result = self.dedupe.get(subject)
+
+        if result:
+            self.replay_duplicate(result)
+        elif not self.dedupe.wait(subject):
+            # We only know that we already saw it.
+
+            PyFunceble.LOGGER.info(f"Skipped {subject!r} (duplicate).")
+
+            if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
+                print(".", end="")
+
     def cleanup(self, auto_continue_db, auto_save, test_completed=False):
         """
         Runs the logic to run at the end of all test.
@@ -466,27 +529,37 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
             self.generate_files()
             self.sort_generated_files()
             auto_continue_db.clean()
+
+            if self.export:
+                self.export.close()
+
+            PyFunceble.database.WriteBehind.flush_all()
+            PyFunceble.engine.SQL.flush()
             auto_save.process(test_completed=test_completed)
         elif auto_save.is_time_exceed():
             auto_continue_db.update_counters()
             self.generate_files()
             self.sort_generated_files()
+
+            if self.export:
+                self.export.close()
+
+            PyFunceble.database.WriteBehind.flush_all()
+            PyFunceble.engine.SQL.flush()
             auto_save.process(test_completed=test_completed)
 
-    def __run_single_test(self, subject, ignore_inactive_db_check=False):
+    def __run_single_test(self, subject):
         """
-        Run a test for a single subject.
+        Run a test for a single (already filtered) subject.
         """
 
         self.print_header()
 
-        if not self.should_be_ignored(
-            subject,
-            auto_continue_db=self.autocontinue,
-            inactive_db=self.inactive_db,
-            ignore_inactive_db_check=ignore_inactive_db_check,
-        ):
+        if self.dedupe.is_duplicate(subject):
+            self.skip_duplicate(subject)
+        else:
             result = self.test(subject)
+            self.dedupe.remember(subject, result)
 
             self.post_test_treatment(
                 result,
@@ -497,13 +570,6 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
                 mining=self.mining,
                 whois_db=self.whois_db,
             )
-        elif self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-            # We are under a CI/CD environment.
-
-            PyFunceble.LOGGER.info(f"Skipped {subject!r}.")
-
-            # We print a dot.
-            print(".", end="")
 
         self.cleanup(self.autocontinue, self.autosave, test_completed=False)
 
@@ -523,118 +589,89 @@ class FileCore(CLICore):  # pylint: disable=too-many-instance-attributes
 
         return subjects
 
-    def __test_line(self, line, ignore_inactive_db_check=False):
+    def get_subjects_to_test(self, stream, ignore_inactive_db_check=False):
         """
-        Tests a given line.
+        Provides the subjects of the given stream which still have to be
+        tested.
+
+        The idea is to do a comparison between what we already tested
+        and what we still have to test, while we read the given stream.
+        Which means that the given subjects don't have to be checked again.
+
+        :param stream:
+            The stream to read. It may provide lines or tuples
+            :code:`(index, line)` (from the mining database).
+        :param bool ignore_inactive_db_check:
+            Tells us to not ignore the subjects which were recently
+            tested by the inactive database.
         """
 
-        subjects = self.get_subjects(line)
+        index = "funilrys"
 
-        if isinstance(subjects, list):
-            for subject in subjects:
-                self.__run_single_test(
-                    subject, ignore_inactive_db_check=ignore_inactive_db_check
-                )
-        else:
-            self.__run_single_test(
-                subjects, ignore_inactive_db_check=ignore_inactive_db_check
-            )
+        for line in stream:
+            if isinstance(line, tuple):
+                index, line = line
 
-    def construct_and_get_shadow_file(
-        self, file_stream, ignore_inactive_db_check=False
-    ):
-        """
-        Provides a path to a file which contain the list to file.
+            subjects = self.get_subjects(line)
 
-        The idea is to do a comparison between what we already tested
-        and what we still have to test.
-        """
+            if not isinstance(subjects, list):
+                subjects = [subjects]
 
-        with NamedTemporaryFile(delete=False) as temp_file:
-            if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                print("")
-
-            for line in file_stream:
-                subjects = self.get_subjects(line)
-
-                if isinstance(subjects, list):
-                    comparison = [
-                        self.should_be_ignored(
-                            x,
-                            auto_continue_db=self.autocontinue,
-                            inactive_db=self.inactive_db,
-                            ignore_inactive_db_check=ignore_inactive_db_check,
-                        )
-                        for x in subjects
-                    ]
-                else:
-                    comparison = [
-                        self.should_be_ignored(
-                            subjects,
-                            auto_continue_db=self.autocontinue,
-                            inactive_db=self.inactive_db,
-                            ignore_inactive_db_check=ignore_inactive_db_check,
-                        )
-                    ]
+            for subject in subjects:
+                if index != "funilrys":
+                    # An index was given, we remove the index and subject from
+                    # the mining database.
+                    self.mining.remove(index, subject)
 
-                if all(comparison):
-                    if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                        print("I", end="")
+                if subject and PyFunceble.CONFIGURATION.idna_conversion:
+                    subject = domain2idna(subject)
 
-                    continue
+                if self.should_be_ignored(
+                    subject,
+                    auto_continue_db=self.autocontinue,
+                    inactive_db=self.inactive_db,
+                    ignore_inactive_db_check=ignore_inactive_db_check,
+                ):
+                    if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
+                        # We are under a CI/CD environment.
 
-                if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                    print("S", end="")
+                        PyFunceble.LOGGER.info(f"Skipped {subject!r}.")
 
-                temp_file.write(line.encode("utf-8"))
+                        print("I", end="")
 
-            if self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-                print("")
+                    continue
 
-            return temp_file.name
+                yield subject
 
     def run_test(self):
         """
         Run the test of the content of the given file.
         """
 
-        with open(self.file, "r", encoding="utf-8") as file_stream, open(
-            self.construct_and_get_shadow_file(file_stream), "r"
-        ) as shadow_file:
-            for subject in shadow_file:
-                self.__test_line(subject)
-
-            shadow_file_name = shadow_file.name
-
-        PyFunceble.helpers.File(shadow_file_name).delete()
+        with open(self.file, "r", encoding="utf-8") as file_stream:
+            for subject in self.get_subjects_to_test(file_stream):
+                self.__run_single_test(subject)
 
         if self.autocontinue.is_empty():
-            with open(self.file, "r", encoding="utf-8") as file_stream, open(
-                self.construct_and_get_shadow_file(
+            with open(self.file, "r", encoding="utf-8") as file_stream:
+                for subject in self.get_subjects_to_test(
                     file_stream, ignore_inactive_db_check=True
-                ),
-                "r",
-                encoding="utf-8",
-            ) as shadow_file:
-                for subject in shadow_file:
-                    self.__test_line(subject, ignore_inactive_db_check=True)
-
-                shadow_file_name = shadow_file.name
-
-        PyFunceble.helpers.File(shadow_file_name).delete()
+                ):
+                    self.__run_single_test(subject)
 
-        for subject in self.inactive_db.get_to_retest():
-            self.__test_line(subject)
+        for subject in self.get_subjects_to_test(self.inactive_db.get_to_retest()):
+            self.__run_single_test(subject)
 
         self.complements_test_started = True
 
-        for subject in self.get_complements(self.autocontinue):
-            self.__test_line(subject)
+        for subject in self.get_subjects_to_test(
+            self.get_complements(self.autocontinue)
+        ):
+            self.__run_single_test(subject)
 
         self.complements_test_started = False
 
-        for index, subject in self.mining.list_of_mined():
-            self.__test_line(subject)
-            self.mining.remove(index, subject)
+        for subject in self.get_subjects_to_test(self.mining.list_of_mined()):
+            self.__run_single_test(subject)
 
         self.cleanup(self.autocontinue, self.autosave, test_completed=True)
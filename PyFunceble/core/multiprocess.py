@@ -59,13 +59,13 @@ License:
 """
 
 import sys
-from itertools import chain
-from multiprocessing import Manager, Pipe, Process, active_children
+from multiprocessing import Manager, Pipe, Process, Queue
+from multiprocessing.connection import wait
+from queue import Empty
 from traceback import format_exc
 
 from colorama import Fore, Style
 from colorama import init as initiate_colorama
-from domain2idna import get as domain2idna
 
 import PyFunceble
 
@@ -148,6 +148,61 @@ class MultiprocessCore(
     def __init__(self, file, file_content_type="domain"):
         super().__init__(file, file_content_type=file_content_type)
 
+        # The number of subjects which are currently under test.
+        # (started processes or sent to the pool)
+        self.in_flight = 0
+
+    @classmethod
+    def prepare_worker(cls, loader, intern, custom):
+        """
+        Prepares the current (child) process for testing.
+
+        :param loader: The configuration loader of the parent process.
+        :param dict intern: A copy of the parent :code:`PyFunceble.INTERN`.
+        :param dict custom: The custom configuration to apply.
+        """
+
+        PyFunceble.LOADER = loader
+
+        if not PyFunceble.LOADER.was_configuration_loaded():
+            PyFunceble.LOADER.get_config()
+
+        PyFunceble.LOADER.set_custom_config(custom)
+        PyFunceble.LOADER.inject_all()
+
+        initiate_colorama(True)
+
+        PyFunceble.INTERN.update(intern)
+
+    def test_subject(self, subject, file_content_type):
+        """
+        Tests the given (already filtered) subject and return the result.
+
+        .. note::
+            This method is meant to be run from a child process.
+        """
+
+        if isinstance(PyFunceble.CONFIGURATION.cooldown_time, (float, int)):
+            PyFunceble.sleep(PyFunceble.CONFIGURATION.cooldown_time)
+
+        if PyFunceble.CONFIGURATION.syntax:
+            result = APICore(
+                subject, complete=True, is_parent=False, db_file_name=self.file
+            ).syntax(file_content_type)
+        elif PyFunceble.CONFIGURATION.reputation:
+            result = APICore(
+                subject, complete=True, is_parent=False, db_file_name=self.file
+            ).reputation(file_content_type)
+        else:
+            result = APICore(
+                subject, complete=True, is_parent=False, db_file_name=self.file
+            ).availability(file_content_type)
+
+        self.generate_complement_status_file(result["tested"], result["status"])
+        self.save_into_database(result, self.file)
+
+        return result
+
     # pylint: disable=arguments-differ
     def test(
         self,
@@ -156,68 +211,78 @@ class MultiprocessCore(
         loader,
         manager_data,
         intern,
-        ignore_inactive_db_check=False,
         custom=None,
     ):
         """
-        Tests the given subject and return the result.
+        Tests the given (already filtered) subject and return the result.
         """
 
-        PyFunceble.LOADER = loader
+        self.prepare_worker(loader, intern, custom)
 
-        if not PyFunceble.LOADER.was_configuration_loaded():
-            PyFunceble.LOADER.get_config()
+        result = self.test_subject(subject, file_content_type)
 
-        PyFunceble.LOADER.set_custom_config(custom)
-        PyFunceble.LOADER.inject_all()
+        if manager_data is not None:
+            manager_data.append(result)
+        else:
+            self.post_test_treatment(
+                result,
+                self.file_type,
+                complements_test_started=self.complements_test_started,
+                auto_continue_db=self.autocontinue,
+                inactive_db=self.inactive_db,
+                mining=self.mining,
+                whois_db=self.whois_db,
+            )
 
-        initiate_colorama(True)
+        # Our process does not run the exit handlers, so we write
+        # what's pending now.
+        PyFunceble.engine.SQL.flush()
+        PyFunceble.output.OutputSink.flush()
+        PyFunceble.output.LogsSharer.flush()
 
-        PyFunceble.INTERN.update(intern)
+    def pool_worker(self, task_queue, result_queue, loader, intern, custom):
+        """
+        Runs a long-lived worker of the pool.
 
-        if PyFunceble.CONFIGURATION.idna_conversion:
-            subject = domain2idna(subject)
+        The configuration is injected once, then we test every chunk of
+        subjects we get from the task queue until we get :code:`None`.
 
-        if not self.should_be_ignored(
-            subject,
-            self.autocontinue,
-            self.inactive_db,
-            ignore_inactive_db_check=ignore_inactive_db_check,
-        ):
-            if isinstance(PyFunceble.CONFIGURATION.cooldown_time, (float, int)):
-                PyFunceble.sleep(PyFunceble.CONFIGURATION.cooldown_time)
-
-            if PyFunceble.CONFIGURATION.syntax:
-                result = APICore(
-                    subject, complete=True, is_parent=False, db_file_name=self.file
-                ).syntax(file_content_type)
-            elif PyFunceble.CONFIGURATION.reputation:
-                result = APICore(
-                    subject, complete=True, is_parent=False, db_file_name=self.file
-                ).reputation(file_content_type)
-            else:
-                result = APICore(
-                    subject, complete=True, is_parent=False, db_file_name=self.file
-                ).availability(file_content_type)
+        :param task_queue:
+            The queue to read the chunks to test from.
+        :param result_queue:
+            The queue to write the results (or exceptions) into.
+        """
 
-            self.generate_complement_status_file(result["tested"], result["status"])
-            self.save_into_database(result, self.file)
+        try:
+            self.prepare_worker(loader, intern, custom)
+        except Exception:  # pylint: disable=broad-except
+            PyFunceble.LOGGER.exception()
+            result_queue.put(("exception", format_exc()))
 
-            if manager_data is not None:
-                manager_data.append(result)
-            else:
-                self.post_test_treatment(
-                    result,
-                    self.file_type,
-                    complements_test_started=self.complements_test_started,
-                    auto_continue_db=self.autocontinue,
-                    inactive_db=self.inactive_db,
-                    mining=self.mining,
-                    whois_db=self.whois_db,
-                )
-        elif self.autosave.authorized or PyFunceble.CONFIGURATION.print_dots:
-            PyFunceble.LOGGER.info(f"Skipped {subject!r}.")
-            print(".", end="")
+            return
+
+        while True:
+            task = task_queue.get()
+
+            if task is None:
+                # We were asked to stop.
+                break
+
+            self.complements_test_started, subjects = task
+
+            try:
+                results = [self.test_subject(x, self.file_type) for x in subjects]
+
+                # Our process does not run the exit handlers, so we write
+                # what's pending before giving our results.
+                PyFunceble.engine.SQL.flush()
+                PyFunceble.output.OutputSink.flush()
+                PyFunceble.output.LogsSharer.flush()
+
+                result_queue.put(("results", results))
+            except Exception:  # pylint: disable=broad-except
+                PyFunceble.LOGGER.exception()
+                result_queue.put(("exception", format_exc()))
 
     def __merge_processes_data(self, manager_data):
         """
@@ -249,55 +314,103 @@ class MultiprocessCore(
                     whois_db=self.whois_db,
                 )
 
+                for _ in range(
+                    self.dedupe.remember(test_output["tested"], test_output)
+                ):
+                    # We replay the result for the duplicates which were
+                    # waiting for it.
+                    self.replay_duplicate(test_output)
+
             manager_data[:] = []
 
         self.autocontinue.save()
-        self.inactive_db.save()
-        self.mining.save()
+        self.inactive_db.mark_dirty()
+        self.mining.mark_dirty()
+
+        # We release the database for our workers.
+        PyFunceble.engine.SQLite.commit()
 
         self.cleanup(self.autocontinue, self.autosave, test_completed=False)
 
-    def __check_exception(self, processes, manager_data):
+    def __check_exception(self, finished, running, manager_data):
         """
-        Checks if an exception is present into the given pool of processes.
+        Checks if an exception is present into the given finished processes.
 
-        :param list processes. A list of running processes.
+        :param list finished: A list of finished processes.
+        :param list running: A list of running processes.
         """
 
-        exception_present = False
+        for process in finished:
+            # We loop through the list of finished processes.
 
-        for process in processes:
-            # We loop through the list of processes.
+            if process.exception:
+                # There in an exception in the currently
+                # read process.
 
-            try:
-                if process.exception and not exception_present:
-                    # There in an exception in the currently
-                    # read process.
+                # We get the traceback
+                _, traceback = process.exception
 
-                    # We get the traceback
-                    _, traceback = process.exception
+                # We print the traceback.
+                print(traceback)
+                PyFunceble.LOGGER.error(traceback)
 
-                    # We print the traceback.
-                    print(traceback)
-                    PyFunceble.LOGGER.error(traceback)
+                for running_process in running:
+                    # We kill the other processes.
+                    running_process.terminate()
 
-                    exception_present = True
+                # We finally exit.
+                self.__merge_processes_data(manager_data)
 
-                if exception_present:
-                    # We kill the process.
-                    process.terminate()
-            except AttributeError:
-                continue
+                sys.exit(1)
 
-        if exception_present:
-            # We finally exit.
-            self.__merge_processes_data(manager_data)
+    def __wait_for_processes(self, processes, manager_data, maximal_running=0):
+        """
+        Blocks until the number of running processes is lower or equal
+        to the given one.
+
+        .. note::
+            We do not poll. We sleep until the operating system tell
+            us (through the process sentinels) that a process finished.
+
+        :param list processes:
+            The list of running processes. It is updated in place.
+        :param int maximal_running:
+            The number of processes which are allowed to still run when
+            we return.
+        """
 
-            sys.exit(1)
+        while len(processes) > maximal_running:
+            sentinels = wait([x.sentinel for x in processes])
+            finished = [x for x in processes if x.sentinel in sentinels]
+
+            for process in finished:
+                process.join()
+                processes.remove(process)
 
-    def __start_process(self, subject, manager_data, ignore_inactive_db_check=False):
+            self.in_flight = len(processes)
+
+            self.__check_exception(finished, processes, manager_data)
+
+    @classmethod
+    def get_worker_custom_config(cls):
+        """
+        Provides the custom configuration to apply into our child processes.
+        """
+
+        return {
+            "api_file_generation": PyFunceble.CONFIGURATION.db_type
+            in ["json", "json_journal"],
+            "inactive_database": False,
+            "auto_continue": False,
+            "quiet": PyFunceble.CONFIGURATION.quiet,
+        }
+
+    def __start_process(self, subject, manager_data):
         """
         Starts a new process.
+
+        :return: The started process.
+        :rtype: OurProcessWrapper
         """
 
         original_config = PyFunceble.CONFIGURATION.copy()
@@ -311,16 +424,15 @@ class MultiprocessCore(
                 PyFunceble.LOADER,
                 manager_data,
                 original_intern,
-                ignore_inactive_db_check,
-                {
-                    "api_file_generation": PyFunceble.CONFIGURATION.db_type == "json",
-                    "inactive_database": False,
-                    "auto_continue": False,
-                    "quiet": PyFunceble.CONFIGURATION.quiet,
-                },
+                self.get_worker_custom_config(),
             ),
         )
         process.name = f"PyF {subject}"
+
+        # We do not keep our (SQLite) transaction open. Otherwise, our
+        # child would be locked out of the database.
+        PyFunceble.engine.SQLite.commit()
+
         process.start()
 
         PyFunceble.LOADER.config.update(original_config)
@@ -328,8 +440,9 @@ class MultiprocessCore(
 
         PyFunceble.INTERN.update(original_intern)
 
-    # pylint: disable=too-many-nested-blocks,too-many-branches
-    def __run_multiprocess_test(self, stream, manager, ignore_inactive_db_check=False):
+        return process
+
+    def __run_multiprocess_test(self, stream, manager):
         """
         Tests the content of the given file.
         """
@@ -337,125 +450,271 @@ class MultiprocessCore(
         self.print_header()
 
         finished = False
-        index = "funilrys"
+        processes = []
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
             manager_data = manager.list()
         else:
             manager_data = None
 
         while True:
-            active = active_children()
-
             while (
-                len(active) <= PyFunceble.CONFIGURATION.maximal_processes
+                len(processes) < PyFunceble.CONFIGURATION.maximal_processes
                 and not self.autosave.is_time_exceed()
             ):
                 try:
-                    line = next(stream)
-
-                    if isinstance(line, tuple):
-                        index, line = line
-
-                    subjects = self.get_subjects(line)
-
-                    if isinstance(subjects, list):
-                        for subject in subjects:
-                            self.__start_process(
-                                subject,
-                                manager_data,
-                                ignore_inactive_db_check=ignore_inactive_db_check,
-                            )
-
-                            if index != "funilrys":
-                                # An index was given, we remove the index and subject from
-                                # the mining database.
-                                self.mining.remove(index, subject)
-                    else:
-                        self.__start_process(
-                            subjects,
-                            manager_data,
-                            ignore_inactive_db_check=ignore_inactive_db_check,
-                        )
-
-                        if index != "funilrys":
-                            # An index was given, we remove the index and subject from
-                            # the mining database.
-                            self.mining.remove(index, subjects)
-
-                    active = active_children()
-                    continue
+                    subject = next(stream)
                 except StopIteration:
                     finished = True
-                    active = active_children()
-
                     break
 
-            self.__check_exception(active_children(), manager_data)
+                if manager_data is not None and self.dedupe.is_duplicate(subject):
+                    # We get the results back, so we can deduplicate.
+                    self.skip_duplicate(subject)
+                    continue
+
+                processes.append(self.__start_process(subject, manager_data))
+                self.in_flight = len(processes)
 
-            while len(
-                active
-            ) >= PyFunceble.CONFIGURATION.maximal_processes and "PyF" in " ".join(
-                [x.name for x in reversed(active)]
+            if (
+                PyFunceble.CONFIGURATION.multiprocess_merging_mode == "live"
+                and not finished
+                and not self.autosave.is_time_exceed()
             ):
-                active = active_children()
+                # We wait for all processes to finish and merge their data.
+                self.__wait_for_processes(processes, manager_data)
+                self.__merge_processes_data(manager_data)
 
-                # PyFunceble.LOGGER.info(
-                #     f"Active processes: {[x.name for x in reversed(active)]}"
-                # )
+                continue
 
-            if PyFunceble.CONFIGURATION.multiprocess_merging_mode == "live":
-                if not finished and not self.autosave.is_time_exceed():
-                    while "PyF" in " ".join([x.name for x in reversed(active)]):
-                        active = active_children()
+            if finished or self.autosave.is_time_exceed():
+                # We wait for all processes to finish and merge their data.
+                self.__wait_for_processes(processes, manager_data)
+                self.__merge_processes_data(manager_data)
 
-                    self.__merge_processes_data(manager_data)
-                    continue
+                break
 
-            if finished or self.autosave.is_time_exceed():
-                while "PyF" in " ".join([x.name for x in reversed(active)]):
-                    active = active_children()
+            # We wait for (at least) a free slot.
+            self.__wait_for_processes(
+                processes,
+                manager_data,
+                maximal_running=PyFunceble.CONFIGURATION.maximal_processes - 1,
+            )
 
-                self.__merge_processes_data(manager_data)
+    def __start_pool(self):
+        """
+        Starts the long-lived workers of the pool.
+
+        :return: The task queue, the result queue and the list of workers.
+        :rtype: tuple
+        """
+
+        task_queue = Queue()
+        result_queue = Queue()
+        workers = []
+
+        # We do not keep our (SQLite) transaction open. Otherwise, our
+        # workers would be locked out of the database.
+        PyFunceble.engine.SQLite.commit()
+
+        for index in range(PyFunceble.CONFIGURATION.maximal_processes):
+            worker = Process(
+                target=self.pool_worker,
+                args=(
+                    task_queue,
+                    result_queue,
+                    PyFunceble.LOADER,
+                    PyFunceble.INTERN.copy(),
+                    self.get_worker_custom_config(),
+                ),
+                name=f"PyF worker {index}",
+            )
+            worker.start()
+
+            workers.append(worker)
+
+        PyFunceble.LOGGER.info(f"Started {len(workers)} pool workers.")
+
+        return task_queue, result_queue, workers
+
+    @classmethod
+    def __stop_pool(cls, pool, terminate=False):
+        """
+        Stops the workers of the given pool.
+
+        .. note::
+            Nothing is done if the pool was already stopped.
+
+        :param tuple pool: The output of :code:`__start_pool`.
+        :param bool terminate: Kill the workers instead of waiting for them.
+        """
+
+        task_queue, _, workers = pool
+
+        if not workers:
+            # The pool was already stopped.
+            return
+
+        for worker in workers:
+            if terminate:
+                worker.terminate()
+            else:
+                task_queue.put(None)
+
+        for worker in workers:
+            worker.join()
+
+        PyFunceble.LOGGER.info(f"Stopped {len(workers)} pool workers.")
+
+        # We mark the pool as stopped.
+        workers.clear()
+
+    def __get_pool_subjects(self, stream):
+        """
+        Reads the given stream (of already filtered subjects) and provides
+        the subjects to send to the pool.
+        """
+
+        for subject in stream:
+            if self.dedupe.is_duplicate(subject):
+                self.skip_duplicate(subject)
+                continue
+
+            yield subject
+
+    def __collect_pool_results(self, pool, pending_results):
+        """
+        Waits for the next message of the pool and handles it.
+
+        :param tuple pool: The output of :code:`__start_pool`.
+        :param list pending_results:
+            The list of results which are still waiting to be merged.
+        """
+
+        _, result_queue, workers = pool
+
+        while True:
+            try:
+                message_type, data = result_queue.get(timeout=1)
                 break
+            except Empty:
+                if not all(x.is_alive() for x in workers):
+                    message_type = "exception"
+                    data = "A worker of the pool died unexpectedly."
+                    break
+
+        if message_type == "exception":
+            print(data)
+            PyFunceble.LOGGER.error(data)
+
+            self.__stop_pool(pool, terminate=True)
+            self.__merge_processes_data(pending_results)
+
+            sys.exit(1)
+
+        self.in_flight -= len(data)
+        pending_results.extend(data)
+
+        if (
+            PyFunceble.CONFIGURATION.multiprocess_merging_mode == "live"
+            or PyFunceble.CONFIGURATION.db_type not in ["json", "json_journal"]
+        ):
+            self.__merge_processes_data(pending_results)
+
+    def __run_pool_test(self, stream, pool):
+        """
+        Tests the content of the given stream through the given pool.
+        """
+
+        self.print_header()
+
+        task_queue, _, workers = pool
+        chunk_size = PyFunceble.CONFIGURATION.multiprocess_chunk_size
+        # We keep at most 2 chunks per worker in the queue. That way, our
+        # workers never starve and we don't read the whole stream in memory.
+        maximal_in_flight = chunk_size * len(workers) * 2
+
+        pending_results = []
+        chunk = []
+
+        for subject in self.__get_pool_subjects(stream):
+            chunk.append(subject)
+
+            if len(chunk) < chunk_size:
+                continue
+
+            while self.in_flight >= maximal_in_flight:
+                self.__collect_pool_results(pool, pending_results)
+
+            task_queue.put((self.complements_test_started, chunk))
+            self.in_flight += len(chunk)
+            chunk = []
+
+            if self.autosave.is_time_exceed():
+                break
+
+        if chunk:
+            task_queue.put((self.complements_test_started, chunk))
+            self.in_flight += len(chunk)
+
+        while self.in_flight > 0:
+            self.__collect_pool_results(pool, pending_results)
+
+        self.__merge_processes_data(pending_results)
+
+    def __run_test_stream(self, stream, pool, ignore_inactive_db_check=False):
+        """
+        Tests the given stream with the configured multiprocessing engine.
+        """
+
+        subjects = self.get_subjects_to_test(
+            stream, ignore_inactive_db_check=ignore_inactive_db_check
+        )
+
+        if pool:
+            self.__run_pool_test(subjects, pool)
+        else:
+            with Manager() as manager:
+                self.__run_multiprocess_test(subjects, manager)
 
     def run_test(self):
         """
         Runs the test of the content of the given file.
         """
 
-        with open(self.file, "r", encoding="utf-8") as file_stream, open(
-            self.construct_and_get_shadow_file(file_stream), "r", encoding="utf-8"
-        ) as shadow_file:
-            with Manager() as manager:
-                self.__run_multiprocess_test(shadow_file, manager)
+        if PyFunceble.CONFIGURATION.multiprocess_worker_pool:
+            pool = self.__start_pool()
+        else:
+            pool = None
 
-        if self.autocontinue.is_empty():
-            with open(self.file, "r", encoding="utf-8") as file_stream, open(
-                self.construct_and_get_shadow_file(
-                    file_stream, ignore_inactive_db_check=True
-                ),
-                "r",
-                encoding="utf-8",
-            ) as shadow_file:
-                with Manager() as manager:
-                    self.__run_multiprocess_test(
-                        file_stream, manager, ignore_inactive_db_check=True
+        try:
+            with open(self.file, "r", encoding="utf-8") as file_stream:
+                self.__run_test_stream(file_stream, pool)
+
+            if self.autocontinue.is_empty():
+                with open(self.file, "r", encoding="utf-8") as file_stream:
+                    self.__run_test_stream(
+                        file_stream, pool, ignore_inactive_db_check=True
                     )
 
-        with Manager() as manager:
-            self.__run_multiprocess_test(
-                chain(self.inactive_db.get_to_retest()), manager
-            )
+            self.__run_test_stream(self.inactive_db.get_to_retest(), pool)
 
-        with Manager() as manager:
             self.complements_test_started = True
-            self.__run_multiprocess_test(
-                self.get_complements(self.autocontinue), manager
-            )
+            self.__run_test_stream(self.get_complements(self.autocontinue), pool)
             self.complements_test_started = False
 
-        with Manager() as manager:
-            self.__run_multiprocess_test(chain(self.mining.list_of_mined()), manager)
+            self.__run_test_stream(self.mining.list_of_mined(), pool)
+        finally:
+            if pool:
+                self.__stop_pool(pool)
+
+        if (
+            self.export
+            and not pool
+            and PyFunceble.CONFIGURATION.db_type not in ["json", "json_journal"]
+        ):
+            # Our processes handled (and stored) their results themselves.
+            # We export them from the database.
+            self.export.export_database(file_path=self.file)
 
         self.cleanup(self.autocontinue, self.autosave, test_completed=True)
@@ -0,0 +1,196 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the threaded core interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import PyFunceble
+
+from .file import FileCore
+
+
+class ThreadedFileCore(FileCore):
+    """
+    Brain of PyFunceble for file testing with multiple threads.
+
+    Every subject is tested from a single process. The test of each subject
+    is run into a bounded pool of threads while the main thread reads the
+    file, submits the tests and run the post test treatment of each result
+    in the order we read the subjects. Which means that our databases
+    are still only updated from the main thread.
+
+    .. note::
+        This is not an asynchronous (non-blocking) engine. The lookups
+        (DNS, WHOIS, HTTP) are blocking. Which means that each thread
+        waits for the lookups of its own subject.
+
+    :param str file: The file we are testing.
+    :param str file_type:
+        The file type.
+        Should be one of the following.
+
+            - :code:`domain`
+
+            - :code:`url`
+    """
+
+    def __init__(self, file, file_content_type="domain"):
+        super().__init__(file, file_content_type=file_content_type)
+
+        # The submitted tests (and their subject) in the order we read them.
+        self.pending = deque()
+
+    def __get_subjects_to_test(self, stream, ignore_inactive_db_check=False):
+        """
+        Reads the given stream and provides the subjects to test.
+        """
+
+        for subject in self.get_subjects_to_test(
+            stream, ignore_inactive_db_check=ignore_inactive_db_check
+        ):
+            if self.dedupe.is_duplicate(subject):
+                self.skip_duplicate(subject)
+                continue
+
+            yield subject
+
+    def __treat_oldest_result(self):
+        """
+        Waits for the result of the oldest submitted test and
+        run its post test treatment.
+        """
+
+        subject, future = self.pending.popleft()
+        result = future.result()
+
+        self.post_test_treatment(
+            result,
+            self.file_type,
+            complements_test_started=self.complements_test_started,
+            auto_continue_db=self.autocontinue,
+            inactive_db=self.inactive_db,
+            mining=self.mining,
+            whois_db=self.whois_db,
+        )
+
+        for _ in range(self.dedupe.remember(subject, result)):
+            # We replay the result for the duplicates which were waiting for it.
+            self.replay_duplicate(result)
+
+    def __run_threaded_test(self, stream, executor, ignore_inactive_db_check=False):
+        """
+        Tests the content of the given stream.
+        """
+
+        self.print_header()
+
+        # We let the pool work on the next subjects while we wait
+        # for the result of the oldest one.
+        maximal_pending = 2 * PyFunceble.CONFIGURATION.maximal_threads
+
+        try:
+            for subject in self.__get_subjects_to_test(
+                stream, ignore_inactive_db_check=ignore_inactive_db_check
+            ):
+                self.pending.append((subject, executor.submit(self.test, subject)))
+
+                if len(self.pending) >= maximal_pending:
+                    self.__treat_oldest_result()
+
+                if self.autosave.is_time_exceed():
+                    break
+
+            while self.pending:
+                self.__treat_oldest_result()
+        except BaseException:
+            for _, future in self.pending:
+                future.cancel()
+
+            self.pending.clear()
+            raise
+
+        self.cleanup(self.autocontinue, self.autosave, test_completed=False)
+
+    def run_test(self):
+        """
+        Runs the test of the content of the given file.
+        """
+
+        with ThreadPoolExecutor(
+            max_workers=PyFunceble.CONFIGURATION.maximal_threads
+        ) as executor:
+            with open(self.file, "r", encoding="utf-8") as file_stream:
+                self.__run_threaded_test(file_stream, executor)
+
+            if self.autocontinue.is_empty():
+                with open(self.file, "r", encoding="utf-8") as file_stream:
+                    self.__run_threaded_test(
+                        file_stream, executor, ignore_inactive_db_check=True
+                    )
+
+            self.__run_threaded_test(self.inactive_db.get_to_retest(), executor)
+
+            self.complements_test_started = True
+            self.__run_threaded_test(self.get_complements(self.autocontinue), executor)
+            self.complements_test_started = False
+
+            self.__run_threaded_test(self.mining.list_of_mined(), executor)
+
+        self.cleanup(self.autocontinue, self.autosave, test_completed=True)
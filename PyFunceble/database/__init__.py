@@ -60,3 +60,4 @@ License:
 
 from .inactive import InactiveDB as Inactive
 from .whois import WhoisDB as Whois
+from .write_behind import WriteBehind
@@ -58,11 +58,108 @@ License:
     SOFTWARE.
 """
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from sys import intern
 
 import PyFunceble
 
 
+class InactiveRecord(Mapping):
+    """
+    Provides a compact representation of a subject of the inactive database.
+
+    It can be read like the :code:`dict` we write into the database file.
+    But, we only save the status (interned) and the epochs. The ISO
+    representations are derived from the epochs when they are asked.
+
+    :param str status: The status of the subject.
+    :param float included_at_epoch: The time of the inclusion of the subject.
+    :param float last_retested_at_epoch: The time of the last test of the subject.
+    """
+
+    __slots__ = ("status", "included_at_epoch", "last_retested_at_epoch")
+
+    # The indexes we provide. They are the ones of our database file.
+    indexes = (
+        "included_at_epoch",
+        "included_at_iso",
+        "last_retested_at_epoch",
+        "last_retested_at_iso",
+        "status",
+    )
+
+    def __init__(self, status, included_at_epoch, last_retested_at_epoch):
+        self.status = intern(status) if isinstance(status, str) else status
+        self.included_at_epoch = included_at_epoch
+        self.last_retested_at_epoch = last_retested_at_epoch
+
+    def __getitem__(self, index):
+        if index in self.__slots__:
+            return getattr(self, index)
+
+        if index == "included_at_iso":
+            return self.to_iso(self.included_at_epoch)
+
+        if index == "last_retested_at_iso":
+            return self.to_iso(self.last_retested_at_epoch)
+
+        raise KeyError(index)
+
+    def __iter__(self):
+        return iter(self.indexes)
+
+    def __len__(self):
+        return len(self.indexes)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @classmethod
+    def to_iso(cls, epoch):
+        """
+        Converts the given epoch to its ISO representation.
+
+        :rtype: str|None
+        """
+
+        if epoch is None:
+            return None
+
+        return datetime.fromtimestamp(epoch).isoformat()
+
+    @classmethod
+    def compact(cls, data):
+        """
+        Provides the compact representation of the given data.
+
+        .. note::
+            The data are given back untouched if they are not
+            a record of our database file.
+
+        :param dict data: A record of the database file.
+
+        :rtype: InactiveRecord|dict
+        """
+
+        if (
+            isinstance(data, dict)
+            and "status" in data
+            and set(data).issubset(cls.indexes)
+            and all(
+                isinstance(data.get(x), (int, float, type(None)))
+                for x in ["included_at_epoch", "last_retested_at_epoch"]
+            )
+        ):
+            return cls(
+                data["status"],
+                data.get("included_at_epoch"),
+                data.get("last_retested_at_epoch"),
+            )
+
+        return data
+
+
 class InactiveDB:  # pylint: disable=too-many-instance-attributes
     """
     Provides the inactive database logic and interface.
@@ -74,6 +171,9 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
     database = {}
     authorized = False
     filename = None
+    # The set of already tested subjects. It is read once and
+    # kept up to date while we add or remove subjects.
+    already_tested = None
 
     def __init__(self, filename, parent_process=False):
         self.one_day = timedelta(days=1)
@@ -90,12 +190,16 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 days=PyFunceble.CONFIGURATION.days_between_inactive_db_clean
             )
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 self.database_file = "{0}{1}".format(
                     PyFunceble.CONFIG_DIRECTORY,
                     PyFunceble.OUTPUTS.default_files.inactive_db,
                 )
 
+                self.write_behind = PyFunceble.database.WriteBehind(
+                    self.database_file, lambda: self.database
+                )
+
             self.filename = filename
 
             self.table_name = self.get_table_name()
@@ -108,7 +212,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
     def __contains__(self, subject):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if subject not in self.is_present_cache:
                     self.is_present_cache[subject] = False
                     if self[subject]:
@@ -116,14 +220,23 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
                 return self.is_present_cache[subject]
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                if PyFunceble.engine.SQLWriter.get(
+                    self.table_name,
+                    PyFunceble.helpers.Hash(algo="sha256").data(
+                        bytes(self.filename + subject, "utf-8")
+                    ),
+                ):
+                    # The subject is waiting to be written.
+                    return True
+
                 query = (
                     "SELECT COUNT(*) "
                     "FROM {0} "
                     "WHERE subject = %(subject)s AND file_path = %(file)s"
                 ).format(self.table_name)
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"subject": subject, "file": self.filename})
 
                     fetched = cursor.fetchone()
@@ -135,7 +248,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
     def __getitem__(self, subject):
         if (
             self.authorized
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
             and self.filename in self.database
             and subject in self.database[self.filename]
         ):
@@ -143,9 +256,14 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         return {}
 
     def __setitem__(self, subject, data):
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
             actual_state = self[subject]
 
+            if isinstance(actual_state, InactiveRecord):
+                actual_state = self.database[self.filename][subject] = dict(
+                    actual_state
+                )
+
             if actual_state:
                 if isinstance(actual_state, dict):  # pragma: no cover
                     if isinstance(data, dict):
@@ -176,7 +294,10 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                     self.database[self.filename][subject] = data
 
     def __delitem__(self, subject):
-        if PyFunceble.CONFIGURATION.db_type == "json" and self[subject]:
+        if (
+            PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
+            and self[subject]
+        ):
             del self.database[self.filename][subject]
 
     @classmethod
@@ -193,8 +314,8 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         Returns the name of the table to use.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-            return PyFunceble.engine.MySQL.tables["inactive"]
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            return PyFunceble.engine.SQL.tables["inactive"]
         return "inactive"
 
     def _merge(self):
@@ -203,38 +324,39 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         has already been set into the database.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
-            database_content = PyFunceble.helpers.Dict().from_json_file(
-                self.database_file
-            )
-
-            for database_top_key in [
-                x for x in database_content.keys() if database_content[x]
-            ]:
-
-                for database_low_key, data in database_content[
-                    database_top_key
-                ].items():
-                    to_set = {}
-
-                    if database_low_key.isdigit():
-                        last_test_date = datetime.fromtimestamp(float(database_low_key))
-
-                        for subject, status in data.items():
-                            to_set[subject] = {
-                                "included_at_epoch": last_test_date.timestamp(),
-                                "included_at_iso": last_test_date.isoformat(),
-                                "last_retested_at_epoch": last_test_date.timestamp(),
-                                "last_retested_at_iso": last_test_date.isoformat(),
-                                "status": status,
-                            }
-                    else:
-                        to_set[database_low_key] = data
-
-                    if database_top_key not in self.database:
-                        self.database[database_top_key] = to_set
-                    else:
-                        self.database[database_top_key].update(to_set)
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in [
+            "json",
+            "json_journal",
+        ]:
+            # We read the file subject by subject so that we never
+            # hold its whole content in memory.
+            for keys, data in PyFunceble.helpers.Dict().iter_json_file(
+                self.database_file, depth=2
+            ):
+                if len(keys) != 2:  # pragma: no cover
+                    # Not something we know.
+                    continue
+
+                database_top_key, database_low_key = keys
+
+                if database_top_key not in self.database:
+                    self.database[database_top_key] = {}
+
+                if database_low_key.isdigit():
+                    last_test_date = datetime.fromtimestamp(float(database_low_key))
+
+                    for subject, status in data.items():
+                        self.database[database_top_key][
+                            intern(subject)
+                        ] = InactiveRecord(
+                            status,
+                            last_test_date.timestamp(),
+                            last_test_date.timestamp(),
+                        )
+                else:
+                    self.database[database_top_key][
+                        intern(database_low_key)
+                    ] = InactiveRecord.compact(data)
 
             PyFunceble.LOGGER.info("Merged possible old to the new format")
 
@@ -243,7 +365,12 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         Loads the content of the database file.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in [
+            "json",
+            "json_journal",
+        ]:
+            self.already_tested = None
+
             if PyFunceble.helpers.File(self.database_file).exists():
                 self._merge()
             else:
@@ -264,12 +391,25 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            self.write_behind.flush(force=True)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+    def mark_dirty(self):
+        """
+        Marks the database as modified. It will be saved by
+        the write-behind layer.
+        """
+
+        if (
+            self.authorized
+            and self.parent
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
+        ):
+            self.write_behind.mark_dirty()
+
     def clean(self):
         """
         Cleans everything which is not needed anymore.
@@ -311,71 +451,53 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
-                current_datetime = self.datetime()
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
+                current_timestamp = self.datetime().timestamp()
 
-                if self[subject]:
-                    self[subject] = {
-                        "status": status,
-                        "last_retested_at_iso": current_datetime.isoformat(),
-                        "last_retested_at_epoch": current_datetime.timestamp(),
-                    }
-                else:
-                    self[subject] = {
-                        "status": status,
-                        "included_at_iso": current_datetime.isoformat(),
-                        "last_retested_at_iso": current_datetime.isoformat(),
-                        "included_at_epoch": current_datetime.timestamp(),
-                        "last_retested_at_epoch": current_datetime.timestamp(),
-                    }
+                if self.filename not in self.database:
+                    self.database[self.filename] = {}
+
+                self.database[self.filename][subject] = InactiveRecord(
+                    status,
+                    self[subject].get("included_at_epoch", current_timestamp),
+                    current_timestamp,
+                )
 
                 PyFunceble.LOGGER.info(
                     f"Indexed {repr(subject)} with the status "
                     f"{repr(status)} into {repr(self.filename)} database's."
                 )
 
-                self.save()
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                self.mark_dirty()
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 digest = PyFunceble.helpers.Hash(algo="sha256").data(
                     bytes(self.filename + subject, "utf-8")
                 )
 
-                query = (
-                    "INSERT INTO {0} "
-                    "(file_path, subject, status, digest) "
-                    "VALUES (%(file)s, %(subject)s, %(status)s, %(digest)s)"
-                ).format(self.table_name)
-
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
-                    playload = {
-                        "file": self.filename,
+                # We let our writer save it with the next batch.
+                PyFunceble.engine.SQLWriter.add(
+                    self.table_name,
+                    {
+                        "file_path": self.filename,
                         "subject": subject,
                         "status": status,
                         "digest": digest,
-                    }
-
-                    try:
-                        cursor.execute(query, playload)
+                    },
+                    update=["subject", "status"],
+                )
 
-                        PyFunceble.LOGGER.info(
-                            f"Inserted into the database: \n {playload}"
-                        )
-                    except PyFunceble.engine.MySQL.errors:
-                        query = (
-                            "UPDATE {0} "
-                            "SET subject = %(subject)s, status = %(status)s "
-                            "WHERE digest = %(digest)s"
-                        ).format(self.table_name)
-
-                        cursor.execute(
-                            query,
-                            {"subject": subject, "status": status, "digest": digest},
-                        )
+                PyFunceble.LOGGER.info(
+                    f"Queued {repr(subject)} with the status {repr(status)} "
+                    f"for the {repr(self.table_name)} table."
+                )
 
-                        PyFunceble.LOGGER.info(
-                            "Data already indexed, updated the modified "
-                            f"column of the row related to {repr(subject)}."
-                        )
+            if (
+                self.already_tested is not None
+                and PyFunceble.CONFIGURATION.days_between_db_retest >= 0
+                and self.filename in self.database
+            ):
+                # We keep our index of already tested subjects up to date.
+                self.already_tested.add(subject)
 
     def remove(self, subject):
         """
@@ -385,22 +507,25 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if self[subject]:
                     del self[subject]
 
                     PyFunceble.LOGGER.info(
                         "Cleaned the data related to " f"{repr(subject)}."
                     )
-                    self.save()
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                    self.mark_dirty()
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                # We write what's pending before deleting.
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = (
                     "DELETE FROM {0} "
                     "WHERE file_path = %(file)s "
                     "AND subject = %(subject)s"
                 ).format(self.table_name)
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename, "subject": subject})
 
                     PyFunceble.LOGGER.info(
@@ -409,12 +534,15 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                         f"the {repr(self.table_name)} table."
                     )
 
+            if self.already_tested is not None:
+                self.already_tested.discard(subject)
+
     def __execute_query(self, query):  # pragma: no cover
         """
         Executes the query to get the list to retest or already tested.
         """
 
-        with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
             cursor.execute(
                 query,
                 {
@@ -444,7 +572,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             and PyFunceble.CONFIGURATION.days_between_db_retest >= 0
             and self.filename in self.database
         ):
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 result = set()
 
                 for subject, info in self.database[self.filename].items():
@@ -463,12 +591,14 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
                 return result
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = (
                     "SELECT * FROM {0} WHERE file_path = %(file)s "
                     "AND CAST(UNIX_TIMESTAMP() AS {1}) "
                     "> (CAST(UNIX_TIMESTAMP(modified) AS {1}) + CAST(%(days)s AS {1}))"
-                ).format(self.table_name, PyFunceble.engine.MySQL.get_int_cast_type())
+                ).format(self.table_name, PyFunceble.engine.SQL.get_int_cast_type())
 
                 return self.__execute_query(query)
         return set()
@@ -487,7 +617,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             and PyFunceble.CONFIGURATION.days_between_db_retest >= 0
             and self.filename in self.database
         ):
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 result = set()
 
                 for subject, info in self.database[self.filename].items():
@@ -508,16 +638,40 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             if PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
                 query = (
                     "SELECT * FROM {0} WHERE file_path= %(file)s "
                     "AND CAST(UNIX_TIMESTAMP() AS {1}) "
                     "< (CAST(UNIX_TIMESTAMP(modified) AS {1}) + CAST(%(days)s AS {1}))"
-                ).format(self.table_name, PyFunceble.engine.MySQL.get_int_cast_type())
-
-                return self.__execute_query(query)
+                ).format(self.table_name, PyFunceble.engine.SQL.get_int_cast_type())
+
+                # The subjects which are waiting to be written were just tested.
+                return self.__execute_query(query) | {
+                    x["subject"]
+                    for x in PyFunceble.engine.SQLWriter.get_pending(self.table_name)
+                    if x["file_path"] == self.filename
+                }
         return set()
 
+    def is_already_tested(self, subject):
+        """
+        Checks if the given subject was already tested.
+
+        .. note::
+            We only ask the database at the first call. Our
+            :code:`add` and :code:`remove` methods maintain the index after that.
+
+        :param str subject: The subject to check.
+
+        :rtype: bool
+        """
+
+        if self.already_tested is None:
+            self.already_tested = self.get_already_tested()
+
+        return subject in self.already_tested
+
     def get_to_clean(self):
         """
         Returns a set of subject to clean from the database.
@@ -532,7 +686,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             and PyFunceble.CONFIGURATION.days_between_inactive_db_clean >= 0
             and self.filename in self.database
         ):
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 result = set()
 
                 for subject, info in self.database[self.filename].items():
@@ -551,13 +705,15 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             if PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
 
                 query = (
                     "SELECT * FROM {0} WHERE file_path= %(file)s "
                     "AND CAST(UNIX_TIMESTAMP() AS {1}) "
                     "> (CAST(UNIX_TIMESTAMP(created) AS {1}) + CAST(%(days_between_clean)s AS {1}))"
-                ).format(self.table_name, PyFunceble.engine.MySQL.get_int_cast_type())
+                ).format(self.table_name, PyFunceble.engine.SQL.get_int_cast_type())
 
                 return self.__execute_query(query)
         return set()
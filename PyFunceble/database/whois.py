@@ -59,6 +59,7 @@ License:
 """
 
 from datetime import datetime
+from threading import RLock
 
 import PyFunceble
 
@@ -73,17 +74,25 @@ class WhoisDB:
     database_file = None
     authorized = False
 
+    # Serializes the updates of the database when we are
+    # used from multiple threads.
+    lock = RLock()
+
     def __init__(self, parent_process=False):
         # Get the authorization.
         self.authorized = self.authorization()
         self.database_file = ""
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
             # We set the location of the database file.
             self.database_file = "{0}{1}".format(
                 PyFunceble.CONFIG_DIRECTORY, PyFunceble.OUTPUTS.default_files.whois_db
             )
 
+            self.write_behind = PyFunceble.database.WriteBehind(
+                self.database_file, lambda: self.database, lock=self.lock
+            )
+
         self.parent = parent_process
         self.table_name = self.get_table_name()
 
@@ -95,7 +104,7 @@ class WhoisDB:
 
     def __contains__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if index in self.database:
                     PyFunceble.LOGGER.info(f"{index} is present into the database.")
                     return True
@@ -103,12 +112,12 @@ class WhoisDB:
                 PyFunceble.LOGGER.info(f"{index} is not present into the database.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 query = "SELECT COUNT(*) FROM {0} WHERE subject = %(subject)s".format(
                     self.table_name
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"subject": index})
 
                     fetched = cursor.fetchone()
@@ -123,21 +132,21 @@ class WhoisDB:
 
     def __getitem__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if index in self.database:
                     return self.database[index]
 
                 return None
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 fetched = None
 
-                if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                     query = "SELECT * FROM {0} WHERE subject = %(subject)s".format(
                         self.table_name
                     )
 
-                    with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                    with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                         cursor.execute(query, {"subject": index})
 
                         fetched = cursor.fetchone()
@@ -188,7 +197,7 @@ class WhoisDB:
             )
         )
 
-        with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
             playload = {
                 "subject": index,
                 "expiration_date": value["expiration_date"],
@@ -200,14 +209,14 @@ class WhoisDB:
             try:
                 cursor.execute(query, playload)
                 PyFunceble.LOGGER.info(f"Inserted into the database: \n {playload}")
-            except PyFunceble.engine.MySQL.errors:
+            except PyFunceble.engine.SQL.errors:
                 pass
 
     def __setitem__(self, index, value):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 self.__setitem_json(index, value)
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 self.__setitem_mysql(index, value)
 
     @classmethod
@@ -236,7 +245,7 @@ class WhoisDB:
         # We initiate a local place to save our results.
         result = {}
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
             for index, data in old.items():
                 # We loop through all indexes and data of the database.
 
@@ -265,8 +274,8 @@ class WhoisDB:
         Returns the name of the table to use.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-            return PyFunceble.engine.MySQL.tables["whois"]
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            return PyFunceble.engine.SQL.tables["whois"]
         return "whois"
 
     def load(self):
@@ -277,24 +286,32 @@ class WhoisDB:
         if (
             self.authorized
             and PyFunceble.helpers.File(self.database_file).exists()
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
             # * We are authorized to operate.
             # and
             # * The database file exists.
 
+            # Note: We read the file index by index so that we never hold
+            # its whole content in memory.
+            content = {
+                x[0]: y
+                for x, y in PyFunceble.helpers.Dict().iter_json_file(self.database_file)
+                if x
+            }
+            merged = self.merge(content)
+
             # We merge our current database into already initiated one.
-            self.database.update(
-                self.merge(PyFunceble.helpers.Dict().from_json_file(self.database_file))
-            )
+            self.database.update(merged)
 
             PyFunceble.LOGGER.info(
                 "Database content loaded in memory. (DATASET WONT BE LOGGED)"
             )
 
-            # As changes can happen because of the merging, we directly saved
-            # the loaded data.
-            self.save()
+            if merged != content:
+                # The merging converted some (old) entries, we mark the
+                # loaded data as modified.
+                self.mark_dirty()
 
     def save(self):
         """
@@ -304,15 +321,28 @@ class WhoisDB:
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
             # We are authorized to operate.
 
             # We save the current state of the datbase.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            self.write_behind.flush(force=True)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+    def mark_dirty(self):
+        """
+        Marks the database as modified. It will be saved by
+        the write-behind layer.
+        """
+
+        if (
+            self.authorized
+            and self.parent
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
+        ):
+            self.write_behind.mark_dirty()
+
     def is_time_older(self, subject):
         """
         Checks if the expiration time of the given subject is
@@ -393,8 +423,9 @@ class WhoisDB:
                 # We set the state.
                 data["state"] = "future"
 
-            # We save everything into the database.
-            self[subject] = data
+            with self.lock:
+                # We save everything into the database.
+                self[subject] = data
 
-            # We save everything.
-            self.save()
+                # We mark everything as modified.
+                self.mark_dirty()
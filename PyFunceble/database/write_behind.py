@@ -0,0 +1,206 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the write-behind layer of our JSON formatted databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from atexit import register as register_at_exit
+from os import getpid
+from os import replace as rename_file
+from threading import RLock
+from time import time
+
+import PyFunceble
+
+
+class WriteBehind:
+    """
+    Provides a write-behind layer in front of our JSON formatted databases.
+
+    Instead of rewriting the whole database file after each change, we only
+    mark it as dirty. The file is written once enough changes were made,
+    once enough time passed, at each autosave and at exit.
+
+    We keep a single layer per database file: a new layer replaces (after
+    writing its pending changes) the previous layer of the same file.
+
+    :param str database_file: The file to write.
+    :param get_content: A callable which provides the content to write.
+    :param lock: The lock to hold while we read the content to write.
+    """
+
+    # Saves the layer of each database file so that we can flush them
+    # all at once.
+    layers = {}
+    # Saves the number of flushes per database file.
+    flushes = {}
+
+    def __init__(self, database_file, get_content, lock=None):
+        self.database_file = database_file
+        self.get_content = get_content
+        self.lock = lock if lock is not None else RLock()
+
+        # We save the process which created us. Only that one is
+        # allowed to write.
+        self.owner = getpid()
+        # We save the number of changes since the last flush.
+        self.changes = 0
+        # We save the time of the last flush.
+        self.last_flush = time()
+
+        if database_file in self.layers:
+            # We write what the previous layer of the file did not write yet.
+            self.layers[database_file].flush()
+
+        self.layers[database_file] = self
+
+    @property
+    def dirty(self):
+        """
+        Checks if some changes were not written yet.
+
+        :rtype: bool
+        """
+
+        return self.changes > 0
+
+    def mark_dirty(self):
+        """
+        Marks the database as modified and writes it if one of
+        the thresholds is reached.
+        """
+
+        with self.lock:
+            self.changes += 1
+
+            if (
+                self.changes >= PyFunceble.CONFIGURATION.db_write_behind_size
+                or time() - self.last_flush
+                >= PyFunceble.CONFIGURATION.db_write_behind_interval
+            ):
+                self.flush()
+
+    def flush(self, force=False):
+        """
+        Writes the database file if it is dirty.
+
+        :param bool force: Writes it even if it is not dirty.
+
+        :return: :code:`True` if we wrote the database file.
+        :rtype: bool
+        """
+
+        if (not force and not self.dirty) or self.owner != getpid():
+            return False
+
+        with self.lock:
+            # We write into a temporary file first so that the database file
+            # is never partially overwritten.
+            # Note: Our databases are internal, we write them compact.
+            PyFunceble.helpers.Dict(self.get_content()).to_json_file(
+                self.database_file + ".tmp", indent=None
+            )
+            rename_file(self.database_file + ".tmp", self.database_file)
+
+            self.changes = 0
+            self.last_flush = time()
+
+            if self.database_file in self.flushes:
+                self.flushes[self.database_file] += 1
+            else:
+                self.flushes[self.database_file] = 1
+
+        PyFunceble.LOGGER.info(
+            f"Flushed {repr(self.database_file)} "
+            f"({self.flushes[self.database_file]} flushes so far)."
+        )
+
+        return True
+
+    def close(self):
+        """
+        Writes the pending changes and forgets about the layer.
+        """
+
+        self.flush()
+
+        if self.layers.get(self.database_file) is self:
+            del self.layers[self.database_file]
+
+    @classmethod
+    def discard(cls, database_file):
+        """
+        Forgets about the layer of the given database file and its pending
+        changes. It is meant to be used when the database file is deleted.
+
+        :param str database_file: The database file.
+        """
+
+        if database_file in cls.layers:
+            cls.layers.pop(database_file).changes = 0
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Writes all dirty databases.
+        """
+
+        for layer in list(cls.layers.values()):
+            layer.flush()
+
+
+register_at_exit(WriteBehind.flush_all)
@@ -85,7 +85,7 @@ class DBTypeDownloader(DownloaderBase):
 
         destination_dir_instance = PyFunceble.helpers.Directory(destination_directory)
 
-        not_supported_db_types = ["json"]
+        not_supported_db_types = ["json", "json_journal", "sqlite"]
 
         self.destination = (
             f"{destination_directory}"
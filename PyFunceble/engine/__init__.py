@@ -60,8 +60,12 @@ License:
 
 from .auto_continue import AutoContinue
 from .auto_save import AutoSave
+from .dedupe import BloomFilter, Dedupe, ScalableBloomFilter
 from .logger import Logger
 from .mining import Mining
 from .mysql import MySQL
 from .sort import Sort
+from .sql import SQL
+from .sqlite import SQLite
+from .sql_writer import SQLWriter
 from .user_agent import UserAgent
@@ -58,6 +58,10 @@ License:
     SOFTWARE.
 """
 
+from json import dumps, loads
+from os import getpid
+from os import replace as rename_file
+from sys import intern
 
 import PyFunceble
 
@@ -71,8 +75,16 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
     database = {}
     # Save the database file
     database_file = None
+    # Save the journal file (json_journal database type).
+    journal_file = None
+    # Save the number of records appended into the journal since
+    # the last compaction.
+    journal_size = 0
     # Save the operation authorization.
     authorized = False
+    # Save the set of already tested subjects. It is read once
+    # and kept up to date while we add new subjects.
+    already_tested = None
 
     # Save the filename we are working with.
     filename = None
@@ -90,6 +102,9 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
         # We share if we are under the parent process.
         self.parent = parent_process
+        # We save the process which owns the journal. Only that one is
+        # allowed to compact it.
+        self.owner = getpid()
 
         PyFunceble.LOGGER.debug(f"Authorization: {self.authorized}")
         PyFunceble.LOGGER.debug(f"Table Name: {self.table_name}")
@@ -99,7 +114,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
             PyFunceble.LOGGER.info("Process authorized.")
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 # We set the location of the database file.
                 self.database_file = (
                     PyFunceble.OUTPUT_DIRECTORY
@@ -107,6 +122,10 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     + PyFunceble.OUTPUTS.logs.filenames.auto_continue
                 )
 
+            if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                # We set the location of the journal file.
+                self.journal_file = self.database_file + ".journal"
+
             PyFunceble.LOGGER.debug(f"DB (File): {self.database_file}")
 
             # We load the backup (if existant).
@@ -125,6 +144,11 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
                 # We clean the output directory.
                 PyFunceble.output.Clean(file_path=self.filename)
+
+                if self.journal_file:
+                    # The cleaning removed our files, but we still have
+                    # everything in memory. So we save it back.
+                    self.save()
         elif self.parent:
             # We are not authorized to operate.
 
@@ -138,7 +162,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
     def __contains__(self, index):  # pragma: no cover
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if self.filename in self.database:
                     for status, status_data in self.database[self.filename].items():
                         if status == "complements":
@@ -153,14 +177,16 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 PyFunceble.LOGGER.info(f"{index} is not present into the database.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = (
                     "SELECT COUNT(*) "
                     "FROM {0} "
                     "WHERE subject = %(subject)s AND file_path = %(file)s"
                 ).format(self.table_name)
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"subject": index, "file": self.filename})
 
                     fetched = cursor.fetchone()
@@ -195,8 +221,8 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         Returns the name of the table to use.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-            return PyFunceble.engine.MySQL.tables["auto_continue"]
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            return PyFunceble.engine.SQL.tables["auto_continue"]
         return None
 
     def is_empty(self):
@@ -206,7 +232,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         """
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if (
                     self.filename not in self.database
                     or not self.database[self.filename]
@@ -217,12 +243,14 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 PyFunceble.LOGGER.info(f"File to test was previously indexed.")
                 return False
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = "SELECT COUNT(*) FROM {0} WHERE file_path = %(file)s".format(
                     self.table_name
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename})
 
                     fetched = cursor.fetchone()
@@ -248,7 +276,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if self.filename in self.database:
                     # We already have something related
                     # to the file we are testing.
@@ -273,49 +301,83 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     f"{repr(status)} into {repr(self.filename)} database's."
                 )
 
-                # We save everything.
-                self.save()
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-                # We construct the query string.
-
+                if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                    if self.parent:
+                        # We only append the new record into the journal.
+                        self.__append_to_journal(
+                            {
+                                "op": "add",
+                                "file": self.filename,
+                                "status": status,
+                                "subject": subject,
+                            }
+                        )
+                else:
+                    # We save everything.
+                    self.save()
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                # We construct the digest of the row.
                 digest = PyFunceble.helpers.Hash(algo="sha256").data(
                     bytes(self.filename + subject + status, "utf-8")
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                # We let our writer save it with the next batch.
+                PyFunceble.engine.SQLWriter.add(
+                    self.table_name,
+                    {
+                        "file_path": self.filename,
+                        "subject": subject,
+                        "status": status,
+                        "is_complement": int(False),
+                        "digest": digest,
+                    },
+                    update=["subject"],
+                )
 
-                    query = (
-                        "INSERT INTO {0} "
-                        "(file_path, subject, status, is_complement, digest) "
-                        "VALUES (%(file)s, %(subject)s, %(status)s, %(is_complement)s, %(digest)s)"
-                    ).format(self.table_name)
+                PyFunceble.LOGGER.info(
+                    f"Queued {repr(subject)} with the status {repr(status)} "
+                    f"for the {repr(self.table_name)} table."
+                )
 
-                    try:
-                        playload = {
+            if self.already_tested is not None:
+                # We keep our index of already tested subjects up to date.
+                self.already_tested.add(subject)
+
+    def remove_complement(self, subject):
+        """
+        Removes the given subject from the complements we still have to test.
+
+        .. note::
+            With the :code:`json_journal` database type, we only append
+            the removal into the journal.
+        """
+
+        if (
+            self.authorized
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
+            and self.filename in self.database
+            and subject in self.database[self.filename].get("complements", [])
+        ):
+            # We are authorized to operate and the subject is
+            # still into the complements to test.
+
+            while subject in self.database[self.filename]["complements"]:
+                self.database[self.filename]["complements"].remove(subject)
+
+            if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                if self.parent:
+                    # We only append the removal into the journal.
+                    self.__append_to_journal(
+                        {
+                            "op": "remove",
                             "file": self.filename,
+                            "status": "complements",
                             "subject": subject,
-                            "status": status,
-                            "is_complement": int(False),
-                            "digest": digest,
                         }
-                        cursor.execute(query, playload)
-
-                        PyFunceble.LOGGER.info(
-                            f"Inserted into the database: \n {playload}"
-                        )
-                    except PyFunceble.engine.MySQL.errors:
-                        query = (
-                            "UPDATE {0} "
-                            "SET subject = %(subject)s "
-                            "WHERE digest = %(digest)s"
-                        ).format(self.table_name)
-
-                        cursor.execute(query, {"subject": subject, "digest": digest})
-
-                        PyFunceble.LOGGER.info(
-                            "Data already indexed, updated the modified "
-                            f"column of the row related to {repr(subject)}."
-                        )
+                    )
+            else:
+                # We save everything.
+                self.save()
 
     def save(self):
         """
@@ -325,29 +387,175 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
             # We are authoried to operate.
 
-            # We save the current database state.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                # We compact the journal into the database file.
+                self.compact()
+            else:
+                # We save the current database state.
+                PyFunceble.helpers.Dict(self.database).to_json_file(
+                    self.database_file, indent=None
+                )
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+    def __append_to_journal(self, record):
+        """
+        Appends the given record at the end of the journal.
+
+        :param dict record: The record to append.
+        """
+
+        # We write the whole line at once so that the records appended
+        # by our children (live merging mode) are never mixed.
+        with open(self.journal_file, "a", encoding="utf-8") as file_stream:
+            file_stream.write(dumps(record, ensure_ascii=False) + "\n")
+
+        self.journal_size += 1
+
+        if self.journal_size >= PyFunceble.CONFIGURATION.auto_continue_journal_size:
+            self.compact()
+
+    def __replay_journal(self, journal_file):
+        """
+        Replays the records of the given journal file into the database.
+
+        .. note::
+            The replay is idempotent. In other words, replaying a journal
+            which was already partially or fully merged does not duplicate
+            anything.
+
+        :param str journal_file: The journal file to replay.
+
+        :return: The number of replayed records.
+        :rtype: int
+        """
+
+        if not PyFunceble.helpers.File(journal_file).exists():
+            return 0
+
+        replayed = 0
+        # We index the subjects per file and status so that we can
+        # check their existence without looping through the lists.
+        indexes = {}
+
+        with open(journal_file, "r", encoding="utf-8") as file_stream:
+            for line in file_stream:
+                try:
+                    record = loads(line)
+                except ValueError:
+                    # Most probably the last line of a journal which was being
+                    # written when the process was interrupted.
+                    PyFunceble.LOGGER.error(
+                        f"Skipped unreadable journal record: {line!r}"
+                    )
+                    continue
+
+                if record["op"] == "clean":
+                    self.database[record["file"]] = {}
+
+                    indexes = {
+                        x: y for x, y in indexes.items() if x[0] != record["file"]
+                    }
+                elif record["op"] == "add":
+                    index = (record["file"], record["status"])
+
+                    if record["file"] not in self.database:
+                        self.database[record["file"]] = {}
+
+                    if record["status"] not in self.database[record["file"]]:
+                        self.database[record["file"]][record["status"]] = []
+
+                    if index not in indexes:
+                        indexes[index] = set(
+                            self.database[record["file"]][record["status"]]
+                        )
+
+                    if record["subject"] not in indexes[index]:
+                        self.database[record["file"]][record["status"]].append(
+                            intern(record["subject"])
+                        )
+                        indexes[index].add(record["subject"])
+                elif record["op"] == "remove":
+                    index = (record["file"], record["status"])
+                    subjects = self.database.get(record["file"], {}).get(
+                        record["status"], []
+                    )
+
+                    while record["subject"] in subjects:
+                        subjects.remove(record["subject"])
+
+                    if index in indexes:
+                        indexes[index].discard(record["subject"])
+
+                replayed += 1
+
+        PyFunceble.LOGGER.info(f"Replayed {replayed} records of {journal_file!r}.")
+
+        return replayed
+
+    def compact(self):
+        """
+        Compacts the journal into the database file.
+
+        .. note::
+            The journal is first moved aside, merged, and only deleted once the
+            new database file took the place of the old one. Therefore,
+            an interruption at any step can be recovered at the next loading.
+        """
+
+        if (
+            self.authorized
+            and PyFunceble.CONFIGURATION.db_type == "json_journal"
+            and self.owner == getpid()
+        ):
+            compacting_file = self.journal_file + ".compacting"
+
+            if not PyFunceble.helpers.File(compacting_file).exists():
+                if PyFunceble.helpers.File(self.journal_file).exists():
+                    rename_file(self.journal_file, compacting_file)
+
+            # We merge what our children (if any) may have written.
+            self.__replay_journal(compacting_file)
+
+            # We write the new database state through a temporary file
+            # so that the old one is never partially overwritten.
+            PyFunceble.helpers.Dict(self.database).to_json_file(
+                self.database_file + ".tmp", indent=None
+            )
+            rename_file(self.database_file + ".tmp", self.database_file)
+
+            PyFunceble.helpers.File(compacting_file).delete()
+
+            self.journal_size = 0
+
+            PyFunceble.LOGGER.info(
+                f"Compacted the journal into {repr(self.database_file)}."
+            )
+
     def load(self):
         """
         Loads previously saved database.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in [
+            "json",
+            "json_journal",
+        ]:
             # We are authorized to operate.
 
+            # The index of already tested subjects has to be read again.
+            self.already_tested = None
+
             if PyFunceble.helpers.File(self.database_file).exists():
                 # The database file exists.
 
                 # We get its content and save it inside backup_content.
-                self.database = PyFunceble.helpers.Dict().from_json_file(
-                    self.database_file
+                self.database = self.intern_content(
+                    PyFunceble.helpers.Dict().from_json_file(self.database_file)
                 )
             else:
                 # The database file do not exists.
@@ -355,8 +563,44 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 # We initiate an empty database.
                 self.database = {self.filename: {}}
 
+            if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                # We replay what was not compacted yet. That includes
+                # a compaction which may have been interrupted.
+                replayed = self.__replay_journal(self.journal_file + ".compacting")
+                replayed += self.__replay_journal(self.journal_file)
+
+                if replayed and self.parent:
+                    self.compact()
+
             PyFunceble.LOGGER.info(f"Loaded {repr(self.database_file)} in memory.")
 
+    @classmethod
+    def intern_content(cls, content):
+        """
+        Interns the statuses and subjects of the given database content.
+
+        .. note::
+            That way, a subject is saved only once in memory, even if it is
+            also indexed by the inactive database or by our indexes.
+
+        :param dict content: The content of the database file.
+
+        :rtype: dict
+        """
+
+        for statuses in content.values():
+            if not isinstance(statuses, dict):
+                continue
+
+            for status in list(statuses):
+                if isinstance(statuses[status], list):
+                    statuses[intern(status)] = [
+                        intern(x) if isinstance(x, str) else x
+                        for x in statuses.pop(status)
+                    ]
+
+        return content
+
     def clean(self):
         """
         Cleans the database.
@@ -365,24 +609,40 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            # We empty the index of already tested subjects.
+            self.already_tested = None
+
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 # We empty the database.
                 self.database[self.filename] = {}
 
-                # And we save the current database state.
-                PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+                if PyFunceble.CONFIGURATION.db_type == "json_journal":
+                    # We journal the cleaning so that the records of our
+                    # children are not replayed over it.
+                    self.__append_to_journal({"op": "clean", "file": self.filename})
+
+                    # And we compact the current database state.
+                    self.compact()
+                else:
+                    # And we save the current database state.
+                    PyFunceble.helpers.Dict(self.database).to_json_file(
+                        self.database_file, indent=None
+                    )
 
                 PyFunceble.LOGGER.info(
                     "Cleaned the data related to "
                     f"{repr(self.filename)} from {repr(self.database_file)}."
                 )
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                # We write what's pending before deleting.
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 # We construct the query we are going to execute.
                 query = "DELETE FROM {0} WHERE file_path = %(file)s".format(
                     self.table_name
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename})
 
                     PyFunceble.LOGGER.info(
@@ -404,10 +664,13 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We preset the number of tested.
             tested = 0
 
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
             for status in statuses:
                 # We loop through the list of status.
 
-                if PyFunceble.CONFIGURATION.db_type == "json":
+                if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                     try:
                         # We get the number of tested of the currently read
                         # status.
@@ -431,7 +694,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     except KeyError:
                         PyFunceble.INTERN["counter"]["number"][status] = 0
                         continue
-                elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                     query = (
                         "SELECT COUNT(*) "
                         "FROM {0} "
@@ -439,7 +702,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                         "AND file_path = %(file)s "
                     ).format(self.table_name)
 
-                    with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                    with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                         cursor.execute(
                             query,
                             {
@@ -473,7 +736,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         )
 
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 try:
                     return {
                         y
@@ -483,20 +746,42 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                     }
                 except KeyError:  # pragma: no cover
                     pass
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
                 query = "SELECT * FROM {0} WHERE file_path = %(file)s".format(
                     self.table_name
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename})
 
                     fetched = cursor.fetchall()
 
-                    if fetched:
-                        return {x["subject"] for x in fetched}
+                # The subjects which are waiting to be written were just tested.
+                return {x["subject"] for x in fetched} | {
+                    x["subject"]
+                    for x in PyFunceble.engine.SQLWriter.get_pending(self.table_name)
+                    if x["file_path"] == self.filename
+                }
         return set()  # pragma: no cover
 
+    def is_already_tested(self, subject):
+        """
+        Checks if the given subject was already tested.
+
+        .. note::
+            The list of already tested subjects is only read once, then
+            we keep it up to date while adding new subjects.
+
+        :param str subject: The subject to check.
+
+        :rtype: bool
+        """
+
+        if self.already_tested is None:
+            self.already_tested = self.get_already_tested()
+
+        return subject in self.already_tested
+
     def __generate_complements(self):  # pragma: no cover
         """
         Generates the complements from the given list of tested.
@@ -544,6 +829,8 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
         result = []
 
+        PyFunceble.engine.SQLWriter.flush(self.table_name)
+
         query = (
             "SELECT * "
             "FROM {0} "
@@ -551,7 +838,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             "AND is_complement = %(is_complement)s".format(self.table_name)
         )
 
-        with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
             cursor.execute(query, {"file": self.filename, "is_complement": int(True)})
             fetched = cursor.fetchall()
 
@@ -581,10 +868,10 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             for subject in result
         ]
 
-        with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
             try:
                 cursor.executemany(query, to_execute)
-            except PyFunceble.engine.MySQL.errors:
+            except PyFunceble.engine.SQL.errors:
                 pass
 
         return result
@@ -599,9 +886,9 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         if self.authorized and PyFunceble.CONFIGURATION.generate_complements:
             # We aer authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 return self.__get_or_generate_complements_json()
-            if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mysql", "mariadb", "sqlite"]:
                 return self.__get_or_generate_complements_mysql()
 
         return list()
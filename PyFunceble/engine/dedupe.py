@@ -0,0 +1,335 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the in-run deduplication of the tested subjects.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from hashlib import blake2b
+from math import ceil, log
+
+import PyFunceble
+
+
+class BloomFilter:
+    """
+    A (fixed size) Bloom filter.
+
+    :param int capacity: The number of subjects we are going to save.
+    :param float error_rate: The false positive rate we accept.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        # The number of bits of our filter.
+        self.size = ceil(-capacity * log(error_rate) / (log(2) ** 2))
+        # The number of hashes to compute per subject.
+        self.hashes = max(1, round(self.size / capacity * log(2)))
+
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, subject):
+        return all(
+            self.bits[x >> 3] & (1 << (x & 7)) for x in self.get_indexes(subject)
+        )
+
+    def __len__(self):
+        return self.count
+
+    def get_indexes(self, subject):
+        """
+        Provides the indexes of the bits of the given subject.
+
+        .. note::
+            We derive all our hashes from a single digest (double hashing).
+        """
+
+        digest = blake2b(subject.encode("utf-8"), digest_size=16).digest()
+
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+
+        return ((first + x * second) % self.size for x in range(self.hashes))
+
+    def add(self, subject):
+        """
+        Adds the given subject into the filter.
+        """
+
+        for index in self.get_indexes(subject):
+            self.bits[index >> 3] |= 1 << (index & 7)
+
+        self.count += 1
+
+
+class ScalableBloomFilter:
+    """
+    A Bloom filter which grows with the number of subjects we give it.
+
+    Each time the current filter is full, we add a new one which is
+    twice bigger and twice stricter. That way, the false positive
+    rate of the whole chain stays under the given one.
+
+    :param int capacity: The capacity of our first filter.
+    :param float error_rate: The false positive rate we accept.
+    """
+
+    growth = 2
+    tightening = 0.5
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        self.filters = []
+
+    def __contains__(self, subject):
+        return any(subject in x for x in reversed(self.filters))
+
+    def __len__(self):
+        return sum(len(x) for x in self.filters)
+
+    def add(self, subject):
+        """
+        Adds the given subject into the filter.
+        """
+
+        if not self.filters or len(self.filters[-1]) >= self.filters[-1].capacity:
+            self.filters.append(
+                BloomFilter(
+                    self.capacity * self.growth ** len(self.filters),
+                    self.error_rate
+                    * (1 - self.tightening)
+                    * self.tightening ** len(self.filters),
+                )
+            )
+
+        self.filters[-1].add(subject)
+
+
+class Dedupe:  # pylint: disable=too-many-instance-attributes
+    """
+    Keeps track of the subjects we already tested during the current run.
+
+    Until :code:`dedupe_max_exact` subjects are saved, we keep the
+    result of each of them, so that we can replay it for their duplicates.
+
+    Above that limit, we don't deduplicate the new subjects, unless
+    :code:`dedupe_bloom` is activated. In that case, we save them into a
+    scalable Bloom filter: we still skip their duplicates but we can't
+    replay them anymore and a (rare) false positive means that a subject
+    which was never tested is skipped.
+
+    ::
+
+        dedupe = PyFunceble.engine.Dedupe()
+
+        if dedupe.is_duplicate("example.org"):
+            result = dedupe.get("example.org")
+        else:
+            dedupe.remember("example.org", test_the_subject("example.org"))
+
+    :param int max_exact:
+        The number of subjects (and results) to save before switching
+        to the Bloom filter.
+    :param float error_rate:
+        The false positive rate of our Bloom filter.
+    :param bool bloom:
+        Activates the Bloom filter above :code:`max_exact`.
+    """
+
+    # The indexes of the test results we keep.
+    # They are the ones we need to replay a result into our output files.
+    result_indexes = (
+        "tested",
+        "status",
+        "status_source",
+        "expiration_date",
+        "http_status_code",
+        "whois_server",
+        "ipv4_syntax_validation",
+        "ipv6_syntax_validation",
+    )
+
+    def __init__(self, max_exact=None, error_rate=None, bloom=None):
+        self.authorized = bool(PyFunceble.CONFIGURATION.dedupe)
+
+        if max_exact is None:
+            max_exact = PyFunceble.CONFIGURATION.dedupe_max_exact
+
+        if error_rate is None:
+            error_rate = PyFunceble.CONFIGURATION.dedupe_bloom_error_rate
+
+        if bloom is None:
+            bloom = PyFunceble.CONFIGURATION.dedupe_bloom
+
+        self.max_exact = max_exact
+        self.error_rate = error_rate
+        self.bloom_authorized = bool(bloom)
+
+        # Saves the (compact) result of each subject.
+        # Note: The result is None while the subject is under test.
+        self.results = {}
+        # Saves the number of duplicates which are waiting for the result
+        # of a subject which is still under test.
+        self.waiting = {}
+        # Saves the subjects we saw above our limit.
+        self.bloom = None
+        # Saves the number of subjects we skipped only because of the Bloom
+        # filter. Each of them may be a false positive.
+        self.bloom_skipped = 0
+        # Tells us if we already logged that we reached our limit.
+        self.limit_reached = False
+
+    def __contains__(self, subject):
+        return subject in self.results or (
+            self.bloom is not None and subject in self.bloom
+        )
+
+    def is_duplicate(self, subject):
+        """
+        Checks if the given subject was already seen during the current run.
+
+        .. note::
+            If it's not the case, we save it as seen.
+
+        :rtype: bool
+        """
+
+        if not self.authorized:
+            return False
+
+        if subject in self.results:
+            PyFunceble.LOGGER.debug(f"{subject!r} is a duplicate.")
+            return True
+
+        if self.bloom is not None and subject in self.bloom:
+            self.bloom_skipped += 1
+
+            PyFunceble.LOGGER.info(
+                f"{subject!r} is a duplicate according to the Bloom filter "
+                f"(possible false positive #{self.bloom_skipped})."
+            )
+            return True
+
+        if len(self.results) < self.max_exact:
+            self.results[subject] = None
+        elif self.bloom_authorized:
+            if self.bloom is None:
+                PyFunceble.LOGGER.info(
+                    f"More than {self.max_exact} subjects seen. "
+                    "Switching to the Bloom filter."
+                )
+                self.bloom = ScalableBloomFilter(self.max_exact, self.error_rate)
+
+            self.bloom.add(subject)
+        elif not self.limit_reached:
+            self.limit_reached = True
+
+            PyFunceble.LOGGER.info(
+                f"More than {self.max_exact} subjects seen. "
+                "Not deduplicating the next ones."
+            )
+
+        return False
+
+    def remember(self, subject, result):
+        """
+        Saves the result of the given subject.
+
+        :param str subject: The subject we tested.
+        :param dict result: The test result of the given subject.
+
+        :return:
+            The number of duplicates which were waiting for the given result.
+        :rtype: int
+        """
+
+        if not self.authorized or subject not in self.results:
+            return 0
+
+        self.results[subject] = tuple(result[x] for x in self.result_indexes)
+
+        return self.waiting.pop(subject, 0)
+
+    def get(self, subject):
+        """
+        Provides the saved result of the given subject.
+
+        :rtype: dict|None
+        """
+
+        if self.results.get(subject):
+            return dict(zip(self.result_indexes, self.results[subject]))
+
+        return None
+
+    def wait(self, subject):
+        """
+        Lets a duplicate wait for the result of the given subject.
+
+        :return: :code:`False` if we will never get the result of the subject.
+        :rtype: bool
+        """
+
+        if subject in self.results and self.results[subject] is None:
+            self.waiting[subject] = self.waiting.get(subject, 0) + 1
+            return True
+
+        return False
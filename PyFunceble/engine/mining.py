@@ -107,24 +107,30 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 # We get the file we are going to save our data.
                 self.database_file = (
                     PyFunceble.CONFIG_DIRECTORY
                     + PyFunceble.OUTPUTS.default_files.mining
                 )
 
+                self.write_behind = PyFunceble.database.WriteBehind(
+                    self.database_file, lambda: self.database
+                )
+
             PyFunceble.LOGGER.debug(f"DB (File): {self.database_file}")
 
             self.load()
 
     def __getitem__(self, index):
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 if index in self.database[self.filename]:
                     return self.database[self.filename][index]
 
-            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = (
                     "SELECT * "
                     "FROM {0} "
@@ -132,7 +138,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                     "AND subject = %(subject)s "
                 ).format(self.table_name)
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename, "subject": index})
 
                     fetched = cursor.fetchall()
@@ -144,7 +150,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
     def __setitem__(self, index, value):  # pylint: disable=too-many-branches
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 actual_value = self[index]
 
                 if actual_value:
@@ -169,37 +175,31 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                 PyFunceble.LOGGER.info(
                     f"Inserted {repr(value)} into the subset of {repr(index)}"
                 )
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-                query = (
-                    "INSERT INTO {0} "
-                    "(file_path, subject, mined, digest) "
-                    "VALUES (%(file)s, %(subject)s, %(mined)s, %(digest)s)"
-                ).format(self.table_name)
-
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
-                    for val in value:
-                        digest = sha256(
-                            bytes(self.filename + index + val, "utf-8")
-                        ).hexdigest()
-
-                        playload = {
-                            "file": self.filename,
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                for val in value:
+                    digest = sha256(
+                        bytes(self.filename + index + val, "utf-8")
+                    ).hexdigest()
+
+                    # We let our writer save it with the next batch.
+                    PyFunceble.engine.SQLWriter.add(
+                        self.table_name,
+                        {
+                            "file_path": self.filename,
                             "subject": index,
                             "mined": val,
                             "digest": digest,
-                        }
-                        try:
-                            cursor.execute(query, playload)
+                        },
+                    )
 
-                            PyFunceble.LOGGER.info(
-                                f"Inserted into the database: \n {playload}"
-                            )
-                        except PyFunceble.engine.MySQL.errors:
-                            pass
+                PyFunceble.LOGGER.info(
+                    f"Queued {repr(value)} (mined) of {repr(index)} "
+                    f"for the {repr(self.table_name)} table."
+                )
 
     def __delitem__(self, index):  # pragma: no cover
         if self.authorized:
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                 actual_value = self[index]
 
                 if actual_value:
@@ -210,14 +210,16 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         f"{repr(index)} and {repr(self.filename)} "
                         f"from the database."
                     )
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = (
                     "DELETE FROM {0} "
                     "WHERE file_path = %(file)s "
                     "AND subject = %(subject)s "
                 ).format(self.table_name)
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename, "subject": index})
 
                     PyFunceble.LOGGER.info(
@@ -271,8 +273,8 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         Returns the name of the table to use.
         """
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
-            return PyFunceble.engine.MySQL.tables["mining"]
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+            return PyFunceble.engine.SQL.tables["mining"]
         return "mining"
 
     def list_of_mined(self):
@@ -305,7 +307,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if self.authorized:
             # We are authorized to operate.
 
-            if PyFunceble.CONFIGURATION.db_type == "json":
+            if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
 
                 for subject in self.database[self.filename].keys():
                     # We loop through the available list of status
@@ -316,12 +318,14 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         # the currently read status.
 
                         result.append((subject, element))
-            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+            elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
+                PyFunceble.engine.SQLWriter.flush(self.table_name)
+
                 query = "SELECT * FROM {0} WHERE file_path = %(file)s".format(
                     self.table_name
                 )
 
-                with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                     cursor.execute(query, {"file": self.filename})
 
         # We return the result.
@@ -332,7 +336,10 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         Loads the content of the database file.
         """
 
-        if self.authorized and PyFunceble.CONFIGURATION.db_type == "json":
+        if self.authorized and PyFunceble.CONFIGURATION.db_type in [
+            "json",
+            "json_journal",
+        ]:
             # We are authorized to operate.
 
             if PyFunceble.helpers.File(self.database_file).exists():
@@ -355,15 +362,28 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         if (
             self.authorized
             and self.parent
-            and PyFunceble.CONFIGURATION.db_type == "json"
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
         ):
             # We are authorized to operate.
 
             # We save the database into the file.
-            PyFunceble.helpers.Dict(self.database).to_json_file(self.database_file)
+            self.write_behind.flush(force=True)
 
             PyFunceble.LOGGER.info(f"Saved database into {repr(self.database_file)}.")
 
+    def mark_dirty(self):
+        """
+        Marks the database as modified. It will be saved by
+        the write-behind layer.
+        """
+
+        if (
+            self.authorized
+            and self.parent
+            and PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]
+        ):
+            self.write_behind.mark_dirty()
+
     # pylint: disable=too-many-branches
     def mine(self, subject, subject_type):  # pragma: no cover
         """
@@ -456,8 +476,8 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         # We save into the database.
                         self[subject] = [local_result]
 
-            # We save the database.
-            self.save()
+            # We mark the database as modified.
+            self.mark_dirty()
 
     def remove(self, subject, history_member):
         """
@@ -474,7 +494,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
                 if isinstance(actual_value, list) and history_member in actual_value:
 
-                    if PyFunceble.CONFIGURATION.db_type == "json":
+                    if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
                         try:
                             actual_value.remove(history_member)
 
@@ -484,7 +504,11 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                             )
                         except ValueError:  # pragma: no cover
                             pass
-                    elif PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+                    elif PyFunceble.CONFIGURATION.db_type in [
+                        "mariadb",
+                        "mysql",
+                        "sqlite",
+                    ]:
                         # We construct the query string.
                         query = (
                             "DELETE FROM {0} "
@@ -493,7 +517,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                             "AND mined = %(mined)s"
                         ).format(self.table_name)
 
-                        with PyFunceble.engine.MySQL() as connection, connection.cursor() as cursor:
+                        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
                             cursor.execute(
                                 query,
                                 {
@@ -515,4 +539,4 @@ class Mining:  # pylint: disable=too-many-instance-attributes
             if not self[subject]:  # pragma: no cover
                 del self[subject]
 
-            self.save()
+            self.mark_dirty()
@@ -60,8 +60,12 @@ License:
 
 
 import warnings
+from atexit import register as register_at_exit
 from getpass import getpass
+from os import getpid
 from os import sep as directory_separator
+from threading import RLock
+from time import time
 
 import pymysql
 
@@ -71,6 +75,10 @@ import PyFunceble
 class MySQL:
     """
     Provides our way to work with our mysql/mariadb database.
+
+    .. note::
+        The connections are taken from (and given back to) a per-process pool
+        so that we don't open a new connection for each :code:`with` block.
     """
 
     # pylint: disable=no-member,too-many-instance-attributes
@@ -95,6 +103,31 @@ class MySQL:
     errors = pymysql.err.IntegrityError
     connection = None
 
+    # The errors which tell us that a connection can't be used anymore.
+    connection_errors = (pymysql.err.OperationalError, pymysql.err.InterfaceError)
+
+    # Saves the idle connections of the current process.
+    # Each item is a tuple: (connection, last usage time).
+    pool = []
+    # Saves the process which owns the pool.
+    pool_pid = None
+    # Saves the number of seconds of inactivity after which we check that
+    # a pooled connection is still alive before giving it back.
+    pool_ping_after = 30.0
+    # Saves the statistics of the pool.
+    pool_stats = {
+        "created": 0,
+        "reused": 0,
+        "checked": 0,
+        "expired": 0,
+        "discarded": 0,
+        "in_use": 0,
+    }
+
+    # Serializes the usage of our pool when we are used from
+    # multiple threads.
+    pool_lock = RLock()
+
     def __init__(self):
         warnings.simplefilter("ignore")
 
@@ -114,8 +147,30 @@ class MySQL:
     def __enter__(self):
         self.init_pre_connection()
 
+        self.connection = self.acquire()
+
+        try:
+            self.init_post_connection()
+        except Exception:
+            self.release(self.connection, broken=True)
+            raise
+
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release(
+            self.connection,
+            broken=exc_type is not None
+            and issubclass(exc_type, self.connection_errors),
+        )
+
+    def connect(self):
+        """
+        Opens a new connection.
+        """
+
         if directory_separator not in self._host or "/" not in self._host:
-            self.connection = pymysql.connect(
+            connection = pymysql.connect(
                 host=self._host,
                 port=self._port,
                 user=self._username,
@@ -126,7 +181,7 @@ class MySQL:
                 autocommit=True,
             )
         else:
-            self.connection = pymysql.connect(
+            connection = pymysql.connect(
                 unix_socket=self._host,
                 user=self._username,
                 password=self._password,
@@ -136,12 +191,132 @@ class MySQL:
                 autocommit=True,
             )
 
-        self.init_post_connection()
+        with self.pool_lock:
+            self.pool_stats["created"] += 1
 
-        return self.connection
+        return connection
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.connection.close()
+    @classmethod
+    def reset_pool_if_forked(cls):
+        """
+        Forgets the pool we inherited from our parent process.
+
+        .. warning::
+            We do not close the inherited connections as their socket
+            are still used by our parent process.
+        """
+
+        with cls.pool_lock:
+            if cls.pool_pid != getpid():
+                cls.pool = []
+                cls.pool_pid = getpid()
+                cls.pool_stats = {x: 0 for x in cls.pool_stats}
+
+    @classmethod
+    def close_connection(cls, connection):
+        """
+        Closes the given connection without complaining.
+        """
+
+        try:
+            connection.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    def acquire(self):
+        """
+        Provides a connection from our pool or a new one.
+        """
+
+        self.reset_pool_if_forked()
+
+        with self.pool_lock:
+            while self.pool:
+                connection, last_usage = self.pool.pop()
+                idle_time = time() - last_usage
+
+                if idle_time > PyFunceble.CONFIGURATION.mysql_pool_idle_timeout:
+                    self.close_connection(connection)
+                    self.pool_stats["expired"] += 1
+                    continue
+
+                if idle_time > self.pool_ping_after:
+                    try:
+                        connection.ping(reconnect=True)
+                    except self.connection_errors:
+                        self.close_connection(connection)
+                        self.pool_stats["discarded"] += 1
+                        continue
+
+                    self.pool_stats["checked"] += 1
+
+                self.pool_stats["reused"] += 1
+                self.pool_stats["in_use"] += 1
+
+                return connection
+
+        connection = self.connect()
+
+        with self.pool_lock:
+            self.pool_stats["in_use"] += 1
+
+        return connection
+
+    def release(self, connection, broken=False):
+        """
+        Gives the given connection back to our pool.
+
+        :param connection: The connection to give back.
+        :param bool broken:
+            Tells us that the connection can't be used anymore.
+        """
+
+        self.reset_pool_if_forked()
+
+        with self.pool_lock:
+            self.pool_stats["in_use"] = max(0, self.pool_stats["in_use"] - 1)
+
+            if (
+                broken
+                or not connection.open
+                or len(self.pool) >= PyFunceble.CONFIGURATION.mysql_pool_size
+            ):
+                self.close_connection(connection)
+                self.pool_stats["discarded"] += 1
+            else:
+                self.pool.append((connection, time()))
+
+    @classmethod
+    def get_pool_stats(cls):
+        """
+        Provides the statistics of the pool of the current process.
+
+        :rtype: dict
+        """
+
+        cls.reset_pool_if_forked()
+
+        with cls.pool_lock:
+            result = cls.pool_stats.copy()
+            result["idle"] = len(cls.pool)
+            result["pid"] = cls.pool_pid
+
+        return result
+
+    @classmethod
+    def close_pool(cls):
+        """
+        Closes all idle connections of the current process.
+        """
+
+        with cls.pool_lock:
+            if cls.pool_pid == getpid() and cls.pool:
+                PyFunceble.LOGGER.info(f"MySQL pool statistics: {cls.get_pool_stats()}")
+
+                for connection, _ in cls.pool:
+                    cls.close_connection(connection)
+
+                cls.pool = []
 
     @classmethod
     def get_int_cast_type(cls):
@@ -322,7 +497,9 @@ class MySQL:
             self.create_tables_and_apply_patches()
             self.post_initiated = True
 
-            PyFunceble.INTERN["mysql"] = self.__dict__.copy()
+            PyFunceble.INTERN["mysql"] = {
+                x: y for x, y in self.__dict__.items() if x != "connection"
+            }
 
     def are_tables_present(self):
         """
@@ -364,3 +541,6 @@ class MySQL:
                 )
 
             self.db_tables_initiated = True
+
+
+register_at_exit(MySQL.close_pool)
@@ -0,0 +1,133 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the interface to the SQL engine of the configured database type.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import pymysql
+
+import PyFunceble
+
+from .mysql import MySQL
+from .sql_writer import SQLWriter
+from .sqlite import SQLite
+
+
+class SQL:  # pylint: disable=too-few-public-methods
+    """
+    Provides the SQL engine of the configured database type.
+
+    ::
+
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
+            cursor.execute(query, {"subject": subject})
+    """
+
+    tables = MySQL.tables
+    errors = (MySQL.errors, SQLite.errors)
+
+    def __init__(self):
+        if PyFunceble.CONFIGURATION.db_type == "sqlite":
+            self.engine = SQLite()
+        else:
+            self.engine = MySQL()
+
+    def __enter__(self):
+        return self.engine.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.engine.__exit__(exc_type, exc_value, traceback)
+
+    @classmethod
+    def get_int_cast_type(cls):
+        """
+        Provides the right integer casting.
+        """
+
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "sqlite"]:
+            return "INTEGER"
+        return "SIGNED"
+
+    @classmethod
+    def get_streaming_cursor(cls, connection):
+        """
+        Provides a cursor which reads the rows from the server as we fetch
+        them, instead of reading all of them at once.
+
+        ::
+
+            with PyFunceble.engine.SQL() as connection:
+                with PyFunceble.engine.SQL.get_streaming_cursor(connection) as cursor:
+                    cursor.execute(query)
+
+        :param connection: The connection we are working with.
+        """
+
+        if PyFunceble.CONFIGURATION.db_type == "sqlite":
+            # Note: The SQLite cursors already work that way.
+            return connection.cursor()
+        return connection.cursor(pymysql.cursors.SSDictCursor)
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes the pending rows and commits the pending transactions
+        of the current process.
+        """
+
+        SQLWriter.flush()
+        SQLite.commit()
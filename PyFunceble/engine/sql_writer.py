@@ -0,0 +1,274 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the buffered writer of our SQL databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from atexit import register as register_at_exit
+from functools import lru_cache
+from os import getpid
+from threading import RLock
+
+import PyFunceble
+
+
+class SQLWriter:
+    """
+    Buffers the rows we have to insert (or update) into our SQL databases
+    and writes them by batch with a single
+    :code:`INSERT ... ON DUPLICATE KEY UPDATE` (or
+    :code:`INSERT ... ON CONFLICT DO UPDATE` with SQLite) query.
+
+    ::
+
+        PyFunceble.engine.SQLWriter.add(
+            "pyfunceble_inactive",
+            {"file_path": "hello.list", "subject": "example.org", ...},
+            update=["status"],
+        )
+
+    .. note::
+        The pending rows are written once :code:`db_batch_insert_size` rows
+        are waiting for a table, at each autosave, at the end of the test
+        and at exit.
+    """
+
+    # Saves the pending rows of each table.
+    # Format: {table_name: {digest: (row, columns to update)}}
+    pending = {}
+    # Saves the process which owns the pending rows.
+    pending_pid = None
+
+    # Serializes the usage of our buffer when we are used from
+    # multiple threads.
+    lock = RLock()
+
+    @classmethod
+    def reset_if_forked(cls):
+        """
+        Forgets the pending rows we inherited from our parent process.
+        They are written by our parent process.
+        """
+
+        with cls.lock:
+            if cls.pending_pid != getpid():
+                cls.pending = {}
+                cls.pending_pid = getpid()
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def get_query(cls, db_type, table_name, columns, update):
+        """
+        Provides the (upsert) query to execute.
+
+        :param str db_type: The database type we are working with.
+        :param str table_name: The table to write into.
+        :param tuple columns: The columns to insert.
+        :param tuple update:
+            The columns to update when the digest is already known.
+
+        :rtype: str
+        """
+
+        query = "INSERT INTO {0} ({1}) VALUES ({2})".format(
+            table_name,
+            ", ".join(columns),
+            ", ".join(f"%({x})s" for x in columns),
+        )
+
+        if db_type == "sqlite":
+            if update:
+                return query + " ON CONFLICT(digest) DO UPDATE SET {0}".format(
+                    ", ".join(f"{x} = excluded.{x}" for x in update)
+                )
+            return query + " ON CONFLICT(digest) DO NOTHING"
+
+        if update:
+            return query + " ON DUPLICATE KEY UPDATE {0}".format(
+                ", ".join(f"{x} = VALUES({x})" for x in update)
+            )
+        return query + " ON DUPLICATE KEY UPDATE digest = digest"
+
+    @classmethod
+    def add(cls, table_name, row, update=()):
+        """
+        Adds the given row to the rows to write.
+
+        :param str table_name: The table to write into.
+        :param dict row: The row to write. It must have a :code:`digest` column.
+        :param update:
+            The columns to update when the digest is already known.
+        :type update: list|tuple
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            if table_name not in cls.pending:
+                cls.pending[table_name] = {}
+
+            cls.pending[table_name][row["digest"]] = (row, tuple(update))
+
+            if (
+                len(cls.pending[table_name])
+                >= PyFunceble.CONFIGURATION.db_batch_insert_size
+            ):
+                cls.flush(table_name)
+
+    @classmethod
+    def get(cls, table_name, digest):
+        """
+        Provides the pending row of the given digest.
+
+        :param str table_name: The table we are working with.
+        :param str digest: The digest of the row.
+
+        :rtype: dict|None
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            try:
+                return cls.pending[table_name][digest][0]
+            except KeyError:
+                return None
+
+    @classmethod
+    def get_pending(cls, table_name):
+        """
+        Provides the pending rows of the given table.
+
+        :param str table_name: The table we are working with.
+
+        :rtype: list
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            if table_name in cls.pending:
+                return [x for x, _ in cls.pending[table_name].values()]
+            return []
+
+    @classmethod
+    def flush(cls, table_name=None):
+        """
+        Writes the pending rows.
+
+        :param str table_name:
+            The table to write. If not given, we write all tables.
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            if table_name:
+                tables = [table_name]
+            else:
+                tables = list(cls.pending)
+
+            for table in tables:
+                rows = cls.pending.pop(table, None)
+
+                if not rows:
+                    continue
+
+                try:
+                    cls.__write(table, rows)
+                except Exception:
+                    # We put the rows back so that we can try again later.
+                    rows.update(cls.pending.get(table, {}))
+                    cls.pending[table] = rows
+                    raise
+
+    @classmethod
+    def __write(cls, table_name, rows):
+        """
+        Writes the given rows into the given table.
+
+        :param str table_name: The table to write into.
+        :param dict rows: The rows to write.
+        """
+
+        groups = {}
+
+        for row, update in rows.values():
+            key = (tuple(row), update)
+
+            if key not in groups:
+                groups[key] = []
+
+            groups[key].append(row)
+
+        batch_size = PyFunceble.CONFIGURATION.db_batch_insert_size
+
+        with PyFunceble.engine.SQL() as connection, connection.cursor() as cursor:
+            for (columns, update), to_write in groups.items():
+                query = cls.get_query(
+                    PyFunceble.CONFIGURATION.db_type, table_name, columns, update
+                )
+
+                for index in range(0, len(to_write), batch_size):
+                    cursor.executemany(query, to_write[index : index + batch_size])
+
+        PyFunceble.LOGGER.info(
+            f"Wrote {len(rows)} rows into the {repr(table_name)} table."
+        )
+
+
+register_at_exit(SQLWriter.flush)
@@ -0,0 +1,447 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the interface for the SQLite database.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import sqlite3
+from atexit import register as register_at_exit
+from calendar import timegm
+from datetime import datetime
+from functools import lru_cache
+from os import getpid
+from re import compile as compile_regex
+from threading import RLock
+from time import time
+
+import PyFunceble
+
+
+def _unix_timestamp(*args):
+    """
+    Provides the :code:`UNIX_TIMESTAMP()` function of MySQL/MariaDB.
+
+    .. note::
+        The SQLite :code:`CURRENT_TIMESTAMP` is in UTC.
+    """
+
+    if not args:
+        return int(time())
+
+    if args[0] is None:
+        return None
+
+    return timegm(datetime.strptime(args[0], "%Y-%m-%d %H:%M:%S").timetuple())
+
+
+def _as_dict(cursor, row):
+    """
+    Provides the given row as a dict, just like the :code:`DictCursor`
+    of PyMySQL.
+    """
+
+    return {x[0]: row[i] for i, x in enumerate(cursor.description)}
+
+
+class SQLiteCursor:
+    """
+    Provides a cursor which understands the (pyformat) queries we write
+    for MySQL/MariaDB.
+
+    :param cursor: The SQLite cursor to wrap.
+    """
+
+    # Saves the regex which matches the named pyformat parameters.
+    named_parameter = compile_regex(r"%\((\w+)\)s")
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cursor.close()
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def translate(cls, query):
+        """
+        Translates the given query into the SQLite (named) parameter style.
+
+        :param str query: The query to translate.
+
+        :rtype: str
+        """
+
+        return (
+            cls.named_parameter.sub(r":\1", query).replace("%s", "?").replace("%%", "%")
+        )
+
+    def execute(self, query, args=None):
+        """
+        Executes the given query.
+
+        :param str query: The query to execute.
+        :param args: The parameters of the query.
+        :type args: dict|tuple|list
+
+        :return: The number of affected rows.
+        :rtype: int
+        """
+
+        self.cursor.execute(self.translate(query), args if args is not None else ())
+
+        return self.cursor.rowcount
+
+    def executemany(self, query, args):
+        """
+        Executes the given query against all given parameters.
+
+        :param str query: The query to execute.
+        :param list args: The list of parameters of the query.
+
+        :return: The number of affected rows.
+        :rtype: int
+        """
+
+        self.cursor.executemany(self.translate(query), args)
+
+        return self.cursor.rowcount
+
+    def fetchone(self):
+        """
+        Fetches the next row.
+
+        :rtype: dict|None
+        """
+
+        return self.cursor.fetchone()
+
+    def fetchmany(self, size=None):
+        """
+        Fetches the next rows.
+
+        :param int size: The maximal number of rows to fetch.
+
+        :rtype: list
+        """
+
+        if size is None:
+            return self.cursor.fetchmany()
+        return self.cursor.fetchmany(size)
+
+    def fetchall(self):
+        """
+        Fetches all (remaining) rows.
+
+        :rtype: list
+        """
+
+        return self.cursor.fetchall()
+
+
+class SQLite:
+    """
+    Provides our way to work with our SQLite database.
+
+    It shares the interface of :class:`~PyFunceble.engine.mysql.MySQL` so that
+    the queries we write for MySQL/MariaDB work the same.
+
+    .. note::
+        We keep one connection per process and commit the changes every
+        :code:`sqlite_batch_size` :code:`with` blocks, at each autosave,
+        at the end of the test and at exit.
+    """
+
+    tables = {
+        "auto_continue": "pyfunceble_auto_continue",
+        "inactive": "pyfunceble_inactive",
+        "mining": "pyfunceble_mining",
+        "whois": "pyfunceble_whois",
+        "tested": "pyfunceble_tested",
+    }
+
+    # The same layout as our db_types/*.sql files.
+    structure = """
+CREATE TABLE IF NOT EXISTS pyfunceble_auto_continue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    status VARCHAR(12) NOT NULL,
+    is_complement TINYINT(1) NOT NULL,
+    digest VARCHAR(64) NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest)
+);
+
+CREATE INDEX IF NOT EXISTS pyfunceble_auto_continue_file_path_subject
+    ON pyfunceble_auto_continue (file_path, subject);
+
+CREATE TABLE IF NOT EXISTS pyfunceble_inactive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    status VARCHAR(12) NOT NULL,
+    digest VARCHAR(64) NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest)
+);
+
+CREATE INDEX IF NOT EXISTS pyfunceble_inactive_file_path_subject
+    ON pyfunceble_inactive (file_path, subject);
+
+CREATE TABLE IF NOT EXISTS pyfunceble_mining (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    mined TEXT NOT NULL,
+    digest VARCHAR(64) NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest)
+);
+
+CREATE INDEX IF NOT EXISTS pyfunceble_mining_file_path_subject
+    ON pyfunceble_mining (file_path, subject);
+
+CREATE TABLE IF NOT EXISTS pyfunceble_whois (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subject TEXT NOT NULL,
+    expiration_date VARCHAR(12) NOT NULL,
+    expiration_date_epoch INTEGER(11) NOT NULL,
+    state VARCHAR(12) NOT NULL,
+    record TEXT NOT NULL,
+    digest VARCHAR(64) NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest)
+);
+
+CREATE INDEX IF NOT EXISTS pyfunceble_whois_subject
+    ON pyfunceble_whois (subject);
+
+CREATE TABLE IF NOT EXISTS pyfunceble_tested (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    digest VARCHAR(64) NOT NULL,
+    tested TEXT NOT NULL,
+    file_path TEXT DEFAULT NULL,
+    _status TEXT DEFAULT NULL,
+    status TEXT DEFAULT NULL,
+    _status_source TEXT DEFAULT NULL,
+    status_source TEXT DEFAULT NULL,
+    domain_syntax_validation TINYINT(1) DEFAULT NULL,
+    expiration_date VARCHAR(12) DEFAULT NULL,
+    http_status_code INT(4) DEFAULT NULL,
+    ipv4_range_syntax_validation TINYINT(1) DEFAULT NULL,
+    ipv4_syntax_validation TINYINT(1) DEFAULT NULL,
+    ipv6_range_syntax_validation TINYINT(1) DEFAULT NULL,
+    ipv6_syntax_validation TINYINT(1) DEFAULT NULL,
+    subdomain_syntax_validation TINYINT(1) DEFAULT NULL,
+    url_syntax_validation TINYINT(1) DEFAULT NULL,
+    whois_server TEXT DEFAULT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest)
+);
+
+CREATE INDEX IF NOT EXISTS pyfunceble_tested_file_path_status
+    ON pyfunceble_tested (file_path, status);
+"""
+
+    # The triggers which update the modified column.
+    trigger = """
+CREATE TRIGGER IF NOT EXISTS {0}_modified
+    AFTER UPDATE ON {0} FOR EACH ROW WHEN NEW.modified <= OLD.modified
+BEGIN
+    UPDATE {0} SET modified = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+"""
+
+    errors = sqlite3.IntegrityError
+
+    # Saves the connection of the current process.
+    connection = None
+    # Saves the process which opened the connection.
+    connection_pid = None
+    # Saves the file the connection was opened against.
+    connection_file = None
+    # Saves the connections we inherited from our parent process. We never
+    # close them as they still belong to our parent.
+    inherited = []
+    # Saves the number of with blocks since the last commit.
+    pending = 0
+
+    # Serializes the usage of our connection when we are used from
+    # multiple threads.
+    lock = RLock()
+
+    def __init__(self):
+        self.authorized = self.authorization()
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS.default_files.sqlite_db
+        )
+
+    def __enter__(self):
+        self.lock.acquire()
+
+        try:
+            self.connect()
+        except Exception:
+            self.lock.release()
+            raise
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            cls = type(self)
+            cls.pending += 1
+
+            if cls.pending >= PyFunceble.CONFIGURATION.sqlite_batch_size:
+                self.commit()
+        finally:
+            self.lock.release()
+
+    @classmethod
+    def authorization(cls):
+        """
+        Provides the authorization to operate.
+        """
+
+        return PyFunceble.CONFIGURATION.db_type == "sqlite"
+
+    def connect(self):
+        """
+        Opens (if needed) the connection of the current process.
+        """
+
+        cls = type(self)
+
+        if (
+            cls.connection is not None
+            and cls.connection_pid == getpid()
+            and cls.connection_file == self.database_file
+        ):
+            return
+
+        if cls.connection is not None:
+            if cls.connection_pid != getpid():
+                # We were forked. The connection belongs to our parent.
+                cls.inherited.append(cls.connection)
+            else:
+                self.commit()
+                cls.connection.close()
+
+        connection = sqlite3.connect(
+            self.database_file, timeout=30, check_same_thread=False
+        )
+        connection.row_factory = _as_dict
+        connection.create_function("UNIX_TIMESTAMP", -1, _unix_timestamp)
+
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+
+        connection.executescript(self.structure)
+
+        for table_name in self.tables.values():
+            connection.executescript(self.trigger.format(table_name))
+
+        cls.connection = connection
+        cls.connection_pid = getpid()
+        cls.connection_file = self.database_file
+        cls.pending = 0
+
+        PyFunceble.LOGGER.info(f"Connected to {repr(self.database_file)}.")
+
+    def cursor(self):
+        """
+        Provides a new cursor.
+
+        :rtype: :class:`~PyFunceble.engine.sqlite.SQLiteCursor`
+        """
+
+        return SQLiteCursor(type(self).connection.cursor())
+
+    @classmethod
+    def commit(cls):
+        """
+        Commits the pending changes of the current process.
+        """
+
+        with cls.lock:
+            if (
+                cls.connection is not None
+                and cls.connection_pid == getpid()
+                and cls.connection.in_transaction
+            ):
+                cls.connection.commit()
+
+                PyFunceble.LOGGER.info(
+                    f"Committed the changes of {cls.pending} transactions."
+                )
+
+            cls.pending = 0
+
+
+register_at_exit(SQLite.commit)
@@ -58,12 +58,35 @@ License:
     SOFTWARE.
 """
 
+from re import compile as re_compile
+from re import match as re_match
+from re import sub as re_sub
+
 import PyFunceble.converter as converter
-import PyFunceble.helpers as helpers
 
 from .base import ExtractorBase
 
 
+def _get_keyword_of(pattern):
+    """
+    Provides the literal text any match of the given pattern starts with.
+
+    :param str pattern: The pattern to work with.
+
+    :rtype: str
+    """
+
+    # We get the leading literal part of the pattern (without the characters
+    # which are made optional by a quantifier) and unescape it.
+    return re_sub(
+        r"\\([^A-Za-z0-9])",
+        r"\1",
+        re_match(
+            r"(?:(?:\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]|()])(?![*?{]))*", pattern
+        ).group(0),
+    )
+
+
 class ExpirationDate(ExtractorBase):
     """
     Provides a way to extract the expiration date from a
@@ -211,6 +234,14 @@ class ExpirationDate(ExtractorBase):
         ],
     }
 
+    # We compile all our regex once, with the keyword we have to find into
+    # a record before (even) trying to run the expiration pattern.
+    compiled_expiration_patterns = [
+        (_get_keyword_of(x), re_compile(x)) for x in expiration_patterns
+    ]
+    compiled_regex_numbers = re_compile(regex_numbers)
+    compiled_regex_dates = [(x, re_compile(y)) for x, y in regex_dates.items()]
+
     def __init__(self, data):
         super().__init__(data)
 
@@ -238,7 +269,7 @@ class ExpirationDate(ExtractorBase):
         :rtype: list|None
         """
 
-        for _, case_data in self.format_cases.items():
+        for case_data in self.format_cases.values():
             if int(index) in case_data[0]:
                 # The regex number is into the currently read case data.
 
@@ -259,12 +290,14 @@ class ExpirationDate(ExtractorBase):
         Formats the given data.
         """
 
-        for index, regex in self.regex_dates.items():
-            matched = helpers.Regex(regex).match(data, return_match=True, rematch=True)
+        for index, regex in self.compiled_regex_dates:
+            matched = regex.search(data)
 
             if not matched:
                 continue
 
+            matched = matched.groups()
+
             date = self.__format_management(index, matched)
 
             if not date:  # pragma: no cover
@@ -279,19 +312,19 @@ class ExpirationDate(ExtractorBase):
         data.
         """
 
-        for regex in self.expiration_patterns:
-            expiration_date = helpers.Regex(regex).match(
-                self.data, return_match=True, rematch=True, group=0
-            )
+        for keyword, regex in self.compiled_expiration_patterns:
+            if keyword not in self.data:
+                # The pattern can't match, we don't even have to try it.
+                continue
+
+            expiration_date = regex.search(self.data)
 
             if not expiration_date:
                 continue
 
-            expiration_date = expiration_date[0].strip()
+            expiration_date = expiration_date.group(1).strip()
 
-            if helpers.Regex(self.regex_numbers).match(
-                expiration_date, return_match=True
-            ):
+            if self.compiled_regex_numbers.search(expiration_date):
                 return self.__format_it(expiration_date)
 
         return None
@@ -58,13 +58,164 @@ License:
     SOFTWARE.
 """
 
-from json import decoder, dump, dumps, loads
+from collections.abc import Mapping
+from json import JSONDecoder, dump, dumps, loads
+from re import compile as compile_regex
 
 from yaml import dump as yaml_dump
 from yaml import safe_load as yaml_load
 
 from .file import File
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+class JSONObjectStream:
+    """
+    Reads the (nested) objects of a JSON stream, chunk by chunk.
+
+    :param file_stream: The (text) stream to read.
+    :param int chunk_size: The minimal number of characters to read at once.
+    """
+
+    whitespaces = compile_regex(r"[ \t\n\r]*")
+
+    def __init__(self, file_stream, chunk_size=1024 * 1024):
+        self.file_stream = file_stream
+        self.chunk_size = chunk_size
+
+        # Note: This is the (C) scanner behind JSONDecoder.raw_decode.
+        self.scan_once = JSONDecoder().scan_once
+        self.buffer = ""
+        self.position = 0
+
+    def read_more(self):
+        """
+        Reads the next chunk of the stream.
+
+        .. note::
+            We read at least as much as what we still have in memory. That way,
+            a (huge) value is never decoded more than twice in average.
+
+        :return: :code:`False` if we reached the end of the stream.
+        :rtype: bool
+        """
+
+        chunk = self.file_stream.read(
+            max(self.chunk_size, len(self.buffer) - self.position)
+        )
+
+        if not chunk:
+            return False
+
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+        return True
+
+    def peek(self):
+        """
+        Skips the whitespaces and provides the next character.
+
+        :return: The next character. An empty string at the end of the stream.
+        :rtype: str
+        """
+
+        while True:
+            if (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] not in " \t\n\r"
+            ):
+                # Compact JSON, nothing to skip.
+                return self.buffer[self.position]
+
+            self.position = self.whitespaces.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.read_more():
+                return ""
+
+    def expect(self, char):
+        """
+        Skips the given character.
+
+        :raise ValueError: When the next character is not the given one.
+        """
+
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r}, got {self.peek()!r}.")
+
+        self.position += 1
+
+    def decode(self):
+        """
+        Decodes the next value.
+        """
+
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.scan_once(self.buffer, self.position)
+            except (StopIteration, ValueError) as exception:
+                if not self.read_more():
+                    raise ValueError(
+                        f"Could not decode at {self.position}."
+                    ) from exception
+
+                continue
+
+            if end == len(self.buffer) and self.read_more():
+                # The value may continue into the next chunk (a number for example).
+                continue
+
+            self.position = end
+
+            return value
+
+    def get_items(self, depth, keys=()):
+        """
+        Provides the :code:`(keys, value)` of the object we are reading.
+        We go through the nested objects until the given depth.
+
+        :param int depth: The depth of the values to provide.
+        :param tuple keys: The keys of the object we are reading.
+        """
+
+        self.expect("{")
+
+        if self.peek() == "}":
+            self.position += 1
+            return
+
+        while True:
+            key = self.decode()
+            self.expect(":")
+
+            if len(keys) + 1 < depth and self.peek() == "{":
+                yield from self.get_items(depth, keys + (key,))
+            else:
+                yield keys + (key,), self.decode()
+
+            char = self.peek()
+            self.position += 1
+
+            if char == "}":
+                return
+
+            if char != ",":
+                raise ValueError(f"Expected ',' or '}}', got {char!r}.")
+
 
 class Dict:
     """
@@ -212,6 +363,38 @@ class Dict:
         # We return None.
         return None
 
+    @classmethod
+    def to_json_default(cls, obj):
+        """
+        Provides the JSON serializable version of the given object.
+
+        .. note::
+            This is given to the JSON encoder so that we can serialize
+            the mappings which are not a :code:`dict` (our compact
+            database records for example).
+
+        :raise TypeError: When the given object can't be serialized.
+        """
+
+        if isinstance(obj, Mapping):
+            return dict(obj)
+
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def __to_json_bytes(self, sort_keys=True):
+        """
+        Converts the given :code:`dict` to compact JSON with :code:`orjson`.
+
+        :rtype: bytes
+        """
+
+        options = orjson.OPT_NON_STR_KEYS
+
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+
+        return orjson.dumps(self.main, default=self.to_json_default, option=options)
+
     def to_json_file(
         self, file_path, ensure_ascii=False, indent=4, sort_keys=True, encoding="utf-8",
     ):
@@ -221,18 +404,41 @@ class Dict:
 
         :param str file_path: The file path.
         :param bool ensure_ascii: Avoids unicode.
-        :param int indent: The indentation to apply.
+        :param int indent:
+            The indentation to apply.
+
+            .. note::
+                If :code:`None` is given, we write a compact JSON.
+                That's what we do for our internal databases.
         :param bool sortkeys: Sorts the keys.
         """
 
-        with open(file_path, "w", encoding=encoding) as file_stream:
-            dump(
-                self.main,
-                file_stream,
-                ensure_ascii=ensure_ascii,
-                indent=indent,
-                sort_keys=sort_keys,
-            )
+        if (
+            indent is None
+            and not ensure_ascii
+            and orjson is not None
+            and encoding.lower().replace("-", "") == "utf8"
+        ):
+            with open(file_path, "wb") as file_stream:
+                file_stream.write(self.__to_json_bytes(sort_keys=sort_keys))
+        elif indent is None:
+            # Note: Unlike dump(), dumps() uses the C encoder (if available).
+            with open(file_path, "w", encoding=encoding) as file_stream:
+                file_stream.write(
+                    self.to_json(
+                        ensure_ascii=ensure_ascii, indent=indent, sort_keys=sort_keys
+                    )
+                )
+        else:
+            with open(file_path, "w", encoding=encoding) as file_stream:
+                dump(
+                    self.main,
+                    file_stream,
+                    ensure_ascii=ensure_ascii,
+                    indent=indent,
+                    sort_keys=sort_keys,
+                    default=self.to_json_default,
+                )
 
     @classmethod
     def from_json_file(cls, file_path, encoding="utf-8", return_dict_on_error=True):
@@ -246,24 +452,67 @@ class Dict:
         :rtype: dict|list
         """
 
-        try:
-            return loads(File(file_path=file_path).read(encoding=encoding))
-        except (decoder.JSONDecodeError, TypeError):  # pragma: no cover
-            return None if not return_dict_on_error else {}
+        return cls.from_json(
+            File(file_path=file_path).read(encoding=encoding),
+            return_dict_on_error=return_dict_on_error,
+        )
+
+    @classmethod
+    def iter_json_file(cls, file_path, depth=1, encoding="utf-8"):
+        """
+        Reads the given file path chunk by chunk and provides the
+        values which are at the given depth of its (nested) objects.
+
+        As example, with a depth of 2,
+        :code:`{"hello.list": {"example.org": {}, "example.net": {}}}`
+        is provided as :code:`(("hello.list", "example.org"), {})`
+        and :code:`(("hello.list", "example.net"), {})`.
+
+        .. note::
+            Unlike :code:`from_json_file`, we never hold the whole file
+            in memory. We stop silently at the first decoding error.
+
+        :param str file_path: The file path.
+        :param int depth: The depth of the values to provide.
+
+        :return: The keys (tuple) and value of each item.
+        :rtype: generator
+        """
+
+        with open(file_path, "r", encoding=encoding) as file_stream:
+            stream = JSONObjectStream(file_stream)
+
+            try:
+                if stream.peek() == "{":
+                    yield from stream.get_items(depth)
+                else:
+                    yield (), stream.decode()
+            except ValueError:  # pragma: no cover
+                return
 
     def to_json(self, ensure_ascii=False, indent=4, sort_keys=True):
         """
         Converts a given dict to JSON and return the json string.
 
         :param bool ensure_ascii: Avoids unicode.
-        :param int indent: The indentation to apply.
+        :param int indent:
+            The indentation to apply. If :code:`None` is given,
+            we provide a compact JSON.
         :param sort_keys: Sort the keys.
 
         :rtype: str
         """
 
+        if indent is None and not ensure_ascii and orjson is not None:
+            return self.__to_json_bytes(sort_keys=sort_keys).decode("utf-8")
+
         return dumps(
-            self.main, ensure_ascii=ensure_ascii, indent=indent, sort_keys=sort_keys,
+            self.main,
+            ensure_ascii=ensure_ascii,
+            indent=indent,
+            sort_keys=sort_keys,
+            default=self.to_json_default,
+            separators=(",", ":") if indent is None else None,
         )
 
     @classmethod
@@ -271,14 +520,23 @@ class Dict:
         """
         Converts a given JSON string to dict/list.
 
+        .. note::
+            We use :code:`orjson` or :code:`ujson` when they are installed.
+
         :param bool return_dict_on_error: Return a dict instead of a NoneType.
 
         :rtype: dict|list
         """
 
         try:
+            if orjson is not None:
+                return orjson.loads(json_str)
+
+            if ujson is not None:  # pragma: no cover
+                return ujson.loads(json_str)
+
             return loads(json_str)
-        except (decoder.JSONDecodeError, TypeError):  # pragma: no cover
+        except (ValueError, TypeError):  # pragma: no cover
             return None if not return_dict_on_error else {}
 
     @classmethod
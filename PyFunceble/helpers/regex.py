@@ -58,9 +58,27 @@ License:
     SOFTWARE.
 """
 
+from functools import lru_cache
 from re import compile as re_compile
 from re import escape as re_escape
-from re import sub as re_sub
+
+
+@lru_cache(maxsize=1024)
+def get_compiled(regex, flags=0):
+    """
+    Provides the compiled version of the given regex.
+
+    .. note::
+        The compiled regex are kept into a bounded (LRU) cache
+        so that we compile each of them only once.
+
+    :param str regex: The regex to compile.
+    :param int flags: The flags to compile the regex with.
+
+    :rtype: :class:`re.Pattern`
+    """
+
+    return re_compile(regex, flags)
 
 
 class Regex:
@@ -69,21 +87,34 @@ class Regex:
 
     :param str regex: The regex to use.
     :param bool escape: Escapes the given regex.
+    :param int flags: The flags to compile the regex with.
     """
 
-    def __init__(self, regex, escape=False):
+    def __init__(self, regex, escape=False, flags=0):
         if escape:
             self.regex = re_escape(regex)
         else:
             self.regex = regex
 
+        self.flags = flags
+
+    @property
+    def compiled(self):
+        """
+        Provides the compiled version of our regex.
+
+        :rtype: :class:`re.Pattern`
+        """
+
+        return get_compiled(self.regex, self.flags)
+
     def get_not_matching_list(self, data):
         """
         Returns the strings which does not the match the regex
         in the given data.
         """
 
-        pre_result = re_compile(self.regex)
+        pre_result = self.compiled
 
         return [x for x in data if not pre_result.search(str(x))]
 
@@ -93,7 +124,7 @@ class Regex:
         in the given data.
         """
 
-        pre_result = re_compile(self.regex)
+        pre_result = self.compiled
 
         return [x for x in data if pre_result.search(str(x))]
 
@@ -111,15 +142,21 @@ class Regex:
         :param bool return_match:
             Return the part that match the given regex string.
         """
+
+        to_match = self.compiled
+
+        if not return_match:
+            # We only have to know if there is a match.
+            return to_match.search(data) is not None
+
         result = []
-        to_match = re_compile(self.regex)
 
         if rematch:
             pre_result = to_match.findall(data)
         else:
             pre_result = to_match.search(data)
 
-        if return_match and pre_result:
+        if pre_result:
             if rematch:
                 for res in pre_result:
                     if isinstance(res, tuple):
@@ -134,8 +171,6 @@ class Regex:
 
             return result
 
-        if not return_match and pre_result:
-            return True
         return False
 
     def replace_match(self, data, replacement, occurences=0):
@@ -155,5 +190,34 @@ class Regex:
         """
 
         if replacement:
-            return re_sub(self.regex, replacement, data, occurences)
+            return self.compiled.sub(replacement, data, occurences)
         return data
+
+    def fullmatch(self, data):
+        """
+        Checks if the whole given data match the regex string.
+
+        :param str data: The data to work with.
+
+        :rtype: bool
+        """
+
+        return self.compiled.fullmatch(data) is not None
+
+    def sub(self, data, replacement, occurences=0):
+        """
+        Replaces the string which match the regex string with
+        the given replacement - even if the replacement is empty.
+
+        :param str data: The data to work with.
+        :param str replacement: The replacement of the matched regex.
+        :param int occurences:
+            The number of occurences to replace.
+
+            .. note::
+                :code:`0` means all occurences.
+
+        :rtype: str
+        """
+
+        return self.compiled.sub(replacement, data, occurences)
@@ -58,7 +58,10 @@ License:
     SOFTWARE.
 """
 
+from .cache import LookupCache
 from .dns import DNSLookup as Dns
+from .dns_cache import DNSCache
+from .dns_query_pool import DNSQueryPool
 from .http_code import HTTPCode
 from .iana import Iana
 from .ipv4_reputation import IPv4Reputation
@@ -66,3 +69,4 @@ from .publicsuffix import PublicSuffix
 from .referer import Referer
 from .requests import Requests
 from .whois import WhoisLookup as Whois
+from .whois_scheduler import WhoisScheduler
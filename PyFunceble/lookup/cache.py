@@ -0,0 +1,188 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the cache of our lookup interfaces.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LookupCache:
+    """
+    Provides a bounded (LRU) cache of lookup results.
+
+    Each entry lives as long as the TTL it was given.
+
+    :param int maximal_size:
+        The maximal number of entries to keep.
+        When reached, the least recently used entry is dropped.
+    """
+
+    def __init__(self, maximal_size=10000):
+        self.maximal_size = maximal_size
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return self.get(key, count=False) is not None
+
+    def get(self, key, count=True):
+        """
+        Provides the cached entry of the given key.
+
+        :param tuple key: The key to look for.
+        :param bool count: Let us know if we have to update the counters.
+
+        :return:
+            The cached entry, :code:`None` if it is not (or not anymore) cached.
+        """
+
+        with self.__lock:
+            try:
+                expiration, value = self.__entries[key]
+            except KeyError:
+                if count:
+                    self.misses += 1
+                return None
+
+            if expiration <= monotonic():
+                # The TTL is over, we drop the entry.
+                del self.__entries[key]
+
+                if count:
+                    self.misses += 1
+                return None
+
+            # We mark the entry as the most recently used one.
+            self.__entries.move_to_end(key)
+
+            if count:
+                self.hits += 1
+            return value
+
+    def set(self, key, value, ttl):
+        """
+        Saves the given value into the cache.
+
+        :param tuple key: The key to save the value under.
+        :param value: The value to save.
+        :param int ttl: The number of seconds the entry is valid for.
+        """
+
+        if not ttl or ttl <= 0 or not self.maximal_size:
+            return
+
+        with self.__lock:
+            self.__entries[key] = (monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.maximal_size:
+                # We drop the least recently used entry.
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maximal_size):
+        """
+        Updates the maximal size of the cache.
+
+        :param int maximal_size: The new maximal size.
+        """
+
+        with self.__lock:
+            self.maximal_size = maximal_size
+
+            while len(self.__entries) > self.maximal_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Provides the statistics of the cache.
+
+        :rtype: dict
+        """
+
+        with self.__lock:
+            return {
+                "size": len(self.__entries),
+                "maximal_size": self.maximal_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -59,6 +59,7 @@ License:
 """
 
 from socket import IPPROTO_TCP, gaierror, getaddrinfo, gethostbyaddr, herror
+from time import monotonic
 
 import dns.resolver
 import dns.reversename
@@ -66,6 +67,9 @@ from dns.exception import DNSException
 
 import PyFunceble
 
+from .dns_cache import DNSCache
+from .dns_query_pool import DNSQueryPool
+
 
 class DNSLookup:  # pylint: disable=too-few-public-methods
     """
@@ -75,14 +79,27 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
     :param dns_server: The DNS server we are working with.
     :type dns_server: list|tuple|str
     :param int lifetime: Set the lifetime of a query.
+    :param int cache_size:
+        The maximal number of answers to keep into the (process wide)
+        DNS cache. :code:`None` or :code:`0` means no cache.
+    :param int negative_ttl:
+        The number of seconds to keep a negative answer into the cache
+        when the nameserver does not give us a SOA record.
     """
 
-    def __init__(self, dns_server=None, lifetime=3, tcp=False):
+    # The cache shared by all instances of the current process.
+    shared_cache = None
+
+    def __init__(
+        self, dns_server=None, lifetime=3, tcp=False, cache_size=None, negative_ttl=300
+    ):
         self.given_dns_server = dns_server
         self.resolver = self.__get_resolver(dns_server)
+        self.cache = None
 
         self.update_nameserver(dns_server)
         self.update_lifetime(lifetime)
+        self.update_cache(cache_size, negative_ttl=negative_ttl)
         self.tcp = tcp
 
         PyFunceble.LOGGER.debug(
@@ -99,6 +116,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         PyFunceble.INTERN["dns_lookup"] = {
             "resolver": self.resolver,
             "given_dns_server": dns_server,
+            "cache": self.cache,
         }
 
     @classmethod
@@ -169,6 +187,42 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
                 f"Switched Resolver nameserver port to: {self.resolver.nameserver_ports}"
             )
 
+    def update_cache(self, maximal_size, negative_ttl=300):
+        """
+        Updates (or deactivates) the DNS cache.
+
+        :param int maximal_size:
+            The maximal number of answers to keep.
+            :code:`None` or :code:`0` deactivates the cache.
+        :param int negative_ttl:
+            The number of seconds to keep a negative answer when the
+            nameserver does not give us a SOA record.
+        """
+
+        if not isinstance(negative_ttl, int) or negative_ttl < 0:
+            negative_ttl = 300
+
+        if not isinstance(maximal_size, int) or maximal_size < 1:
+            self.cache = None
+
+            PyFunceble.LOGGER.info("DNS cache deactivated.")
+            return
+
+        if self.shared_cache is None:
+            DNSLookup.shared_cache = DNSCache(
+                maximal_size=maximal_size, negative_ttl=negative_ttl
+            )
+        else:
+            self.shared_cache.resize(maximal_size)
+            self.shared_cache.negative_ttl = negative_ttl
+
+        self.cache = self.shared_cache
+
+        PyFunceble.LOGGER.info(
+            f"DNS cache activated. Maximal size: {maximal_size} | "
+            f"Negative TTL: {negative_ttl}"
+        )
+
     def __get_server_and_port_from(self, inputed_dns):  # pragma: no cover
         """
         Given a list or an input representing dns server,
@@ -237,6 +291,28 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         return result
 
+    def __query(self, subject, record_type, tcp):
+        """
+        Query the given record type of the given subject.
+
+        When the cache is activated, we first look into it and save
+        the answer (positive or negative) for as long as its TTL allows us.
+
+        :param subject: The subject we are working with.
+        :type subject: str, :class:`dns.name.Name`
+        :param str record_type: The record type to query.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return: A list of record(s).
+        :rtype: list
+        :raise DNSException: When the query could not be answered.
+        """
+
+        if self.cache is None:
+            return [str(x) for x in self.resolver.query(subject, record_type, tcp=tcp)]
+
+        return self.cache.resolve(self.resolver, subject, record_type, tcp=tcp)
+
     def a_record(self, subject, tcp=None):
         """
         Return the A record of the given subject (if found).
@@ -260,7 +336,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting A record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "A", tcp=tcp)]
+            result = self.__query(subject, "A", tcp)
             PyFunceble.LOGGER.info(f"Could get A record of {repr(subject)}: {result}")
 
             return result
@@ -292,7 +368,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting AAAA record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "AAAA", tcp=tcp)]
+            result = self.__query(subject, "AAAA", tcp)
             PyFunceble.LOGGER.info(
                 f"Could get AAAA record of {repr(subject)}: {result}"
             )
@@ -326,7 +402,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting CNAME record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "CNAME", tcp=tcp)]
+            result = self.__query(subject, "CNAME", tcp)
             PyFunceble.LOGGER.info(
                 f"Could get CNAME record of {repr(subject)}: {result}"
             )
@@ -360,7 +436,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting DNAME record of {repr(subject)}")
             # We get the A record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "DNAME", tcp=tcp)]
+            result = self.__query(subject, "DNAME", tcp)
             PyFunceble.LOGGER.info(
                 f"Could get DNAME record of {repr(subject)}: {result}"
             )
@@ -393,7 +469,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting MX record of {repr(subject)}")
             # We get the MX record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "MX", tcp=tcp)]
+            result = self.__query(subject, "MX", tcp)
 
             PyFunceble.LOGGER.info(f"Could get MX record of {repr(subject)}: {result}")
 
@@ -426,7 +502,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting NS record of {repr(subject)}")
             # We get the NS record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "NS", tcp=tcp)]
+            result = self.__query(subject, "NS", tcp)
             PyFunceble.LOGGER.info(f"Could get NS record of {repr(subject)}: {result}")
 
             return result
@@ -458,7 +534,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         try:
             PyFunceble.LOGGER.info(f"Getting TXT record of {repr(subject)}")
             # We get the TXT record of the given subject.
-            result = [str(x) for x in self.resolver.query(subject, "TXT", tcp=tcp)]
+            result = self.__query(subject, "TXT", tcp)
             PyFunceble.LOGGER.info(f"Could get TXT record of {repr(subject)}: {result}")
 
             return result
@@ -496,7 +572,7 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
                 to_request = subject
 
             # We get the PTR record of the currently read A record.
-            result = [str(x) for x in self.resolver.query(to_request, "PTR", tcp=tcp)]
+            result = self.__query(to_request, "PTR", tcp)
             PyFunceble.LOGGER.info(f"Could get PTR record of {repr(subject)}: {result}")
 
             return result
@@ -603,54 +679,80 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         PyFunceble.LOGGER.debug(f"{to_check} record is not in result:\n{result}")
         return False
 
-    def __request_complete_not_ip(self, subject, tcp=None):  # pragma: no cover
+    def __query_concurrently(self, queries, tcp=None, deadline=None):
         """
-        Requests and provides the complete DNS spectrum.
+        Runs the given queries concurrently.
 
+        :param dict queries:
+            The queries to run. Formatted as :code:`{index: (method, subject)}`.
+        :param bool tcp: Tell us to use TCP for query.
+        :param float deadline:
+            The (monotonic) time after which we stop waiting for answers.
+            Queries which are not answered by then are given as :code:`None`.
+
+        :return: The result of each query, under its index.
         :rtype: dict
         """
 
-        result = {}
+        if deadline is None:
+            deadline = monotonic() + self.resolver.lifetime
 
-        # We get the A record of the given subject.
-        result["A"] = self.a_record(subject, tcp=tcp)
+        return DNSQueryPool.query_concurrently(queries, deadline, tcp=tcp)
 
-        # We get the AAAA record of the given subject.
-        result["AAAA"] = self.aaaa_record(subject, tcp=tcp)
+    def __request_complete_not_ip(
+        self, subject, tcp=None, deadline=None
+    ):  # pragma: no cover
+        """
+        Requests and provides the complete DNS spectrum.
 
-        # We get the CNAME record of the given subject.
-        result["CNAME"] = self.cname_record(subject, tcp=tcp)
+        All records are requested concurrently and within a single deadline.
+        The PTR records are then requested (concurrently) for each A record
+        within what is left of the same deadline.
 
-        # We get the DNAME record of the given subject.
-        result["DNAME"] = self.dname_record(subject, tcp=tcp)
+        :param float deadline:
+            The (monotonic) time after which we stop waiting for answers.
 
-        # We get the MX record of the given subject.
-        result["MX"] = self.mx_record(subject, tcp=tcp)
+        :rtype: dict
+        """
 
-        # We get the TXT record of the given subject.
-        result["TXT"] = self.txt_record(subject, tcp=tcp)
+        if deadline is None:
+            deadline = monotonic() + self.resolver.lifetime
+
+        result = self.__query_concurrently(
+            {
+                "NS": (self.ns_record, subject),
+                "A": (self.a_record, subject),
+                "AAAA": (self.aaaa_record, subject),
+                "CNAME": (self.cname_record, subject),
+                "DNAME": (self.dname_record, subject),
+                "MX": (self.mx_record, subject),
+                "TXT": (self.txt_record, subject),
+            },
+            tcp=tcp,
+            deadline=deadline,
+        )
 
         if self.is_record_present_in_result("A", result):
             # We could get some A record(s).
 
-            # We initiate the PTR.
-            result["PTR"] = []
-
-            for a_result in result["A"]:
-                # We loop through the list of A records.
-
-                if "." not in a_result:  # pragma: no cover
-                    # There is no "." in the currently
-                    # read A record.
-
-                    # We continue the loop.
-                    continue
+            # We get the PTR record of each A record which has a "." in it.
+            ptr_results = self.__query_concurrently(
+                {
+                    a_result: (self.ptr_record, a_result)
+                    for a_result in result["A"]
+                    if "." in a_result
+                },
+                tcp=tcp,
+                deadline=deadline,
+            )
 
-                try:
-                    # We get the PTR record of the currently read A record.
-                    result["PTR"].extend(self.ptr_record(a_result, tcp=tcp))
-                except TypeError:  # pragma: no cover
-                    pass
+            # We initiate the PTR.
+            result["PTR"] = [
+                x
+                for a_result in result["A"]
+                if ptr_results.get(a_result)
+                for x in ptr_results[a_result]
+            ]
 
             if not all(result["PTR"]):  # pragma: no cover
                 # No PTR record was found.
@@ -676,33 +778,42 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         PyFunceble.LOGGER.debug(f"{repr(subject)} is not IP. Requesting record.")
 
-        result = {}
-
-        # We get the NS record of the given subject.
-        result["NS"] = self.ns_record(subject, tcp=tcp)
-
         if complete:  # pragma: no cover
-            result = PyFunceble.helpers.Merge(
-                self.__request_complete_not_ip(subject, tcp=tcp)
-            ).into(result)
+            # All our queries share the same deadline.
+            result = self.__request_complete_not_ip(
+                subject, tcp=tcp, deadline=monotonic() + self.resolver.lifetime
+            )
+        else:
+            result = {}
 
-        if not self.is_record_present_in_result(["CNAME", "NS"], result):
-            # As sometime we may not have a NS but a CNAME, we handle that case.
-            result["CNAME"] = self.cname_record(subject, tcp=tcp)
+            # We get the NS record of the given subject.
+            result["NS"] = self.ns_record(subject, tcp=tcp)
+
+            if not self.is_record_present_in_result("NS", result):
+                # As sometime we may not have a NS but a CNAME, DNAME, A or AAAA,
+                # we request all of them at once.
+                #
+                # Note: The deadline of the fallbacks only starts now so that
+                # a timed out NS query does not consume it.
+                deadline = monotonic() + self.resolver.lifetime
 
-        if not self.is_record_present_in_result(["CNAME", "DNAME", "NS"], result):
-            # Same but with DNAME.
-            result["DNAME"] = self.dname_record(subject, tcp=tcp)
+                fallbacks = self.__query_concurrently(
+                    {
+                        "CNAME": (self.cname_record, subject),
+                        "DNAME": (self.dname_record, subject),
+                        "A": (self.a_record, subject),
+                        "AAAA": (self.aaaa_record, subject),
+                    },
+                    tcp=tcp,
+                    deadline=deadline,
+                )
 
-        if not self.is_record_present_in_result(["A", "CNAME", "DNAME", "NS"], result):
-            # Same but with A.
-            result["A"] = self.a_record(subject, tcp=tcp)
+                for index in ["CNAME", "DNAME", "A", "AAAA"]:
+                    # We only keep the first record in order of preference.
+                    result[index] = fallbacks[index]
 
-        if not self.is_record_present_in_result(
-            ["A", "AAAA", "CNAME", "DNAME", "NS"], result
-        ):
-            # Same but with A.
-            result["AAAA"] = self.aaaa_record(subject, tcp=tcp)
+                    if result[index]:
+                        break
 
         # We get the list of index to delete.
         to_delete = [x for x in result if not result[x]]
@@ -839,3 +950,29 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
                 result.update(temp_result)
 
         return result
+
+    def request_many(
+        self, subjects, complete=False, concurrency=None, tcp=None
+    ):  # pragma: no cover
+        """
+        Perform the DNS lookup of many subjects concurrently.
+
+        .. seealso::
+            :meth:`PyFunceble.lookup.dns_query_pool.DNSQueryPool.request_many`
+
+        :param subjects: The subjects we are working with.
+        :type subjects: list, tuple, generator
+        :param bool complete: Tell us to return as many result as possible.
+        :param int concurrency: The maximal number of concurrent lookups.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return:
+            A generator of :code:`(subject, result)` in the order the lookups
+            are finished. The results are in the format given by :meth:`request`.
+        :rtype: generator
+        :raise ValueError: When a non integer or a negative :code:`concurrency` is given.
+        """
+
+        return DNSQueryPool.request_many(
+            self, subjects, complete=complete, concurrency=concurrency, tcp=tcp
+        )
@@ -0,0 +1,171 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the DNS answers cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import dns.rdatatype
+import dns.resolver
+
+import PyFunceble
+
+from .cache import LookupCache
+
+
+class DNSCache(LookupCache):
+    """
+    Provides a bounded (LRU) cache of DNS answers.
+
+    Each entry is stored under a :code:`(name, record type, nameservers)`
+    key and lives as long as the TTL it was given.
+
+    :param int maximal_size:
+        The maximal number of entries to keep.
+        When reached, the least recently used entry is dropped.
+    :param int negative_ttl:
+        The TTL to apply to a negative answer (NXDOMAIN, NoAnswer)
+        when the authority section does not give us any SOA record.
+    """
+
+    def __init__(self, maximal_size=10000, negative_ttl=300):
+        super().__init__(maximal_size=maximal_size)
+
+        self.negative_ttl = negative_ttl
+
+    def get_negative_ttl(self, exception):
+        """
+        Provides the TTL of a negative answer.
+
+        As stated by the RFC 2308, we use the minimum between the TTL
+        and the :code:`MINIMUM` field of the SOA record given into
+        the authority section.
+
+        :param exception: The NXDOMAIN or NoAnswer exception we got.
+        :type exception: :class:`dns.resolver.NXDOMAIN`, :class:`dns.resolver.NoAnswer`
+
+        :rtype: int
+        """
+
+        if isinstance(exception, dns.resolver.NXDOMAIN):
+            responses = list(exception.kwargs.get("responses", {}).values())
+        else:
+            responses = [exception.kwargs.get("response")]
+
+        ttls = [
+            min(rrset.ttl, rrset[0].minimum)
+            for response in responses
+            if response is not None
+            for rrset in response.authority
+            if rrset.rdtype == dns.rdatatype.SOA and rrset
+        ]
+
+        if ttls:
+            return min(ttls)
+
+        return self.negative_ttl
+
+    def resolve(self, resolver, subject, record_type, tcp=False):
+        """
+        Query the given record type of the given subject through the cache.
+
+        We first look into the cache and save the answer (positive or negative)
+        for as long as its TTL allows us.
+
+        :param resolver: The resolver to query when the cache can't answer.
+        :type resolver: :class:`dns.resolver.Resolver`
+        :param subject: The subject we are working with.
+        :type subject: str, :class:`dns.name.Name`
+        :param str record_type: The record type to query.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return: A list of record(s).
+        :rtype: list
+        :raise DNSException: When the query could not be answered.
+        """
+
+        key = (
+            str(subject).rstrip(".").lower(),
+            record_type,
+            tuple(sorted(resolver.nameservers)),
+        )
+        cached = self.get(key)
+
+        if isinstance(cached, list):
+            PyFunceble.LOGGER.debug(
+                f"{record_type} record of {repr(subject)} given by the cache."
+            )
+            return list(cached)
+
+        if cached is not None:
+            PyFunceble.LOGGER.debug(
+                f"Negative {record_type} answer of {repr(subject)} given by the cache."
+            )
+            # We raise the cached negative answer again.
+            raise cached()
+
+        try:
+            answer = resolver.query(subject, record_type, tcp=tcp)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as exception:
+            self.set(key, type(exception), self.get_negative_ttl(exception))
+            raise
+
+        result = [str(x) for x in answer]
+
+        if answer.rrset is not None:
+            self.set(key, result, answer.rrset.ttl)
+
+        return list(result)
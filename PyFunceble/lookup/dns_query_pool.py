@@ -0,0 +1,256 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the pool of threads which runs our DNS queries concurrently.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from copy import copy
+from itertools import islice
+from os import getpid
+from threading import RLock
+from time import monotonic
+
+import PyFunceble
+
+
+class DNSQueryPool:
+    """
+    Provides the pool of threads which runs our DNS queries concurrently.
+
+    The pool is shared by all lookup interfaces of the current process.
+    """
+
+    # The pool of threads of the current process.
+    executor = None
+    # Saves the process which owns the pool.
+    executor_pid = None
+    # Serializes the creation of our pool.
+    executor_lock = RLock()
+    # The maximal number of queries to run at the same time.
+    maximal_concurrent_queries = 64
+
+    @classmethod
+    def get_executor(cls):
+        """
+        Provides the pool of threads of the current process.
+
+        .. note::
+            The threads of our parent process are not inherited
+            so we start a new pool after a fork.
+
+        :rtype: ThreadPoolExecutor
+        """
+
+        with cls.executor_lock:
+            if cls.executor is None or cls.executor_pid != getpid():
+                cls.executor = ThreadPoolExecutor(
+                    max_workers=cls.maximal_concurrent_queries,
+                    thread_name_prefix="PyFunceble-DNS",
+                )
+                cls.executor_pid = getpid()
+
+            return cls.executor
+
+    @classmethod
+    def query_concurrently(cls, queries, deadline, tcp=None):
+        """
+        Runs the given queries concurrently.
+
+        :param dict queries:
+            The queries to run. Formatted as :code:`{index: (method, subject)}`.
+        :param float deadline:
+            The (monotonic) time after which we stop waiting for answers.
+            Queries which are not answered by then are given as :code:`None`.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return: The result of each query, under its index.
+        :rtype: dict
+        """
+
+        if not queries:
+            return {}
+
+        executor = cls.get_executor()
+
+        futures = {
+            index: executor.submit(method, subject, tcp=tcp)
+            for index, (method, subject) in queries.items()
+        }
+
+        wait_for_futures(list(futures.values()), timeout=max(0, deadline - monotonic()))
+
+        result = {}
+
+        for index, future in futures.items():
+            if future.done() and not future.cancelled():
+                result[index] = future.result()
+            else:
+                future.cancel()
+
+                PyFunceble.LOGGER.error(
+                    f"Deadline reached while querying {repr(index)} "
+                    f"of {repr(queries[index][1])}"
+                )
+                result[index] = None
+
+        return result
+
+    @classmethod
+    def get_round_robin_lookups(cls, lookup):
+        """
+        Provides one lookup interface per nameserver. Each of them
+        starts its resolution with a different nameserver.
+
+        :param lookup: The lookup interface to start from.
+        :type lookup: :class:`PyFunceble.lookup.dns.DNSLookup`
+
+        :rtype: list
+        """
+
+        nameservers = list(lookup.resolver.nameservers)
+
+        if len(nameservers) < 2:
+            return [lookup]
+
+        result = []
+
+        for index in range(len(nameservers)):
+            round_robin_lookup = copy(lookup)
+            round_robin_lookup.resolver = copy(lookup.resolver)
+            round_robin_lookup.resolver.nameservers = (
+                nameservers[index:] + nameservers[:index]
+            )
+
+            result.append(round_robin_lookup)
+
+        return result
+
+    @classmethod
+    def request_many(
+        cls, lookup, subjects, complete=False, concurrency=None, tcp=None
+    ):  # pragma: no cover
+        """
+        Perform the DNS lookup of many subjects concurrently.
+
+        The subjects are distributed (round-robin) between the configured
+        nameservers so that each of them gets its share of first queries.
+
+        :param lookup: The lookup interface to work with.
+        :type lookup: :class:`PyFunceble.lookup.dns.DNSLookup`
+        :param subjects: The subjects we are working with.
+        :type subjects: list, tuple, generator
+        :param bool complete: Tell us to return as many result as possible.
+        :param int concurrency: The maximal number of concurrent lookups.
+        :param bool tcp: Tell us to use TCP for query.
+
+        :return:
+            A generator of :code:`(subject, result)` in the order the lookups
+            are finished. The results are in the format given by
+            :meth:`PyFunceble.lookup.dns.DNSLookup.request`.
+        :rtype: generator
+        :raise ValueError: When a non integer or a negative :code:`concurrency` is given.
+        """
+
+        if concurrency is None:
+            concurrency = 10
+        elif not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError(f"<concurrency> must be of type {int} and >= 1.")
+
+        if tcp is None:
+            tcp = lookup.tcp
+
+        lookups = cls.get_round_robin_lookups(lookup)
+        subjects = iter(enumerate(subjects))
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = {}
+
+        def submit(number_of_subjects):
+            """
+            Submits the given number of subjects.
+            """
+
+            for index, subject in islice(subjects, number_of_subjects):
+                pending[
+                    executor.submit(
+                        lookups[index % len(lookups)].request,
+                        subject,
+                        complete=complete,
+                        tcp=tcp,
+                    )
+                ] = subject
+
+        try:
+            # We keep the executor busy without loading all subjects in memory.
+            submit(concurrency * 2)
+
+            while pending:
+                done, _ = wait_for_futures(
+                    list(pending.keys()), return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+                submit(len(done))
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
@@ -58,41 +58,248 @@ License:
     SOFTWARE.
 """
 
+from array import array
+from bisect import bisect_right
+from ipaddress import AddressValueError, IPv4Address, IPv4Network
+from os import getpid
+from os import replace as rename_file
+from os import stat
+from threading import Lock
+
 import PyFunceble
 
 
 class IPv4Reputation:
     """
     Let us checks a given IPv4 against the IPv4 reputation file.
+
+    .. note::
+        The reputation file is loaded only once (per process) into an index:
+        a sorted array of integers (one per IPv4) and a sorted array of
+        ranges (one per network given in the CIDR notation).
+
+        The index is also saved next to the reputation file so that
+        the next processes can load it without parsing the reputation file.
     """
 
+    # The index shared by all instances of the current process.
+    # Formatted as (addresses, ranges).
+    index = None
+    # The state (modification time and size) of the file the index was built from.
+    index_source_state = None
+
+    # The extension of the on-disk index.
+    index_file_extension = ".index"
+
+    # The lock to hold while (re)loading the index.
+    index_lock = Lock()
+
+    # The typecode of our arrays. We need 4 bytes per item.
+    typecode = "I" if array("I").itemsize == 4 else "L"
+
     def __init__(self):
         self.input_file = (
             PyFunceble.CONFIG_DIRECTORY
             + PyFunceble.abstracts.Infrastructure.IPV4_REPUTATION_FILENAME
         )
+        self.index_file = self.input_file + self.index_file_extension
 
         if not PyFunceble.helpers.File(self.input_file).exists():
             PyFunceble.downloader.IPv4Reputation()
 
+    @classmethod
+    def __get_state_of(cls, file):
+        """
+        Provides the state of the given file.
+
+        :param str file: The file we are working with.
+
+        :return: A tuple in the format :code:`(modification time, size)`.
+        :rtype: tuple
+        """
+
+        try:
+            file_stat = stat(file)
+        except OSError:
+            return None
+
+        return file_stat.st_mtime, file_stat.st_size
+
+    def __build_index(self):
+        """
+        Parses the reputation file and builds our index.
+
+        :return: A tuple in the format :code:`(addresses, ranges)`.
+        :rtype: tuple
+        """
+
+        addresses = set()
+        ranges = []
+
+        with open(self.input_file, "r", encoding="utf-8") as file_stream:
+            for line in file_stream:
+                subject = line.split("#", 1)[0].strip()
+
+                if not subject:
+                    continue
+
+                try:
+                    if "/" in subject:
+                        network = IPv4Network(subject, strict=False)
+
+                        ranges.append(
+                            (
+                                int(network.network_address),
+                                int(network.broadcast_address),
+                            )
+                        )
+                    else:
+                        addresses.add(int(IPv4Address(subject)))
+                except ValueError:
+                    PyFunceble.LOGGER.debug(
+                        f"Ignored invalid reputation entry: {repr(subject)}"
+                    )
+
+        merged_ranges = []
+
+        for range_start, range_end in sorted(ranges):
+            if merged_ranges and range_start <= merged_ranges[-1][1] + 1:
+                # The current range overlaps (or follows) the previous one.
+                # We merge them so that the ranges never overlap.
+                merged_ranges[-1][1] = max(merged_ranges[-1][1], range_end)
+            else:
+                merged_ranges.append([range_start, range_end])
+
+        return (
+            array(self.typecode, sorted(addresses)),
+            array(self.typecode, [x for y in merged_ranges for x in y]),
+        )
+
+    def __load_index_file(self):
+        """
+        Loads our index from its on-disk copy.
+
+        :return:
+            A tuple in the format :code:`(addresses, ranges)`
+            or :code:`None` if the on-disk copy is not usable.
+        :rtype: tuple, None
+        """
+
+        index_state = self.__get_state_of(self.index_file)
+        input_state = self.__get_state_of(self.input_file)
+
+        if not index_state or not input_state or index_state[0] <= input_state[0]:
+            return None
+
+        try:
+            with open(self.index_file, "rb") as file_stream:
+                header = array(self.typecode)
+                header.fromfile(file_stream, 2)
+
+                addresses = array(self.typecode)
+                addresses.fromfile(file_stream, header[0])
+
+                ranges = array(self.typecode)
+                ranges.fromfile(file_stream, header[1])
+        except (OSError, EOFError):
+            return None
+
+        return addresses, ranges
+
+    def __save_index_file(self, index):
+        """
+        Saves the given index into its on-disk copy.
+
+        :param tuple index: The index to save.
+        """
+
+        if PyFunceble.CONFIGURATION.no_files:
+            return
+
+        temp_file = f"{self.index_file}.{getpid()}.tmp"
+
+        try:
+            with open(temp_file, "wb") as file_stream:
+                array(self.typecode, [len(index[0]), len(index[1])]).tofile(file_stream)
+                index[0].tofile(file_stream)
+                index[1].tofile(file_stream)
+
+            # We rename so that a concurrent reader never get a partial index.
+            rename_file(temp_file, self.index_file)
+        except OSError:
+            PyFunceble.helpers.File(temp_file).delete()
+
+    def __get_index(self):
+        """
+        Provides the index of the reputation file.
+
+        :return: A tuple in the format :code:`(addresses, ranges)`.
+        :rtype: tuple
+        """
+
+        input_state = self.__get_state_of(self.input_file)
+
+        if self.index is not None and self.index_source_state == input_state:
+            return self.index
+
+        with self.index_lock:
+            if (
+                IPv4Reputation.index is None
+                or IPv4Reputation.index_source_state != input_state
+            ):
+                index = self.__load_index_file()
+
+                if index is None:
+                    PyFunceble.LOGGER.info("Building the IPv4 reputation index.")
+
+                    index = self.__build_index()
+                    self.__save_index_file(index)
+
+                IPv4Reputation.index = index
+                IPv4Reputation.index_source_state = input_state
+
+        return IPv4Reputation.index
+
+    def __is_ipv4_present(self, subject):
+        """
+        Checks the given IPv4 against our index.
+
+        :param str subject: The IPv4 to check.
+
+        :rtype: bool
+        """
+
+        try:
+            subject = int(IPv4Address(subject))
+        except AddressValueError:
+            return False
+
+        # Note: The index is always built by __get_index().
+        addresses, ranges = self.__get_index()  # pylint: disable=unpacking-non-sequence
+
+        position = bisect_right(addresses, subject)
+
+        if position and addresses[position - 1] == subject:
+            return True
+
+        # The (merged) ranges are saved as [start, end, start, end, ...].
+        # We look for the last range which starts before (or at) the given subject.
+        starts = memoryview(ranges)[::2]
+        position = bisect_right(starts, subject)
+
+        return bool(position) and ranges[(position - 1) * 2 + 1] >= subject
+
     def __is_present(self, subject):
         """
         Checks the given subject against the input file.
         """
 
         if PyFunceble.Check(subject).is_ipv4():
-            with open(self.input_file, "r", encoding="utf-8") as file_stream:
-                for line in file_stream:
-                    if not line.startswith(subject):
-                        continue
-
-                    return True
-        else:
-            subjects = PyFunceble.DNSLOOKUP.a_record(subject)
+            return self.__is_ipv4_present(subject)
 
-            return any([self.__is_present(x) for x in subjects])
+        subjects = PyFunceble.DNSLOOKUP.a_record(subject)
 
-        return False
+        return any([self.__is_ipv4_present(x) for x in subjects or []])
 
     def __contains__(self, subject):
         return self.__is_present(subject)
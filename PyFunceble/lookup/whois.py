@@ -66,7 +66,9 @@ from socket import timeout as socket_timeout
 
 import PyFunceble
 
+from .cache import LookupCache
 from .referer import Referer
+from .whois_scheduler import WhoisScheduler
 
 
 class WhoisLookup:
@@ -94,6 +96,13 @@ class WhoisLookup:
     # the expiration date.
     buffer_size = 4096
 
+    # The cache of WHOIS records shared by all instances of the current process.
+    cache = None
+    # The number of seconds a WHOIS record lives into the cache.
+    cache_ttl = 0
+    # The scheduler shared by all instances of the current process.
+    scheduler = WhoisScheduler()
+
     def __init__(self, subject, server=None, timeout=3):
         if subject:
             # The subject is not empty nor None.
@@ -115,6 +124,10 @@ class WhoisLookup:
             if isinstance(server, str):
                 # The server is a str.
 
+                # We keep the server name as the scheduler
+                # have to work with it.
+                self.server_name = server
+
                 resolved_server = PyFunceble.DNSLOOKUP.a_record(server)
 
                 try:
@@ -132,6 +145,7 @@ class WhoisLookup:
 
             # We get the server.
             self.server = Referer(self.subject).get()[0]
+            self.server_name = self.server
 
         if timeout:
             # The timeout is given.
@@ -147,75 +161,151 @@ class WhoisLookup:
                 # We eaise an exception.
                 raise ValueError("`timeout` must be an integer or float.")
 
+    @classmethod
+    def update_cache(cls, ttl, maximal_size=10000):
+        """
+        Updates (or deactivates) the cache of WHOIS records.
+
+        :param int ttl:
+            The number of seconds a WHOIS record lives into the cache.
+            :code:`None` or :code:`0` deactivates the cache.
+        :param int maximal_size: The maximal number of records to keep.
+        """
+
+        if not isinstance(ttl, (int, float)) or ttl <= 0:
+            cls.cache = None
+            cls.cache_ttl = 0
+
+            PyFunceble.LOGGER.info("WHOIS cache deactivated.")
+            return
+
+        if cls.cache is None:
+            cls.cache = LookupCache(maximal_size=maximal_size)
+        else:
+            cls.cache.resize(maximal_size)
+
+        cls.cache_ttl = ttl
+
+        PyFunceble.LOGGER.info(f"WHOIS cache activated. TTL: {ttl}")
+
+    @classmethod
+    def update_scheduler(cls, concurrency=None, interval=0.0):
+        """
+        Updates the limits of the scheduler of WHOIS requests.
+
+        :param int concurrency:
+            The maximal number of concurrent requests to a single server.
+            :code:`None` or :code:`0` means no limit.
+        :param float interval:
+            The minimal number of seconds between the start of
+            2 requests to the same server.
+        """
+
+        cls.scheduler = WhoisScheduler(concurrency=concurrency, interval=interval)
+
+        PyFunceble.LOGGER.info(
+            f"WHOIS scheduler updated. Concurrency: {concurrency} | "
+            f"Interval: {interval}"
+        )
+
     def request(self):  # pragma: no cover
         """
         Perform the WHOIS request.
-        """
 
-        result = None
+        .. note::
+            The record is given by the cache when we already got it
+            from the same server.
+        """
 
-        if self.server and self.subject:
-            # A server was found or is given.
+        if not self.server or not self.subject:
+            # The whois server is not given nor found.
+            return None
 
-            # We initiate a socket for the request.
-            req = socket(AF_INET, SOCK_STREAM)
+        cache_key = (self.server_name, self.subject.lower())
 
-            # We set the timeout.
-            req.settimeout(self.timeout)
+        if self.cache is not None:
+            result = self.cache.get(cache_key)
 
-            try:
-                # We try to connect to the whois server at the port 43.
-                req.connect((self.server, self.universal_port))
-            except socket_error:
+            if result is not None:
+                PyFunceble.LOGGER.debug(
+                    f"WHOIS record of {repr(self.subject)} given by the cache."
+                )
                 return result
 
-            # We send and encode the domain we want the information from.
-            req.send("{}\r\n".format(self.subject).encode())
+        with self.scheduler.slot(self.server_name):
+            result = self.__request()
 
-            # We initiate a bytes variable which will save the response from the server.
-            response = bytes("", "utf-8")
+        if result is not None and self.cache is not None:
+            self.cache.set(cache_key, result, self.cache_ttl)
 
-            while True:
-                # We loop infinitly
+        return result
 
-                try:
-                    data = req.recv(self.buffer_size)
-                except (ConnectionResetError, socket_timeout):
-                    # We got an error.
+    def __request(self):  # pragma: no cover
+        """
+        Perform the WHOIS request through the network.
+        """
 
-                    # We close the connection.
-                    req.close()
+        result = None
 
-                    # And we return the result.
-                    return result
+        # We initiate a socket for the request.
+        req = socket(AF_INET, SOCK_STREAM)
 
-                # Eerything goes right.
+        # We set the timeout.
+        req.settimeout(self.timeout)
 
-                # We append the data to the response.
-                response += data
+        try:
+            # We try to connect to the whois server at the port 43.
+            req.connect((self.server, self.universal_port))
+        except socket_error:
+            req.close()
+            return result
 
-                if not data:
-                    # The data is empty or equal to None.
+        # We send and encode the domain we want the information from.
+        req.send("{}\r\n".format(self.subject).encode())
 
-                    # We close the connection.
-                    req.close()
+        # We initiate the list which will save the chunks of the response
+        # from the server. We join them only once at the end.
+        chunks = []
 
-                    # And we break the loop.
-                    break
+        while True:
+            # We loop infinitly
 
             try:
-                # We finally decode and return the response we got from the server.
+                data = req.recv(self.buffer_size)
+            except (ConnectionResetError, socket_timeout):
+                # We got an error.
 
-                return response.decode()
-            except UnicodeDecodeError:
-                # We may get a decoding error.
+                # We close the connection.
+                req.close()
 
-                # We decode the response explicitly.
-                # Note: Because we don't want to deal with other issue, we
-                # decided to use `replace` in order to automatically replace
-                # all non utf-8 encoded characters.
-                return response.decode("utf-8", "replace")
+                # And we return the result.
+                return result
 
-        # The whois server is not given nor found.
+            if not data:
+                # The data is empty or equal to None.
 
-        return result
+                # We close the connection.
+                req.close()
+
+                # And we break the loop.
+                break
+
+            # Eerything goes right.
+
+            # We append the data to the response.
+            chunks.append(data)
+
+        response = b"".join(chunks)
+
+        try:
+            # We finally decode and return the response we got from the server.
+
+            return response.decode()
+        except UnicodeDecodeError:
+            # We may get a decoding error.
+
+            # We decode the response explicitly.
+            # Note: Because we don't want to deal with other issue, we
+            # decided to use `replace` in order to automatically replace
+            # all non utf-8 encoded characters.
+            return response.decode("utf-8", "replace")
@@ -0,0 +1,148 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the scheduler of the WHOIS requests.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+from time import monotonic, sleep
+
+
+class WhoisScheduler:
+    """
+    Schedules the requests we send to each WHOIS server.
+
+    Each server gets its own limits, so that we can talk to many
+    servers at the same time without flooding any of them.
+
+    :param int concurrency:
+        The maximal number of concurrent requests to a single server.
+        :code:`None` means no limit.
+    :param float interval:
+        The minimal number of seconds between the start of
+        2 requests to the same server.
+    """
+
+    def __init__(self, concurrency=None, interval=0.0):
+        self.concurrency = concurrency
+        self.interval = interval
+
+        self.__servers = {}
+        self.__lock = Lock()
+
+    def __get_server(self, server):
+        """
+        Provides the state of the given server.
+
+        :param str server: The server we are working with.
+
+        :return: A list in the format :code:`[semaphore, next request time]`.
+        :rtype: list
+        """
+
+        with self.__lock:
+            if server not in self.__servers:
+                self.__servers[server] = [
+                    BoundedSemaphore(self.concurrency) if self.concurrency else None,
+                    0.0,
+                ]
+
+            return self.__servers[server]
+
+    def __wait_for_turn(self, state):
+        """
+        Waits until we are allowed to start a new request.
+
+        :param list state: The state of the server we are working with.
+        """
+
+        if not self.interval:
+            return
+
+        with self.__lock:
+            # We book our slot before waiting so that concurrent
+            # requests are spread over time.
+            start_time = max(monotonic(), state[1])
+            state[1] = start_time + self.interval
+
+        delay = start_time - monotonic()
+
+        if delay > 0:
+            sleep(delay)
+
+    @contextmanager
+    def slot(self, server):
+        """
+        Provides a context in which we are allowed to request the given server.
+
+        :param str server: The server we are working with.
+        """
+
+        state = self.__get_server(server)
+        semaphore = state[0]
+
+        if semaphore is not None:
+            semaphore.acquire()
+
+        try:
+            self.__wait_for_turn(state)
+
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
@@ -59,8 +59,12 @@ License:
 """
 
 from .clean import Clean
+from .collector import OutputCollector
 from .constructor import Constructor
+from .export import ResultsExport
 from .generate import Generate
 from .logs import Logs
+from .logs_sharer import LogsSharer
 from .percentage import Percentage
 from .prints import Prints
+from .sink import OutputSink
@@ -150,7 +150,7 @@ class Clean:
         # We initate the result variable.
         result = []
 
-        if PyFunceble.CONFIGURATION.db_type == "json":
+        if PyFunceble.CONFIGURATION.db_type in ["json", "json_journal"]:
             # We initiate the directory we have to look for.
             directory = PyFunceble.CONFIG_DIRECTORY
 
@@ -198,6 +198,10 @@ class Clean:
             "do_not_clean" not in PyFunceble.INTERN
             or not PyFunceble.INTERN["do_not_clean"]
         ):
+            # We write what's pending and release our handles before
+            # deleting anything.
+            PyFunceble.output.OutputSink.close_all()
+
             # We get the list of file to delete.
             to_delete = self.file_to_delete(clean_all)
 
@@ -209,6 +213,10 @@ class Clean:
             for file in to_delete:
                 # We loop through the list of file to delete.
 
+                # We forget the changes which were not written into the
+                # currently read file (if it is a database).
+                PyFunceble.database.WriteBehind.discard(file)
+
                 # And we delete the currently read file.
                 PyFunceble.helpers.File(file).delete()
 
@@ -227,12 +235,15 @@ class Clean:
             if PyFunceble.CONFIGURATION.db_type in [
                 "mariadb",
                 "mysql",
+                "sqlite",
             ]:  # pragma: no cover
+                # We write what's pending before deleting.
+                PyFunceble.engine.SQLWriter.flush()
 
-                with PyFunceble.engine.MySQL() as connection:
+                with PyFunceble.engine.SQL() as connection:
                     for database_name in [
                         y
-                        for x, y in PyFunceble.engine.MySQL.tables.items()
+                        for x, y in PyFunceble.engine.SQL.tables.items()
                         if x not in to_avoid
                     ]:
                         lquery = query.format(database_name)
@@ -0,0 +1,118 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the collector of the lines to print into our output files.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import PyFunceble
+
+
+class OutputCollector:
+    """
+    Collects the lines to print into our output files so that we can print
+    them file by file, in bulk.
+
+    ::
+
+        collector = PyFunceble.output.OutputCollector()
+
+        collector.print_on_file(["example.org"], "PlainDomain", output)
+        collector.print_on_file(["example.net"], "PlainDomain", output)
+
+        collector.print_collected()
+
+    :param bool bulk:
+        Tells us to collect the lines instead of printing them
+        as we get them.
+    """
+
+    def __init__(self, bulk=True):
+        self.bulk = bulk
+
+        # Saves the data to print.
+        # Format: {(output, template): [data_to_print, ...]}
+        self.collected = {}
+
+    def __len__(self):
+        return sum(len(x) for x in self.collected.values())
+
+    def print_on_file(self, data_to_print, template, output):
+        """
+        Prints (or collects) the given data into the given output (file).
+
+        :param list data_to_print: The data to print.
+        :param str template: The template to use.
+        :param str output: The file to print into.
+        """
+
+        if not self.bulk:
+            PyFunceble.output.Prints(data_to_print, template, output, True).data()
+        elif (output, template) in self.collected:
+            self.collected[(output, template)].append(data_to_print)
+        else:
+            self.collected[(output, template)] = [data_to_print]
+
+    def print_collected(self):
+        """
+        Prints the collected data into their files, file by file,
+        and empties our collection.
+        """
+
+        for (output, template), rows in self.collected.items():
+            PyFunceble.output.Prints(rows[0], template, output, True).bulk_data(rows)
+
+        self.collected.clear()
@@ -0,0 +1,336 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the columnar export of our results.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from atexit import register as register_at_exit
+from csv import DictWriter
+from json import dumps
+from os import getpid
+from os.path import splitext
+from weakref import WeakSet
+
+import PyFunceble
+from PyFunceble.status.status import Status
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+class ResultsExport:
+    """
+    Exports our results into a columnar file. We write Parquet (through
+    :code:`pyarrow`) when it is installed and CSV otherwise (or when a
+    :code:`.csv` file is given).
+
+    The rows are written by chunk of :code:`export_chunk_size` rows,
+    so that we never hold more than one chunk in memory.
+
+    ::
+
+        export = PyFunceble.output.ResultsExport("results.parquet")
+
+        export.add(result, "hello.list")
+        export.close()
+
+    :param str file_path: The file to write.
+    """
+
+    # Saves all opened exports so that we can close them all at once.
+    exports = WeakSet()
+
+    # Saves the columns we write.
+    columns = ["tested", "file_path"] + [
+        x for x in sorted(Status.resulting_indexes) if x != "tested"
+    ]
+    # Saves the columns which hold a boolean.
+    boolean_columns = [x for x in columns if x.endswith("_syntax_validation")]
+
+    def __init__(self, file_path):
+        self.file_path, self.format = self.get_file_path_and_format(file_path)
+
+        # We save the process which created us. Only that one is
+        # allowed to write.
+        self.owner = getpid()
+
+        self.rows = []
+        self.exported = 0
+
+        self.file_stream = None
+        self.writer = None
+
+        self.exports.add(self)
+
+    @classmethod
+    def get_file_path_and_format(cls, file_path):
+        """
+        Provides the file to write and its format.
+
+        :param str file_path: The given file path.
+
+        :return: The file to write and its format (:code:`parquet` or :code:`csv`).
+        :rtype: tuple
+        """
+
+        if file_path.lower().endswith(".csv"):
+            return file_path, "csv"
+
+        if pyarrow is not None:
+            return file_path, "parquet"
+
+        if file_path.lower().endswith(".parquet"):  # pragma: no cover
+            file_path = splitext(file_path)[0] + ".csv"
+
+            PyFunceble.LOGGER.info(
+                f"pyarrow is not installed. Exporting into {file_path!r} instead."
+            )
+
+        return file_path, "csv"
+
+    @classmethod
+    def get_schema(cls):  # pragma: no cover
+        """
+        Provides the schema of our Parquet files.
+        """
+
+        return pyarrow.schema(
+            [
+                (x, pyarrow.bool_() if x in cls.boolean_columns else pyarrow.string())
+                for x in cls.columns
+            ]
+        )
+
+    @classmethod
+    def format_row(cls, data, file_path=None):
+        """
+        Provides the row to write for the given data (result).
+
+        :param dict data: The data to format.
+        :param str file_path: The file the data comes from.
+
+        :rtype: dict
+        """
+
+        result = {}
+
+        for column in cls.columns:
+            value = data.get(column)
+
+            if column == "file_path" and file_path:
+                value = file_path
+
+            if value is None:
+                result[column] = None
+            elif column in cls.boolean_columns:
+                result[column] = bool(value)
+            elif isinstance(value, (dict, list, tuple)):
+                result[column] = dumps(value, ensure_ascii=False, sort_keys=True)
+            else:
+                result[column] = str(value)
+
+        return result
+
+    def add(self, data, file_path=None):
+        """
+        Adds the given data (result) to the rows to write.
+
+        :param dict data: The data to add.
+        :param str file_path: The file the data comes from.
+        """
+
+        if self.owner != getpid():
+            # Our parent process writes.
+            return
+
+        self.rows.append(self.format_row(data, file_path=file_path))
+
+        if len(self.rows) >= PyFunceble.CONFIGURATION.export_chunk_size:
+            self.flush()
+
+    def __open(self):
+        """
+        Opens the file to write.
+        """
+
+        if self.format == "parquet":  # pragma: no cover
+            self.writer = pyarrow.parquet.ParquetWriter(
+                self.file_path, self.get_schema()
+            )
+        else:
+            # Note: Our stream outlives this method. It is closed by close().
+            self.file_stream = open(  # pylint: disable=consider-using-with
+                self.file_path, "w", encoding="utf-8", newline=""
+            )
+            self.writer = DictWriter(
+                self.file_stream, fieldnames=self.columns, lineterminator="\n"
+            )
+            self.writer.writeheader()
+
+    def flush(self):
+        """
+        Writes the pending rows.
+        """
+
+        if self.owner != getpid():
+            return
+
+        if self.writer is None:
+            self.__open()
+
+        if not self.rows:
+            return
+
+        if self.format == "parquet":  # pragma: no cover
+            self.writer.write_table(
+                pyarrow.Table.from_pydict(
+                    {x: [y[x] for y in self.rows] for x in self.columns},
+                    schema=self.get_schema(),
+                )
+            )
+        else:
+            self.writer.writerows(self.rows)
+            self.file_stream.flush()
+
+        self.exported += len(self.rows)
+        self.rows = []
+
+    def close(self):
+        """
+        Writes the pending rows and closes the file.
+        """
+
+        if self.owner != getpid() or (self.writer is None and not self.rows):
+            return
+
+        self.flush()
+
+        if self.format == "parquet":  # pragma: no cover
+            self.writer.close()
+        else:
+            self.file_stream.close()
+
+        self.writer = None
+        self.file_stream = None
+
+        PyFunceble.LOGGER.info(
+            f"Exported {self.exported} rows into {self.file_path!r}."
+        )
+
+    def export_database(self, file_path=None):  # pragma: no cover
+        """
+        Exports the content of our :code:`tested` table.
+
+        .. note::
+            The rows are read from the server as we write them.
+
+        :param str file_path:
+            The file path to export. If not given, we export everything.
+        """
+
+        if PyFunceble.CONFIGURATION.db_type not in ["mariadb", "mysql", "sqlite"]:
+            raise ValueError(
+                "Only the mariadb, mysql and sqlite database types can be exported."
+            )
+
+        PyFunceble.engine.SQLWriter.flush(PyFunceble.engine.SQL.tables["tested"])
+
+        to_select = (
+            "SELECT tested, file_path, _status, status, _status_source, "
+            "status_source, domain_syntax_validation, expiration_date, "
+            "http_status_code, ipv4_range_syntax_validation, ipv4_syntax_validation, "
+            "ipv6_range_syntax_validation, ipv6_syntax_validation, "
+            "subdomain_syntax_validation, url_syntax_validation, whois_server "
+            "FROM {0}"
+        ).format(PyFunceble.engine.SQL.tables["tested"])
+
+        if file_path:
+            to_select += " WHERE file_path = %(file_path)s"
+
+        to_select += " ORDER BY id ASC"
+
+        with PyFunceble.engine.SQL() as connection:
+            with PyFunceble.engine.SQL.get_streaming_cursor(connection) as cursor:
+                cursor.execute(to_select, {"file_path": file_path})
+
+                while True:
+                    fetched = cursor.fetchmany(
+                        PyFunceble.CONFIGURATION.export_chunk_size
+                    )
+
+                    if not fetched:
+                        break
+
+                    for row in fetched:
+                        self.add(row)
+
+        self.close()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Closes all opened exports.
+        """
+
+        for export in list(cls.exports):
+            export.close()
+
+
+register_at_exit(ResultsExport.close_all)
@@ -60,6 +60,7 @@ License:
 
 from datetime import datetime
 from os import sep as directory_separator
+from threading import RLock
 
 import PyFunceble
 
@@ -89,8 +90,17 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
 
     :param bool ip_validation:
         The IP validation check of the currently written subject.
+
+    :param collector:
+        If given, we collect the data to print into our files into it
+        instead of printing them.
+    :type collector: :class:`~PyFunceble.output.collector.OutputCollector`
     """
 
+    # Serializes the generation of files and the counters update
+    # when we are used from multiple threads.
+    lock = RLock()
+
     def __init__(
         self,
         subject,
@@ -103,6 +113,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
         filename=None,
         ip_validation=False,
         end=False,
+        collector=None,
     ):
         # We share the subject.
         self.subject = subject
@@ -118,6 +129,11 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
         self.ip_validation = ip_validation
         # We share the end state.
         self.end = end
+        # We share the collector.
+        if collector is None:
+            self.collector = PyFunceble.output.OutputCollector(bulk=False)
+        else:
+            self.collector = collector
 
         if not http_status_code:
             self.status_code = PyFunceble.HTTP_CODE.not_found_default
@@ -146,20 +162,29 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
             PyFunceble.OUTPUT_DIRECTORY + PyFunceble.OUTPUTS.parent_directory
         )
 
+        self.file_production = not self._do_not_produce_file()
+
+    @property
+    def headers(self):
+        """
+        Provides the headers to use with our requests.
+
+        .. note::
+            We only read the user agent when we are asked for it.
+        """
+
         user_agent = PyFunceble.engine.UserAgent().get()
 
         if user_agent:
             # The user-agent (from the configuration file) is not empty.
 
             # We initiate the header to use with our request.
-            self.headers = {"User-Agent": user_agent}
-        else:
-            # The user-agent (from the configuration file) is empty.
+            return {"User-Agent": user_agent}
 
-            # We initiate an empty header to use with our request.
-            self.headers = {}
+        # The user-agent (from the configuration file) is empty.
 
-        self.file_production = not self._do_not_produce_file()
+        # We initiate an empty header to use with our request.
+        return {}
 
     def _do_not_produce_file(self):
         """
@@ -177,7 +202,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
         if "api_file_generation" in PyFunceble.CONFIGURATION:
             return not PyFunceble.CONFIGURATION.api_file_generation
 
-        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql"]:
+        if PyFunceble.CONFIGURATION.db_type in ["mariadb", "mysql", "sqlite"]:
             return not self.end
 
         return PyFunceble.CONFIGURATION.no_files
@@ -478,11 +503,11 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 # We generate/append the currently tested element in its
                 # final location. (hosts file format)
                 # We print on screen and on file.
-                PyFunceble.output.Prints(
+                self.collector.print_on_file(
                     [PyFunceble.CONFIGURATION.custom_ip, self.subject],
                     "FullHosts",
                     hosts_destination,
-                ).data()
+                )
 
             if PyFunceble.CONFIGURATION.plain_list_domain:
                 # The plain list generation is activated.
@@ -490,9 +515,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 # We generate/append the currently tested element in its
                 # final location. (the plain list format)
                 # We print on file.
-                PyFunceble.output.Prints(
+                self.collector.print_on_file(
                     [self.subject], "PlainDomain", plain_destination
-                ).data()
+                )
 
             if PyFunceble.CONFIGURATION.split and splited_destination:
                 # The splited list generation is activated.
@@ -500,9 +525,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 # We generate/append the currently tested element in its
                 # final location. (the split list format)
                 # We print on file.
-                PyFunceble.output.Prints(
+                self.collector.print_on_file(
                     [self.subject], "PlainDomain", splited_destination
-                ).data()
+                )
 
             if PyFunceble.CONFIGURATION.generate_json:
                 # The json list generation is activated.
@@ -510,9 +535,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 # We generate/append the currently tested element in its
                 # final location. (the json format)
                 # We print on file.
-                PyFunceble.output.Prints(
-                    [self.subject], "JSON", json_destination
-                ).data()
+                self.collector.print_on_file([self.subject], "JSON", json_destination)
 
     def unified_file(self):
         """
@@ -537,7 +560,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
             if PyFunceble.CONFIGURATION.simple:
                 to_print = [self.subject, self.status]
 
-                PyFunceble.output.Prints(to_print, "Simple", output, True).data()
+                self.collector.print_on_file(to_print, "Simple", output)
             elif PyFunceble.CONFIGURATION.less:
                 # We have to print less information.
 
@@ -553,7 +576,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                     to_print = [self.subject, self.status, self.source]
 
                 # And we print the informations on file.
-                PyFunceble.output.Prints(to_print, "Less", output, True).data()
+                self.collector.print_on_file(to_print, "Less", output)
             else:
                 # The unified file generation is not activated.
 
@@ -568,7 +591,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 ]
 
                 # And we print the information on file.
-                PyFunceble.output.Prints(to_print, "Generic_File", output, True).data()
+                self.collector.print_on_file(to_print, "Generic_File", output)
 
     def complements_file(self):
         """
@@ -603,6 +626,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                         whois_server=self.whois_server,
                         filename=self.filename,
                         ip_validation=self.ip_validation,
+                        collector=self.collector,
                     ).info_files()
 
                     # We break the loop.
@@ -667,6 +691,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                         whois_server=self.whois_server,
                         filename=self.filename,
                         ip_validation=self.ip_validation,
+                        collector=self.collector,
                     ).info_files()
 
                     # We update the map usage.
@@ -696,10 +721,11 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                     whois_server=self.whois_server,
                     filename=self.filename,
                     ip_validation=self.ip_validation,
+                    collector=self.collector,
                 ).info_files()
 
             # We print the information on file.
-            PyFunceble.output.Prints(
+            self.collector.print_on_file(
                 [
                     self.subject,
                     old_status,
@@ -708,8 +734,7 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                 ],
                 "HTTP",
                 output,
-                True,
-            ).data()
+            )
 
     def prints_status_file(self):  # pylint: disable=too-many-branches
         """
@@ -730,16 +755,16 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
             )
 
             if PyFunceble.CONFIGURATION.simple:
-                PyFunceble.output.Prints(
-                    [self.subject, self.status], "Simple", output, True
-                ).data()
+                self.collector.print_on_file(
+                    [self.subject, self.status], "Simple", output
+                )
             elif PyFunceble.CONFIGURATION.less:
                 # We have to print less information.
 
                 # We print the information on file.
-                PyFunceble.output.Prints(
-                    [self.subject, self.status, self.source], "Less", output, True
-                ).data()
+                self.collector.print_on_file(
+                    [self.subject, self.status, self.source], "Less", output
+                )
             elif PyFunceble.CONFIGURATION.split:
                 # We have to split the information we print on file.
 
@@ -769,9 +794,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                         ]
 
                     # We print the informations to print on file.
-                    PyFunceble.output.Prints(
-                        data_to_print, PyFunceble.STATUS.official.up, output, True
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.up, output
+                    )
                 elif self.status.lower() in PyFunceble.STATUS.list.valid:
                     # The status is in the list of valid status.
 
@@ -783,9 +808,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                     ]
 
                     # We print the informations to print on file.
-                    PyFunceble.output.Prints(
-                        data_to_print, PyFunceble.STATUS.official.valid, output, True
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.valid, output
+                    )
                 elif self.status.lower() in PyFunceble.STATUS.list.sane:
                     # The status is in the list of sane status.
 
@@ -797,9 +822,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                     ]
 
                     # We print the informations to print on file.
-                    PyFunceble.output.Prints(
-                        data_to_print, PyFunceble.STATUS.official.sane, output, True
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.sane, output
+                    )
                 elif self.status.lower() in PyFunceble.STATUS.list.malicious:
                     # The status is in the list of malicious status.
 
@@ -811,12 +836,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                     ]
 
                     # We print the informations to print on file.
-                    PyFunceble.output.Prints(
-                        data_to_print,
-                        PyFunceble.STATUS.official.malicious,
-                        output,
-                        True,
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.malicious, output
+                    )
                 elif self.status.lower() in PyFunceble.STATUS.list.down:
                     # The status is in the list of down status.
 
@@ -845,9 +867,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                         ]
 
                     # We print the information on file.
-                    PyFunceble.output.Prints(
-                        data_to_print, PyFunceble.STATUS.official.down, output, True
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.down, output
+                    )
                 elif self.status.lower() in PyFunceble.STATUS.list.invalid:
                     # The status is in the list of invalid status.
 
@@ -872,9 +894,9 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
                         ]
 
                     # We print the information to print on file.
-                    PyFunceble.output.Prints(
-                        data_to_print, PyFunceble.STATUS.official.invalid, output, True
-                    ).data()
+                    self.collector.print_on_file(
+                        data_to_print, PyFunceble.STATUS.official.invalid, output
+                    )
 
     def _prints_status_screen(self):
         """
@@ -952,22 +974,23 @@ class Generate:  # pylint:disable=too-many-instance-attributes, too-many-argumen
             A shorthand to disable any file generation.
         """
 
-        if exclude_file_generation:
-            self.file_production = False
+        with self.lock:
+            if exclude_file_generation:
+                self.file_production = False
 
-        # We generate the hosts file.
-        self.info_files()
+            # We generate the hosts file.
+            self.info_files()
 
-        if not self.end:
-            # We print on screen if needed.
-            self._prints_status_screen()
+            if not self.end:
+                # We print on screen if needed.
+                self._prints_status_screen()
 
-        # We increase the percentage count.
-        PyFunceble.output.Percentage(self.status).count()
+            # We increase the percentage count.
+            PyFunceble.output.Percentage(self.status).count()
 
-        if self.file_production:
+            if self.file_production:
 
-            # We print or generate the  splitted files.
-            self.prints_status_file()
-            # We print or generate the unified files.
-            self.unified_file()
+                # We print or generate the  splitted files.
+                self.prints_status_file()
+                # We print or generate the unified files.
+                self.unified_file()
@@ -68,6 +68,12 @@ class Logs:
     Provide a clean and unique way to work with logs.
     Indeed, it's not good to have logs spread around the code :smile:
 
+    .. note::
+        We append our records to the JSON Lines file of the given output
+        (:code:`whois.json` -> :code:`whois.jsonl`). Use
+        :meth:`convert_json_lines` to get them into the JSON file
+        (old format).
+
     :param str output: A path to the JSON file we are going to write.
     """
 
@@ -94,7 +100,7 @@ class Logs:
     @classmethod
     def _write_content(cls, content, file):
         """
-        Write the content into the given file.
+        Append the content into the JSON Lines file of the given file.
 
         :param str content: The dict to write.
 
@@ -105,7 +111,50 @@ class Logs:
             if not isinstance(content, dict):
                 content = {}
 
-            PyFunceble.helpers.Dict(content).to_json_file(file)
+            PyFunceble.output.OutputSink.write(
+                PyFunceble.output.Prints.get_json_lines_file(file),
+                PyFunceble.helpers.Dict(content).to_json(indent=None) + "\n",
+            )
+
+    @classmethod
+    def convert_json_lines(cls, file):
+        """
+        Converts the JSON Lines file of the given file into the old format.
+        Understand by that that its records are merged into the given
+        (JSON) file and that the JSON Lines file is deleted.
+
+        :param str file: The (JSON) log file.
+        """
+
+        # We write what's pending and release our handles before
+        # reading and deleting the JSON Lines file.
+        PyFunceble.output.OutputSink.close_all()
+
+        json_lines_file = PyFunceble.helpers.File(
+            PyFunceble.output.Prints.get_json_lines_file(file)
+        )
+
+        if not json_lines_file.exists():
+            return
+
+        content = cls._get_content(file)
+
+        if not isinstance(content, dict):
+            content = {}
+
+        with open(json_lines_file.path, "r", encoding="utf-8") as file_stream:
+            for line in file_stream:
+                data = PyFunceble.helpers.Dict().from_json(
+                    line, return_dict_on_error=False
+                )
+
+                if isinstance(data, dict):
+                    # Note: A (partially) written line is not decoded.
+                    content.update(data)
+
+        PyFunceble.helpers.Dict(content).to_json_file(file)
+
+        json_lines_file.delete()
 
     def whois(self, subject, record):
         """
@@ -128,12 +177,9 @@ class Logs:
                 output += PyFunceble.OUTPUTS.logs.directories.parent
                 output += PyFunceble.OUTPUTS.logs.filenames.whois
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
             PyFunceble.LOGGER.debug(f"WHOIS Record of {repr(subject)}:\n{to_write}")
 
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
     def expiration_date(self, subject, extracted):
         """
@@ -167,25 +213,18 @@ class Logs:
                 output += PyFunceble.OUTPUTS.logs.directories.parent
                 output += PyFunceble.OUTPUTS.logs.filenames.date_format
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
             PyFunceble.LOGGER.critical(
                 f"Wrong date format for {repr(subject)}:\n{to_write}"
             )
 
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
             if PyFunceble.CONFIGURATION.share_logs:
                 # The logs sharing is activated.
 
-                # And we share the logs with the api.
-                PyFunceble.REQUESTS.post(
-                    PyFunceble.LINKS.api_date_format,
-                    data=to_write[self.current_time],
-                    timeout=PyFunceble.CONFIGURATION.timeout,
-                    verify=PyFunceble.CONFIGURATION.verify_ssl_certificate,
-                    allow_redirects=False,
+                # And we share the logs with the api (in the background).
+                PyFunceble.output.LogsSharer.share(
+                    PyFunceble.LINKS.api_date_format, to_write[self.current_time]
                 )
 
     def referer_not_found(self, subject, extension):
@@ -209,23 +248,16 @@ class Logs:
                 output += PyFunceble.OUTPUTS.logs.directories.parent
                 output += PyFunceble.OUTPUTS.logs.filenames.no_referer
 
-            current_content = self._get_content(output)
-            current_content.update(to_write)
-
             PyFunceble.LOGGER.critical(
                 f"Referer not found for {repr(subject)}:\n{to_write}"
             )
 
-            self._write_content(current_content, output)
+            self._write_content(to_write, output)
 
             if PyFunceble.CONFIGURATION.share_logs:
                 # The logs sharing is activated.
 
-                # And we share the logs with the api.
-                PyFunceble.REQUESTS.post(
-                    PyFunceble.LINKS.api_no_referer,
-                    data=to_write[self.current_time],
-                    timeout=PyFunceble.CONFIGURATION.timeout,
-                    verify=PyFunceble.CONFIGURATION.verify_ssl_certificate,
-                    allow_redirects=False,
+                # And we share the logs with the api (in the background).
+                PyFunceble.output.LogsSharer.share(
+                    PyFunceble.LINKS.api_no_referer, to_write[self.current_time]
                 )
@@ -0,0 +1,198 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the background sharing of our logs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from atexit import register as register_at_exit
+from os import getpid
+from queue import Empty, Queue
+from threading import RLock, Thread
+
+import PyFunceble
+
+
+class LogsSharer:
+    """
+    Shares our logs with our API from a background thread, so that
+    our tests never wait for the API.
+
+    ::
+
+        PyFunceble.output.LogsSharer.share(
+            PyFunceble.LINKS.api_no_referer,
+            {"domain": "example.org", "extension": "org"},
+        )
+
+    .. note::
+        The thread takes all records which are waiting in the queue at once
+        and sends them one after another through the same session.
+    """
+
+    # Saves the maximal number of records we take from the queue at once.
+    batch_size = 100
+
+    # Saves the records to share.
+    # Format: (url, data)
+    queue = Queue()
+    # Saves the thread which shares the queued records.
+    thread = None
+    # Saves the process which owns the queue and the thread.
+    thread_pid = None
+
+    # Serializes the start of our thread.
+    lock = RLock()
+
+    @classmethod
+    def share(cls, url, data):
+        """
+        Queues the given record for sharing.
+
+        :param str url: The URL to post the record to.
+        :param dict data: The record to share.
+        """
+
+        with cls.lock:
+            if cls.thread_pid != getpid():
+                # We do not share the queue (nor the thread) of our
+                # parent process.
+                cls.queue = Queue()
+                cls.thread = None
+                cls.thread_pid = getpid()
+
+            if cls.thread is None or not cls.thread.is_alive():
+                cls.thread = Thread(
+                    target=cls.__share_queue,
+                    args=(cls.queue,),
+                    name="PyFunceble-LogsSharer",
+                    daemon=True,
+                )
+                cls.thread.start()
+
+            cls.queue.put((url, data))
+
+    @classmethod
+    def __get_batch(cls, queue):
+        """
+        Waits for the next record and provides it along with
+        all the records which are already waiting.
+
+        :rtype: list
+        """
+
+        batch = [queue.get()]
+
+        while len(batch) < cls.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except Empty:
+                break
+
+        return batch
+
+    @classmethod
+    def __share_queue(cls, queue):
+        """
+        Shares the records of the given queue, forever.
+
+        .. note::
+            This method is meant to be run from our thread.
+        """
+
+        # Note: Our own session, we are not alone to use the global one.
+        requests = PyFunceble.lookup.Requests()
+
+        while True:
+            batch = cls.__get_batch(queue)
+
+            for url, data in batch:
+                try:
+                    requests.post(
+                        url,
+                        data=data,
+                        timeout=PyFunceble.CONFIGURATION.timeout,
+                        verify=PyFunceble.CONFIGURATION.verify_ssl_certificate,
+                        allow_redirects=False,
+                    )
+                except requests.exceptions.RequestException:
+                    PyFunceble.LOGGER.exception()
+                finally:
+                    queue.task_done()
+
+            PyFunceble.LOGGER.debug(f"Shared {len(batch)} records.")
+
+    @classmethod
+    def flush(cls):
+        """
+        Waits until all queued records were shared.
+        """
+
+        with cls.lock:
+            if (
+                cls.thread_pid == getpid()
+                and cls.thread is not None
+                and cls.thread.is_alive()
+            ):
+                queue = cls.queue
+            else:
+                queue = None
+
+        if queue is not None:
+            queue.join()
+
+
+register_at_exit(LogsSharer.flush)
@@ -119,6 +119,16 @@ class Percentage:
                 # We increase the number of invalid.
                 PyFunceble.INTERN["counter"]["number"]["invalid"] += 1
 
+    @classmethod
+    def count_duplicate(cls):
+        """
+        Count a duplicate we did not (re)test.
+        """
+
+        PyFunceble.INTERN["counter"]["number"]["duplicate"] = (
+            PyFunceble.INTERN["counter"]["number"].get("duplicate", 0) + 1
+        )
+
     @classmethod
     def calculate(cls):
         """
@@ -147,6 +157,16 @@ class Percentage:
             # And we update the percentage counter of the actual status.
             PyFunceble.INTERN["counter"]["percentage"].update({percentage: calculation})
 
+        if PyFunceble.INTERN["counter"]["number"].get("duplicate"):
+            # Some duplicates were skipped.
+
+            # We calculate their percentage of the tested subjects.
+            PyFunceble.INTERN["counter"]["percentage"]["duplicate"] = (
+                PyFunceble.INTERN["counter"]["number"]["duplicate"]
+                * 100
+                // PyFunceble.INTERN["counter"]["number"]["tested"]
+            )
+
         # raise Exception(PyFunceble.INTERN["counter"]["percentage"])
 
     def log(self):
@@ -238,6 +258,19 @@ class Percentage:
                 del PyFunceble.INTERN["counter"]["number"]["up"]
                 del PyFunceble.INTERN["counter"]["number"]["down"]
 
+            if PyFunceble.INTERN["counter"]["number"].get("duplicate"):
+                # Some duplicates were skipped.
+
+                # We append their line.
+                lines_to_print.append(
+                    [
+                        "DUPLICATE",
+                        str(PyFunceble.INTERN["counter"]["percentage"]["duplicate"])
+                        + "%",
+                        PyFunceble.INTERN["counter"]["number"]["duplicate"],
+                    ]
+                )
+
             if (
                 not PyFunceble.CONFIGURATION.quiet
                 and not PyFunceble.CONFIGURATION.simple
@@ -60,6 +60,7 @@ License:
 
 from collections import OrderedDict
 from datetime import datetime
+from json import dumps
 
 from colorama import Back, Fore, Style
 
@@ -90,6 +91,10 @@ class Prints:
         Tell us if we only have to print on file and not on screen.
     """
 
+    # Saves the JSON files which have some data waiting in their
+    # JSON Lines file.
+    pending_json_files = set()
+
     def __init__(self, to_print, template, output_file=None, only_on_file=False):
         # We get the template.
         self.template = template
@@ -481,7 +486,9 @@ class Prints:
                         # An output destination is given.
 
                         # We write the file with the formatted header template.
-                        self.file_output_instance.write(formatted_template + "\n")
+                        PyFunceble.output.OutputSink.write(
+                            self.output, formatted_template + "\n"
+                        )
 
     def data_constructor(self, size):
         """
@@ -588,62 +595,114 @@ class Prints:
     def _json_print(self):  # pragma: no cover
         """
         Management of the json template.
+
+        .. note::
+            We do not rewrite the JSON file for each subject. Instead, we append
+            our data to its JSON Lines file. It is consolidated into the JSON file
+            once at the end of the test (and at each autosave).
         """
 
         if self.output:
             # The given output is not empty.
 
-            if self.file_output_instance.exists():
-                # The given output already exist.
-
-                # We get the content of the output.
-                content = PyFunceble.helpers.Dict().from_json_file(
-                    self.file_output_instance.path
+            for data in self.data_to_print:
+                # We append each element as a JSON line.
+                PyFunceble.output.OutputSink.write(
+                    self.get_json_lines_file(self.output),
+                    dumps(data, ensure_ascii=False) + "\n",
                 )
 
-                if not content or isinstance(content, dict):
-                    content = []
+            self.pending_json_files.add(self.output)
+        else:
+            # The given output is empty.
 
-                if isinstance(content, list):
-                    # The content is a list.
+            # We raise an exception.
+            raise Exception("Empty output given.")
 
-                    # We extend the content with our data to print.
-                    content.extend(self.data_to_print)
+    @classmethod
+    def get_json_lines_file(cls, output):
+        """
+        Provides the JSON Lines file of the given JSON file.
 
-                    # We format our list.
-                    content = PyFunceble.helpers.List(content).custom_format(
-                        PyFunceble.engine.Sort.standard
-                    )
+        :param str output: The JSON file.
 
-                    if PyFunceble.CONFIGURATION.hierarchical_sorting:
-                        # The hierarchical sorting is activated.
+        :rtype: str
+        """
 
-                        # We format our content hierarchicaly
-                        content = PyFunceble.helpers.List(content).custom_format(
-                            PyFunceble.engine.Sort.hierarchical
-                        )
+        return output + "l"
+
+    @classmethod
+    def consolidate_json_lines(cls, output):
+        """
+        Consolidates the JSON Lines file of the given JSON file into it.
+        The result is the same as if we extended the JSON file
+        subject by subject.
 
-                    # We finally save our content into the file.
-                    PyFunceble.helpers.Dict(content).to_json_file(self.output)
-                else:
-                    # The content is not a list.
+        :param str output: The JSON file.
+        """
 
-                    # We raise an exception.
-                    raise Exception("Output not correctly formatted.")
-            else:
-                # The given output does not already exist.
-
-                # We save our data to print into the output.
-                #
-                # Note: We do not have to take care if self.data_to_print is a list
-                # formatted or not because this method should not be called if it is
-                # not the case.
-                PyFunceble.helpers.Dict(self.data_to_print).to_json_file(self.output)
-        else:
-            # The given output is empty.
+        # We write what's pending and release our handles before
+        # reading and deleting the JSON Lines file.
+        PyFunceble.output.OutputSink.close_all()
+
+        json_lines_file = PyFunceble.helpers.File(cls.get_json_lines_file(output))
+
+        if not json_lines_file.exists():
+            return
+
+        # We get the content of the output.
+        content = PyFunceble.helpers.Dict().from_json_file(output)
+
+        if not content or isinstance(content, dict):
+            content = []
+
+        if not isinstance(content, list):
+            # The content is not a list.
 
             # We raise an exception.
-            raise Exception("Empty output given.")
+            raise Exception("Output not correctly formatted.")
+
+        with open(json_lines_file.path, "r", encoding="utf-8") as file_stream:
+            for line in file_stream:
+                data = PyFunceble.helpers.Dict().from_json(
+                    line, return_dict_on_error=False
+                )
+
+                if data is not None:
+                    # Note: A (partially) written line is not decoded.
+                    content.append(data)
+
+        # We format our list.
+        content = PyFunceble.helpers.List(content).custom_format(
+            PyFunceble.engine.Sort.standard
+        )
+
+        if PyFunceble.CONFIGURATION.hierarchical_sorting:
+            # The hierarchical sorting is activated.
+
+            # We format our content hierarchicaly
+            content = PyFunceble.helpers.List(content).custom_format(
+                PyFunceble.engine.Sort.hierarchical
+            )
+
+        # We finally save our content into the file.
+        PyFunceble.helpers.Dict(content).to_json_file(output)
+
+        json_lines_file.delete()
+
+        cls.pending_json_files.discard(output)
+
+    @classmethod
+    def consolidate_pending_json_lines(cls):
+        """
+        Consolidates the JSON Lines files we appended to (since their last
+        consolidation) into their JSON file.
+        """
+
+        for output in sorted(cls.pending_json_files):
+            cls.consolidate_json_lines(output)
+
+        cls.pending_json_files.clear()
 
     def __get_print_size(self):  # pragma: no cover
         """
@@ -686,6 +745,65 @@ class Prints:
         # We get the size from the given template name.
         return self._size_from_header(self.headers[self.template])
 
+    def bulk_data(self, rows):
+        """
+        Management and input of the given rows (list of data to print) into
+        the table of the given output file, at once.
+
+        .. note::
+            Nothing is printed on screen.
+
+        :param list rows: The list of data to print.
+        """
+
+        if PyFunceble.CONFIGURATION.no_files or not self.output or not rows:
+            return
+
+        if self.template.lower() == "json":
+            # The template is the json template.
+
+            # We append each element as a JSON line.
+            PyFunceble.output.OutputSink.write(
+                self.get_json_lines_file(self.output),
+                "".join(
+                    dumps(x, ensure_ascii=False) + "\n" for data in rows for x in data
+                ),
+            )
+            return
+
+        # We initiate the template which have a size depending of the data.
+        variable_sizes = ["FullHosts", "PlainDomain", "Simple"]
+
+        self.data_to_print = rows[0]
+
+        # We initiate the size we are going to print.
+        to_print_size = self.__get_print_size()
+
+        # We print the before header section.
+        self.before_header()
+
+        to_write = []
+
+        for data in rows:
+            self.data_to_print = data
+
+            if self.template in variable_sizes:
+                if self.template == "Simple":
+                    # The size of the subject column is the one of the subject.
+                    self.headers["Simple"]["Subject"] = len(data[0])
+
+                to_print_size = self.__get_print_size()
+
+            to_write.extend(
+                x + "\n"
+                for x in self.header_constructor(
+                    self.data_constructor(to_print_size), False
+                )
+            )
+
+        # We write our data into the printed file.
+        PyFunceble.output.OutputSink.write(self.output, "".join(to_write))
+
     def data(self):  #  pragma: no cover  pylint: disable=inconsistent-return-statements
         """
         Management and input of data to the table.
@@ -760,7 +878,7 @@ class Prints:
                     # * The output is given.
 
                     # We write our data into the printed file.
-                    self.file_output_instance.write(data + "\n")
+                    PyFunceble.output.OutputSink.write(self.output, data + "\n")
         else:
             # This should never happend. If it's happens then there's a big issue
             # around data_to_print.
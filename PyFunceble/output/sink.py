@@ -0,0 +1,240 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provides the buffered writer of our output files.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from atexit import register as register_at_exit
+from collections import OrderedDict
+from os import fstat, getpid
+from threading import RLock
+from time import time
+
+import PyFunceble
+
+
+class OutputSink:
+    """
+    Buffers the lines we append into our output files and writes them
+    file by file, through a limited set of cached (append) handles.
+
+    ::
+
+        PyFunceble.output.OutputSink.write(
+            "output/domains/ACTIVE/list", "example.org\\n"
+        )
+
+    .. note::
+        The pending lines are written once :code:`output_buffer_size` lines
+        are waiting, once :code:`output_buffer_interval` seconds passed since
+        the last write, at each autosave, at the end of the test and at exit.
+    """
+
+    # Saves the pending data of each file.
+    # Format: {file_path: [data, ...]}
+    pending = {}
+    # Saves the number of pending lines.
+    pending_size = 0
+    # Saves the process which owns the pending data and the handles.
+    pending_pid = None
+    # Saves the time of the last write.
+    last_flush = time()
+
+    # Saves our open handles. The least recently used comes first.
+    # Format: {file_path: handle}
+    handles = OrderedDict()
+
+    # Serializes the usage of our buffer when we are used from
+    # multiple threads.
+    lock = RLock()
+
+    @classmethod
+    def reset_if_forked(cls):
+        """
+        Forgets the pending data and the handles we inherited from our
+        parent process. The pending data are written by our parent process.
+        """
+
+        with cls.lock:
+            if cls.pending_pid != getpid():
+                cls.pending = {}
+                cls.pending_size = 0
+                cls.pending_pid = getpid()
+
+                for handle in cls.handles.values():
+                    # Note: This only closes our copy of the descriptor.
+                    handle.close()
+
+                cls.handles = OrderedDict()
+
+    @classmethod
+    def write(cls, file_path, data):
+        """
+        Appends the given data to the given file.
+
+        :param str file_path: The file to write into.
+        :param str data: The data to append.
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            if file_path in cls.pending:
+                cls.pending[file_path].append(data)
+            else:
+                cls.pending[file_path] = [data]
+
+            cls.pending_size += 1
+
+            if (
+                cls.pending_size >= PyFunceble.CONFIGURATION.output_buffer_size
+                or time() - cls.last_flush
+                >= PyFunceble.CONFIGURATION.output_buffer_interval
+            ):
+                cls.flush()
+
+    @classmethod
+    def __get_handle(cls, file_path):
+        """
+        Provides the (append) handle of the given file.
+        We close the least recently used one if we have too many of them.
+
+        :param str file_path: The file we are working with.
+        """
+
+        if file_path in cls.handles:
+            if fstat(cls.handles[file_path].fileno()).st_nlink:
+                cls.handles.move_to_end(file_path)
+
+                return cls.handles[file_path]
+
+            # The file was deleted (by another process) since we opened it.
+            cls.handles.pop(file_path).close()
+
+        while cls.handles and len(cls.handles) >= max(
+            1, PyFunceble.CONFIGURATION.output_max_open_files
+        ):
+            cls.handles.popitem(last=False)[1].close()
+
+        # We do not buffer at this level: each flush of a file is a single
+        # write, so our lines never mix with the ones of other processes.
+        # Note: Our handles outlive this method. They are closed by close_all().
+        cls.handles[file_path] = open(  # pylint: disable=consider-using-with
+            file_path, "ab", buffering=0
+        )
+
+        return cls.handles[file_path]
+
+    @classmethod
+    def flush(cls, file_path=None):
+        """
+        Writes the pending data.
+
+        :param str file_path:
+            The file to write. If not given, we write all files.
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            if file_path:
+                files = [file_path]
+            else:
+                files = list(cls.pending)
+
+            for file in files:
+                data = cls.pending.pop(file, None)
+
+                if not data:
+                    continue
+
+                try:
+                    to_write = memoryview("".join(data).encode("utf-8"))
+                    handle = cls.__get_handle(file)
+
+                    while to_write:
+                        to_write = to_write[handle.write(to_write) :]
+                except Exception:
+                    # We put the data back so that we can try again later.
+                    cls.pending[file] = data
+                    raise
+
+                cls.pending_size -= len(data)
+
+            cls.last_flush = time()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Writes the pending data and closes all our handles.
+
+        .. note::
+            This should be called before we delete or move any output file.
+        """
+
+        cls.reset_if_forked()
+
+        with cls.lock:
+            cls.flush()
+
+            for handle in cls.handles.values():
+                handle.close()
+
+            cls.handles.clear()
+
+
+register_at_exit(OutputSink.close_all)
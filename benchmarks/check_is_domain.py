@@ -0,0 +1,159 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Micro-benchmark of the domain syntax check (:code:`Check(subject).is_domain()`)
+which relies on the (cached) compiled patterns of :code:`helpers.Regex`.
+
+Usage:
+
+::
+
+    PYFUNCEBLE_AUTO_CONFIGURATION=YES python benchmarks/check_is_domain.py
+
+To compare with another version, give the path of its checkout with
+:code:`--path`.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+# pylint: enable=line-too-long
+
+import argparse
+import os
+import string
+import sys
+import time
+from random import Random
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXTENSIONS = ["com", "org", "net", "de", "fr", "co.uk", "io", "xyz", "invalidtld"]
+
+
+def get_domains(number_of_domains):
+    """
+    Provides the (random) domains to check.
+
+    :param int number_of_domains: The number of domains to generate.
+
+    :rtype: list
+    """
+
+    # We want the same domains from a run to another.
+    random = Random(1)
+    characters = string.ascii_lowercase + string.digits + "-"
+
+    result = []
+
+    for _ in range(number_of_domains):
+        label = (
+            "".join(
+                random.choice(characters) for _ in range(random.randint(3, 20))
+            ).strip("-")
+            or "a"
+        )
+        prefix = random.choice(["", "www.", "sub.", "a-b."])
+
+        result.append(f"{prefix}{label}.{random.choice(EXTENSIONS)}")
+
+    return result
+
+
+def main():
+    """
+    Provides the entry point of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmark of the domain syntax check."
+    )
+    parser.add_argument("-n", "--domains", type=int, default=100000)
+    parser.add_argument("-r", "--repeat", type=int, default=7)
+    parser.add_argument(
+        "--path",
+        default=ROOT_DIRECTORY,
+        help="The path of the PyFunceble checkout to benchmark.",
+    )
+
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.path))
+
+    # pylint: disable=import-outside-toplevel
+    import PyFunceble
+
+    PyFunceble.load_config(generate_directory_structure=False)
+
+    domains = get_domains(args.domains)
+
+    best = None
+    result = []
+
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = [PyFunceble.Check(x).is_domain() for x in domains]
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    print(
+        f"{os.path.abspath(args.path)}: {best:.3f}s for {args.domains} "
+        f"is_domain() | best of {args.repeat} | {sum(result)} valid"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Benchmark of the expiration date extractor: the precompiled patterns (and
+their keyword pre-filter) versus the :code:`findall()` of each pattern
+through :code:`helpers.Regex`, as we used to do.
+
+Usage:
+
+::
+
+    python benchmarks/expiration_date.py
+
+The records are synthetic WHOIS records built from the expiration date
+markers and the date samples of our test suite, plus one record per
+marker/date pair. We also check that both ways extract the same dates.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+# pylint: enable=line-too-long
+
+import argparse
+import os
+import sys
+import time
+from random import Random
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FILLER = [
+    "Domain Name: EXAMPLE%d.COM",
+    "Registry Domain ID: 2336799_DOMAIN_COM-VRSN",
+    "Registrar WHOIS Server: whois.example-registrar.com",
+    "Registrar URL: http://www.example.com",
+    "Updated Date: 2019-08-14T07:04:41Z",
+    "Creation Date: 1995-08-14T04:00:00Z",
+    "Registrar: Example Registrar, Inc.",
+    "Registrar IANA ID: 376",
+    "Registrar Abuse Contact Email: abuse@example.com",
+    "Domain Status: clientTransferProhibited "
+    "https://icann.org/epp#clientTransferProhibited",
+    "Name Server: A.IANA-SERVERS.NET",
+    "Name Server: B.IANA-SERVERS.NET",
+    "DNSSEC: signedDelegation",
+    "URL of the ICANN Whois Inaccuracy Complaint Form: https://www.icann.org/wicf/",
+    ">>> Last update of whois database: 2020-03-03T10:45:41Z <<<",
+] + [
+    "NOTICE: The expiration date displayed in this record is the date the "
+    "registrar's sponsorship of the domain name registration in the registry "
+    "is currently set to expire. "
+] * 2
+
+
+def get_samples():
+    """
+    Provides the expiration date markers and the date samples of our
+    test suite.
+
+    :rtype: tuple
+    """
+
+    sys.path.insert(0, os.path.join(ROOT_DIRECTORY, "tests"))
+
+    # pylint: disable=import-outside-toplevel
+    from test_extractor_expiration_date import TestExpirationDate
+
+    test_case = TestExpirationDate()
+    test_case.setUp()
+
+    return test_case.expiration_date_markers, test_case.dates_samples
+
+
+def get_records(number_of_records):
+    """
+    Provides the records to extract from.
+
+    :param int number_of_records: The number of synthetic records.
+
+    :rtype: list
+    """
+
+    markers, dates = get_samples()
+
+    # We want the same records from a run to another.
+    random = Random(42)
+    result = []
+
+    for index in range(number_of_records):
+        lines = [x.replace("%d", str(index)) for x in FILLER]
+        random.shuffle(lines)
+
+        kind = index % 10
+
+        if kind < 8:
+            # A record with one marker.
+            lines.insert(
+                random.randrange(len(lines)),
+                random.choice(markers) + " " + random.choice(dates),
+            )
+        elif kind == 8:
+            # A record with multiple markers.
+            lines.insert(3, random.choice(markers) + " " + random.choice(dates))
+            lines.insert(9, random.choice(markers) + " " + random.choice(dates))
+            lines.insert(1, random.choice(markers) + " no date")
+
+        # Otherwise, a record without marker.
+
+        result.append("\n".join(lines))
+
+    result.extend(f"{x} {y}" for x in markers for y in dates)
+
+    return result
+
+
+def get_findall_extractor():
+    """
+    Provides a method which extracts the expiration date of a given record
+    with the :code:`findall()` of each pattern.
+
+    :rtype: function
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import PyFunceble.helpers as helpers
+    from PyFunceble.extractor import ExpirationDate
+
+    # We reuse the (unchanged) formatting of the groups of a date.
+    # pylint: disable=protected-access
+    format_management = ExpirationDate("")._ExpirationDate__format_management
+
+    def format_it(data):
+        """
+        Formats the given date.
+        """
+
+        for index, regex in ExpirationDate.regex_dates.items():
+            matched = helpers.Regex(regex).match(data, return_match=True, rematch=True)
+
+            if not matched:
+                continue
+
+            date = format_management(index, matched)
+
+            if not date:
+                continue
+
+            return "-".join(date)
+        return None
+
+    def extract_it(data):
+        """
+        Extracts the expiration date of the given record.
+        """
+
+        for regex in ExpirationDate.expiration_patterns:
+            expiration_date = helpers.Regex(regex).match(
+                data, return_match=True, rematch=True, group=0
+            )
+
+            if not expiration_date:
+                continue
+
+            expiration_date = expiration_date[0].strip()
+
+            if helpers.Regex(ExpirationDate.regex_numbers).match(
+                expiration_date, return_match=True
+            ):
+                return format_it(expiration_date)
+
+        return None
+
+    return extract_it
+
+
+def run(method, records, repeat):
+    """
+    Runs the given method over all records.
+
+    :return: The best duration and the extracted dates.
+    :rtype: tuple
+    """
+
+    best = None
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = [method(x) for x in records]
+        duration = time.perf_counter() - start
+
+        if best is None or duration < best:
+            best = duration
+
+    return best, result
+
+
+def main():
+    """
+    Provides the entry point of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the expiration date extractor."
+    )
+    parser.add_argument("-n", "--records", type=int, default=3000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT_DIRECTORY)
+
+    # pylint: disable=import-outside-toplevel
+    from PyFunceble.extractor import ExpirationDate
+
+    records = get_records(args.records)
+
+    findall_duration, findall_result = run(
+        get_findall_extractor(), records, args.repeat
+    )
+    duration, result = run(
+        lambda x: ExpirationDate(x).get_extracted(), records, args.repeat
+    )
+
+    print(
+        f"{len(records)} records | best of {args.repeat} | "
+        f"{sum(1 for x in result if x)} extracted"
+    )
+    print(f"findall(): {findall_duration:.3f}s")
+    print(
+        f"precompiled: {duration:.3f}s ({findall_duration / duration:.1f}x) | "
+        f"identical: {findall_result == result}"
+    )
+
+
+if __name__ == "__main__":
+    main()
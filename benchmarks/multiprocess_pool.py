@@ -0,0 +1,224 @@
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Benchmark of the multiprocessing core: long-lived workers (pool) versus one
+process per subject.
+
+Usage:
+
+::
+
+    PYFUNCEBLE_AUTO_CONFIGURATION=YES python benchmarks/multiprocess_pool.py
+
+Each mode runs (in its own process and working directory) a syntax test of
+the same generated list, with the DNS lookups stubbed out (no network) and
+the auto-continue mode switched off.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+# pylint: enable=line-too-long
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DNS_RECORDS = [
+    "a_record",
+    "aaaa_record",
+    "cname_record",
+    "dname_record",
+    "mx_record",
+    "ns_record",
+    "txt_record",
+    "ptr_record",
+]
+
+
+def run_child(file, processes, chunk_size, pool):
+    """
+    Runs the test of the given file (into the current working directory).
+    """
+
+    sys.path.insert(0, ROOT_DIRECTORY)
+
+    # pylint: disable=import-outside-toplevel
+    import PyFunceble
+    from PyFunceble.core.multiprocess import MultiprocessCore
+
+    PyFunceble.load_config(
+        generate_directory_structure=True,
+        custom={
+            "auto_continue": False,
+            "db_type": "json",
+            "inactive_database": False,
+            "maximal_processes": processes,
+            "multiprocess": True,
+            "multiprocess_chunk_size": chunk_size,
+            "multiprocess_worker_pool": pool,
+            "quiet": True,
+            "syntax": True,
+            "whois_database": False,
+        },
+    )
+
+    for record in DNS_RECORDS:
+        # We never want to touch the network.
+        setattr(PyFunceble.lookup.Dns, record, lambda *args, **kwargs: None)
+
+    PyFunceble.INTERN["start"] = datetime.now().timestamp()
+
+    MultiprocessCore(file).run_test()
+
+
+def run_mode(subjects, processes, chunk_size, pool):
+    """
+    Runs the given mode into a fresh working directory.
+
+    :return: The duration of the run and the number of tested subjects.
+    :rtype: tuple
+    """
+
+    working_directory = tempfile.mkdtemp()
+
+    try:
+        shutil.copy(
+            os.path.join(ROOT_DIRECTORY, "dir_structure_production.json"),
+            os.path.join(working_directory, "dir_structure.json"),
+        )
+
+        with open(
+            os.path.join(working_directory, "list.txt"), "w", encoding="utf-8"
+        ) as file_stream:
+            file_stream.write("\n".join(subjects) + "\n")
+
+        start = time.perf_counter()
+
+        subprocess.run(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--child",
+                "--processes",
+                str(processes),
+                "--chunk-size",
+                str(chunk_size),
+            ]
+            + (["--pool"] if pool else []),
+            cwd=working_directory,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+        duration = time.perf_counter() - start
+
+        tested = 0
+
+        for root, _, files in os.walk(os.path.join(working_directory, "output")):
+            if os.path.basename(root) in ["VALID", "INVALID"] and "list" in files:
+                with open(
+                    os.path.join(root, "list"), "r", encoding="utf-8"
+                ) as file_stream:
+                    tested += sum(
+                        1 for x in file_stream if x.strip() and not x.startswith("#")
+                    )
+
+        return duration, tested
+    finally:
+        shutil.rmtree(working_directory, ignore_errors=True)
+
+
+def main():
+    """
+    Provides the entry point of the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the multiprocessing core (pool or not)."
+    )
+    parser.add_argument("-n", "--subjects", type=int, default=3000)
+    parser.add_argument("-p", "--processes", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--pool", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.child:
+        run_child("list.txt", args.processes, args.chunk_size, args.pool)
+        return
+
+    subjects = [f"example{x}.com" for x in range(args.subjects)]
+
+    print(
+        f"{args.subjects} subjects | {args.processes} processes | "
+        f"chunk size: {args.chunk_size}"
+    )
+
+    for pool, name in [(False, "one process per subject"), (True, "pool")]:
+        duration, tested = run_mode(subjects, args.processes, args.chunk_size, pool)
+
+        print(f"{name}: {duration:.2f}s ({tested} tested)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.core.api.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from os import makedirs
+from tempfile import TemporaryDirectory
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.core.api import APICore
+from stdout_base import StdoutBase
+
+
+class TestAPICoreJSON(StdoutBase):
+    """
+    Tests of the JSON file generation from the API.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        # We keep the current values so that we can restore them once done.
+        self.previous_config = {
+            x: y for x, y in PyFunceble.CONFIGURATION.items() if not isinstance(y, dict)
+        }
+        self.previous_api_config = PyFunceble.INTERN.get("api_config_loaded")
+
+        self.configuration = {
+            "api_file_generation": True,
+            "db_type": "json",
+            "generate_hosts": False,
+            "generate_json": True,
+            "plain_list_domain": False,
+            "split": False,
+            "unified": False,
+            "whois_database": False,
+        }
+
+        StdoutBase.setUp(self)
+
+        self.temp_directory = TemporaryDirectory()
+        self.output_directory = self.temp_directory.name + "/"
+
+        self.json_file = (
+            self.output_directory
+            + PyFunceble.OUTPUTS.parent_directory
+            + PyFunceble.OUTPUTS.json.directory
+            + PyFunceble.STATUS.official.valid
+            + "/"
+            + PyFunceble.OUTPUTS.json.filename
+        )
+
+        makedirs(self.json_file[: self.json_file.rfind("/")])
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        StdoutBase.tearDown(self)
+
+        self.temp_directory.cleanup()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom=self.previous_config
+        )
+
+        if self.previous_api_config is None:
+            PyFunceble.INTERN.pop("api_config_loaded", None)
+        else:
+            PyFunceble.INTERN["api_config_loaded"] = self.previous_api_config
+
+    def test_consolidated(self):
+        """
+        Tests that the JSON file is up to date after each test.
+        """
+
+        with patch.object(PyFunceble, "OUTPUT_DIRECTORY", self.output_directory):
+            APICore("example.org", configuration=self.configuration).syntax("domain")
+
+            expected = ["example.org"]
+            actual = PyFunceble.helpers.Dict().from_json_file(self.json_file)
+
+            self.assertEqual(expected, actual)
+
+            APICore("example.net", configuration=self.configuration).syntax("domain")
+
+        expected = ["example.net", "example.org"]
+        actual = PyFunceble.helpers.Dict().from_json_file(self.json_file)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = PyFunceble.helpers.File(
+            PyFunceble.output.Prints.get_json_lines_file(self.json_file)
+        ).exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_not_consolidated_from_child(self):
+        """
+        Tests that the JSON Lines file is left to our parent when we
+        are run from a child process.
+        """
+
+        with patch.object(PyFunceble, "OUTPUT_DIRECTORY", self.output_directory):
+            APICore(
+                "example.org", configuration=self.configuration, is_parent=False
+            ).syntax("domain")
+
+        PyFunceble.output.OutputSink.close_all()
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.json_file).exists()
+
+        self.assertEqual(expected, actual)
+
+        expected = True
+        actual = PyFunceble.helpers.File(
+            PyFunceble.output.Prints.get_json_lines_file(self.json_file)
+        ).exists()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.output.Prints.pending_json_files.clear()
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,264 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.core.file.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from datetime import datetime
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.core.file import FileCore
+from stdout_base import StdoutBase
+
+
+class TestFileCoreSubjectsToTest(StdoutBase):
+    """
+    Tests of the subjects we read from the file to test.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        custom = {
+            "adblock": False,
+            "auto_continue": False,
+            "db_type": "json",
+            "filter": None,
+            "idna_conversion": False,
+            "inactive_database": False,
+            "local": False,
+            "mining": False,
+            "no_files": True,
+            "quiet": True,
+            "syntax": True,
+        }
+
+        # We keep the current values so that we can restore them once done.
+        self.previous_config = {x: PyFunceble.CONFIGURATION[x] for x in custom}
+
+        PyFunceble.load_config(generate_directory_structure=False, custom=custom)
+
+        PyFunceble.INTERN["start"] = datetime.now().timestamp()
+
+        StdoutBase.setUp(self)
+
+        # We keep the list of up statuses as CLICore extends it.
+        self.up_statuses = list(PyFunceble.STATUS.list.up)
+
+        self.file = PyFunceble.CONFIG_DIRECTORY + "hello_world_file_core.list"
+        self.file_instance = PyFunceble.helpers.File(self.file)
+
+        self.core = FileCore(self.file)
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        StdoutBase.tearDown(self)
+
+        self.file_instance.delete()
+
+        # We remove the namespace we created into the (shared) mining database.
+        PyFunceble.engine.Mining.database.pop(self.file, None)
+
+        PyFunceble.STATUS.list.up[:] = self.up_statuses
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom=self.previous_config
+        )
+
+    def test_streaming(self):
+        """
+        Tests that we only read the stream as far as we need.
+        """
+
+        stream = iter(["example.org\n", "example.net\n", "example.com\n"])
+
+        subjects = self.core.get_subjects_to_test(stream)
+
+        expected = "example.org"
+        actual = next(subjects)
+
+        self.assertEqual(expected, actual)
+
+        expected = ["example.net\n", "example.com\n"]
+        actual = list(stream)
+
+        self.assertEqual(expected, actual)
+
+    def test_comments_and_ignored(self):
+        """
+        Tests that the comments, the empty lines and the subjects we have to
+        ignore are not given.
+        """
+
+        stream = [
+            "# Hello, World!\n",
+            "\n",
+            "example.org\n",
+            "localhost\n",
+            "0.0.0.0 example.net\n",
+            "192.168.1.1\n",
+            "example.com # Hello, World!\n",
+        ]
+
+        expected = ["example.org", "example.net", "example.com"]
+        actual = list(self.core.get_subjects_to_test(stream))
+
+        self.assertEqual(expected, actual)
+
+    def test_already_tested(self):
+        """
+        Tests that the subjects of the auto-continue database are not given.
+        """
+
+        with patch.object(
+            self.core.autocontinue,
+            "is_already_tested",
+            side_effect=lambda x: x == "example.org",
+        ):
+            expected = ["example.net"]
+            actual = list(
+                self.core.get_subjects_to_test(["example.org\n", "example.net\n"])
+            )
+
+        self.assertEqual(expected, actual)
+
+    def test_ignore_inactive_db_check(self):
+        """
+        Tests that the subjects of the inactive database are only given
+        when we are asked to ignore the inactive database.
+        """
+
+        stream = ["example.org\n", "example.net\n"]
+
+        with patch.object(
+            self.core.inactive_db,
+            "is_already_tested",
+            side_effect=lambda x: x == "example.org",
+        ):
+            expected = ["example.net"]
+            actual = list(self.core.get_subjects_to_test(stream))
+
+            self.assertEqual(expected, actual)
+
+            expected = ["example.org", "example.net"]
+            actual = list(
+                self.core.get_subjects_to_test(stream, ignore_inactive_db_check=True)
+            )
+
+            self.assertEqual(expected, actual)
+
+    def test_mined(self):
+        """
+        Tests that the mined subjects are removed from the mining database
+        once read.
+        """
+
+        with patch.object(self.core.mining, "remove") as remove:
+            expected = ["www.example.org"]
+            actual = list(
+                self.core.get_subjects_to_test([("example.org", "www.example.org")])
+            )
+
+        self.assertEqual(expected, actual)
+
+        remove.assert_called_once_with("example.org", "www.example.org")
+
+    def test_run_test(self):
+        """
+        Tests that each subject is only checked and tested once.
+        """
+
+        self.file_instance.write("# Hello, World!\nexample.org\nexample.net\n")
+
+        with patch.object(
+            FileCore, "should_be_ignored", wraps=FileCore.should_be_ignored
+        ) as should_be_ignored, patch.object(
+            FileCore, "test", side_effect=lambda x: {"tested": x}
+        ) as test, patch.object(
+            FileCore, "post_test_treatment"
+        ), patch.object(
+            self.core.dedupe, "remember"
+        ), patch.object(
+            FileCore, "cleanup"
+        ):
+            self.core.run_test()
+
+        # The comment is converted to nothing.
+        expected = [None, "example.org", "example.net"]
+        actual = [x[0][0] for x in should_be_ignored.call_args_list]
+
+        self.assertEqual(expected, actual)
+
+        expected = ["example.org", "example.net"]
+        actual = [x[0][0] for x in test.call_args_list]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,364 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.core.multiprocess.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+# pylint: enable=line-too-long
+
+from datetime import datetime
+from queue import Queue
+from unittest import main as launch_tests
+from unittest.mock import Mock, patch
+
+import PyFunceble
+from PyFunceble.core.multiprocess import MultiprocessCore
+from PyFunceble.engine.dedupe import Dedupe
+from stdout_base import StdoutBase
+
+
+class TestMultiprocessCorePool(StdoutBase):
+    """
+    Tests of the worker pool of PyFunceble.core.multiprocess.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        custom = {
+            "auto_continue": False,
+            "db_type": "json",
+            "inactive_database": False,
+            "mining": False,
+            "multiprocess_chunk_size": 2,
+            "multiprocess_merging_mode": "end",
+            "no_files": True,
+            "quiet": True,
+            "syntax": True,
+        }
+
+        # We keep the current values so that we can restore them once done.
+        self.previous_config = {x: PyFunceble.CONFIGURATION[x] for x in custom}
+
+        PyFunceble.load_config(generate_directory_structure=False, custom=custom)
+
+        PyFunceble.INTERN["start"] = datetime.now().timestamp()
+
+        StdoutBase.setUp(self)
+
+        # We keep the list of up statuses as CLICore extends it.
+        self.up_statuses = list(PyFunceble.STATUS.list.up)
+
+        self.file = "hello_world_multiprocess.list"
+        self.core = MultiprocessCore(self.file)
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        StdoutBase.tearDown(self)
+
+        # We remove the namespace we created into the (shared) mining database.
+        PyFunceble.engine.Mining.database.pop(self.file, None)
+
+        PyFunceble.STATUS.list.up[:] = self.up_statuses
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom=self.previous_config
+        )
+
+    @staticmethod
+    def get_result(subject):
+        """
+        Provides a fake result of the test of the given subject.
+        """
+
+        result = dict.fromkeys(Dedupe.result_indexes)
+        result.update({"tested": subject, "status": "VALID"})
+
+        return result
+
+    @staticmethod
+    def get_queue_content(queue):
+        """
+        Provides (and consumes) the content of the given queue.
+        """
+
+        result = []
+
+        while not queue.empty():
+            result.append(queue.get())
+
+        return result
+
+    def get_pool(self, workers=1):
+        """
+        Provides a pool (without any process) we can work with.
+        """
+
+        return (
+            Queue(),
+            Queue(),
+            [Mock(is_alive=Mock(return_value=True)) for _ in range(workers)],
+        )
+
+    def test_pool_worker(self):
+        """
+        Tests that a worker tests the chunks it gets and stops once it
+        gets :code:`None`.
+        """
+
+        task_queue, result_queue = Queue(), Queue()
+
+        for task in [(False, ["a.org", "b.org"]), (False, ["c.org"]), None]:
+            task_queue.put(task)
+
+        with patch.object(MultiprocessCore, "prepare_worker"), patch.object(
+            MultiprocessCore,
+            "test_subject",
+            side_effect=lambda x, _: self.get_result(x),
+        ):
+            self.core.pool_worker(task_queue, result_queue, None, {}, {})
+
+        expected = [
+            ("results", [self.get_result("a.org"), self.get_result("b.org")]),
+            ("results", [self.get_result("c.org")]),
+        ]
+        actual = self.get_queue_content(result_queue)
+
+        self.assertEqual(expected, actual)
+
+        expected = True
+        actual = task_queue.empty()
+
+        self.assertEqual(expected, actual)
+
+    def test_pool_worker_exception(self):
+        """
+        Tests that a worker reports the exceptions and keeps working until
+        it gets :code:`None`.
+        """
+
+        task_queue, result_queue = Queue(), Queue()
+
+        for task in [(False, ["a.org"]), (False, ["b.org"]), None]:
+            task_queue.put(task)
+
+        def test_subject(subject, _):
+            if subject == "a.org":
+                raise ValueError("Hello, World!")
+
+            return self.get_result(subject)
+
+        with patch.object(MultiprocessCore, "prepare_worker"), patch.object(
+            MultiprocessCore, "test_subject", side_effect=test_subject
+        ):
+            self.core.pool_worker(task_queue, result_queue, None, {}, {})
+
+        actual = self.get_queue_content(result_queue)
+
+        self.assertEqual(2, len(actual))
+
+        self.assertEqual("exception", actual[0][0])
+        self.assertIn("ValueError: Hello, World!", actual[0][1])
+
+        self.assertEqual(("results", [self.get_result("b.org")]), actual[1])
+
+    def test_run_pool_test(self):
+        """
+        Tests that the subjects are sent to the pool by chunk and that all
+        results are handled.
+        """
+
+        task_queue, result_queue, workers = pool = self.get_pool()
+
+        for message in [
+            ("results", [self.get_result("a.org"), self.get_result("b.org")]),
+            ("results", [self.get_result("c.org"), self.get_result("d.org")]),
+            ("results", [self.get_result("e.org")]),
+        ]:
+            result_queue.put(message)
+
+        with patch.object(MultiprocessCore, "post_test_treatment") as treatment:
+            # pylint: disable=protected-access
+            self.core._MultiprocessCore__run_pool_test(
+                iter(["a.org", "b.org", "c.org", "d.org", "e.org"]), pool
+            )
+
+        expected = [
+            (False, ["a.org", "b.org"]),
+            (False, ["c.org", "d.org"]),
+            (False, ["e.org"]),
+        ]
+        actual = self.get_queue_content(task_queue)
+
+        self.assertEqual(expected, actual)
+
+        expected = ["a.org", "b.org", "c.org", "d.org", "e.org"]
+        actual = [x[0][0]["tested"] for x in treatment.call_args_list]
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = self.core.in_flight
+
+        self.assertEqual(expected, actual)
+
+        self.assertEqual(1, len(workers))
+
+    def test_run_pool_test_merging(self):
+        """
+        Tests that the results are only merged once (at the end) with the
+        JSON database types and once per chunk with the SQL ones.
+        """
+
+        for db_type, expected in [("json", 1), ("json_journal", 1), ("sqlite", 4)]:
+            PyFunceble.CONFIGURATION.db_type = db_type
+
+            # We test the same subjects for each database type.
+            self.core.dedupe = Dedupe()
+
+            _, result_queue, _ = pool = self.get_pool()
+
+            for message in [
+                ("results", [self.get_result("a.org"), self.get_result("b.org")]),
+                ("results", [self.get_result("c.org"), self.get_result("d.org")]),
+                ("results", [self.get_result("e.org")]),
+            ]:
+                result_queue.put(message)
+
+            with patch.object(
+                MultiprocessCore, "_MultiprocessCore__merge_processes_data"
+            ) as merge:
+                # pylint: disable=protected-access
+                self.core._MultiprocessCore__run_pool_test(
+                    iter(["a.org", "b.org", "c.org", "d.org", "e.org"]), pool
+                )
+
+            actual = merge.call_count
+
+            self.assertEqual(expected, actual, db_type)
+
+    def test_collect_pool_results_exception(self):
+        """
+        Tests that we stop the pool and exit when a worker reports an
+        exception, and that a stopped pool is not stopped twice.
+        """
+
+        task_queue, result_queue, workers = pool = self.get_pool(workers=2)
+        stopped_workers = list(workers)
+
+        result_queue.put(("exception", "Hello, World!"))
+
+        with patch.object(MultiprocessCore, "post_test_treatment"):
+            # pylint: disable=protected-access
+            self.assertRaises(
+                SystemExit,
+                self.core._MultiprocessCore__collect_pool_results,
+                pool,
+                [],
+            )
+
+        for worker in stopped_workers:
+            worker.terminate.assert_called_once_with()
+            worker.join.assert_called_once_with()
+
+        expected = []
+        actual = workers
+
+        self.assertEqual(expected, actual)
+
+        # pylint: disable=protected-access
+        self.core._MultiprocessCore__stop_pool(pool)
+
+        expected = True
+        actual = task_queue.empty()
+
+        self.assertEqual(expected, actual)
+
+        for worker in stopped_workers:
+            worker.join.assert_called_once_with()
+
+    def test_stop_pool(self):
+        """
+        Tests that we send :code:`None` to each worker to stop them.
+        """
+
+        task_queue, _, workers = pool = self.get_pool(workers=2)
+        stopped_workers = list(workers)
+
+        # pylint: disable=protected-access
+        self.core._MultiprocessCore__stop_pool(pool)
+
+        expected = [None, None]
+        actual = self.get_queue_content(task_queue)
+
+        self.assertEqual(expected, actual)
+
+        for worker in stopped_workers:
+            worker.terminate.assert_not_called()
+            worker.join.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    launch_tests()
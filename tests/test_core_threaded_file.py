@@ -0,0 +1,373 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.core.threaded_file.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import sleep
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.core.file import FileCore
+from PyFunceble.core.threaded_file import ThreadedFileCore
+from PyFunceble.database.whois import WhoisDB
+from PyFunceble.engine.dedupe import Dedupe
+from PyFunceble.output.generate import Generate
+from stdout_base import StdoutBase
+
+
+class TestThreadedFileCore(StdoutBase):
+    """
+    Tests of the threaded file core.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        custom = {
+            "adblock": False,
+            "auto_continue": False,
+            "db_type": "json",
+            "dedupe": True,
+            "filter": None,
+            "idna_conversion": False,
+            "inactive_database": False,
+            "local": False,
+            "maximal_threads": 2,
+            "mining": False,
+            "no_files": True,
+            "quiet": True,
+            "syntax": True,
+            "threaded": True,
+        }
+
+        # We keep the current values so that we can restore them once done.
+        self.previous_config = {x: PyFunceble.CONFIGURATION[x] for x in custom}
+
+        PyFunceble.load_config(generate_directory_structure=False, custom=custom)
+
+        PyFunceble.INTERN["start"] = datetime.now().timestamp()
+
+        StdoutBase.setUp(self)
+
+        # We keep the list of up statuses as CLICore extends it.
+        self.up_statuses = list(PyFunceble.STATUS.list.up)
+
+        self.file = PyFunceble.CONFIG_DIRECTORY + "hello_world_threaded_file_core.list"
+        self.file_instance = PyFunceble.helpers.File(self.file)
+
+        self.core = ThreadedFileCore(self.file)
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        StdoutBase.tearDown(self)
+
+        self.file_instance.delete()
+
+        # We remove the namespace we created into the (shared) mining database.
+        PyFunceble.engine.Mining.database.pop(self.file, None)
+
+        PyFunceble.STATUS.list.up[:] = self.up_statuses
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom=self.previous_config
+        )
+
+    @classmethod
+    def get_result(cls, subject):
+        """
+        Provides a (fake) test result of the given subject.
+        """
+
+        result = dict.fromkeys(Dedupe.result_indexes)
+        result.update({"tested": subject, "status": "VALID"})
+
+        return result
+
+    def run_test(self, test):
+        """
+        Runs the test of the file with the given test method
+        and provides the treated results and the replayed ones.
+        """
+
+        with patch.object(FileCore, "test", side_effect=test), patch.object(
+            FileCore, "post_test_treatment"
+        ) as post_test_treatment, patch.object(
+            FileCore, "replay_duplicate"
+        ) as replay_duplicate, patch.object(
+            FileCore, "cleanup"
+        ), patch(
+            "PyFunceble.output.Percentage.count_duplicate"
+        ):
+            self.core.run_test()
+
+        return (
+            [x[0][0] for x in post_test_treatment.call_args_list],
+            [x[0][0] for x in replay_duplicate.call_args_list],
+        )
+
+    def test_dispatch(self):
+        """
+        Tests that the tests are dispatched into our (bounded) pool of threads.
+        """
+
+        self.file_instance.write(
+            "\n".join(f"{x}.example.org" for x in range(10)) + "\n"
+        )
+
+        threads = {}
+
+        def test(subject):
+            threads[subject] = threading.current_thread()
+
+            return self.get_result(subject)
+
+        self.run_test(test)
+
+        expected = [f"{x}.example.org" for x in range(10)]
+        actual = sorted(threads, key=lambda x: int(x.split(".")[0]))
+
+        self.assertEqual(expected, actual)
+
+        self.assertNotIn(threading.main_thread(), threads.values())
+        self.assertLessEqual(len(set(threads.values())), 2)
+
+    def test_result_ordering(self):
+        """
+        Tests that the results are treated in the order we read the subjects,
+        even if their tests end in a different order.
+        """
+
+        subjects = [f"{x}.example.org" for x in range(6)]
+        self.file_instance.write(
+            "\n".join(subjects + ["0.example.org", "5.example.org"]) + "\n"
+        )
+
+        def test(subject):
+            # The first subjects are the slowest.
+            sleep((6 - int(subject.split(".")[0])) / 200)
+
+            return self.get_result(subject)
+
+        treated, replayed = self.run_test(test)
+
+        expected = subjects
+        actual = [x["tested"] for x in treated]
+
+        self.assertEqual(expected, actual)
+
+        # The duplicates are replayed instead of being tested again.
+        expected = ["0.example.org", "5.example.org"]
+        actual = [x["tested"] for x in replayed]
+
+        self.assertEqual(expected, actual)
+
+    def test_exception(self):
+        """
+        Tests that the exception of a test is given back to the main thread
+        and that we forget about the tests which were still pending.
+        """
+
+        self.file_instance.write(
+            "\n".join(f"{x}.example.org" for x in range(10)) + "\n"
+        )
+
+        def test(subject):
+            if subject == "0.example.org":
+                raise ValueError(subject)
+
+            return self.get_result(subject)
+
+        self.assertRaises(ValueError, lambda: self.run_test(test))
+
+        expected = 0
+        actual = len(self.core.pending)
+
+        self.assertEqual(expected, actual)
+
+
+class TestThreadedWrites(StdoutBase):
+    """
+    Tests that the writes which happen from the threads of the threaded file
+    core are serialized.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        custom = {"db_type": "json", "quiet": True, "whois_database": True}
+
+        # We keep the current values so that we can restore them once done.
+        self.previous_config = {x: PyFunceble.CONFIGURATION[x] for x in custom}
+
+        PyFunceble.load_config(generate_directory_structure=False, custom=custom)
+
+        StdoutBase.setUp(self)
+
+        self.storage_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS.default_files.whois_db
+        )
+
+        # Saves the number of threads which are currently writing.
+        self.writing = 0
+        # Saves the highest number of threads we saw writing at the same time.
+        self.maximal_writing = 0
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        StdoutBase.tearDown(self)
+
+        PyFunceble.database.WriteBehind.discard(self.storage_file)
+        PyFunceble.helpers.File(self.storage_file).delete()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom=self.previous_config
+        )
+
+    def write(self, *args, **kwargs):  # pylint: disable=unused-argument
+        """
+        A (slow) write which keeps track of the number of threads
+        which are writing at the same time.
+        """
+
+        self.writing += 1
+        self.maximal_writing = max(self.maximal_writing, self.writing)
+
+        sleep(0.001)
+
+        self.writing -= 1
+
+    def run_concurrently(self, method, subjects):
+        """
+        Runs the given method for each subject from multiple threads.
+        """
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(method, subjects))
+
+    def test_generate(self):
+        """
+        Tests that the generation of files is serialized.
+        """
+
+        subjects = [f"{x}.example.org" for x in range(50)]
+
+        def generate(subject):
+            Generate(subject, "file_domain", "VALID").status_file(
+                exclude_file_generation=True
+            )
+
+        with patch.object(Generate, "info_files", side_effect=self.write), patch(
+            "PyFunceble.output.Percentage"
+        ):
+            self.run_concurrently(generate, subjects)
+
+        expected = 1
+        actual = self.maximal_writing
+
+        self.assertEqual(expected, actual)
+
+    def test_whois_db(self):
+        """
+        Tests that the updates of the WHOIS database are serialized.
+        """
+
+        subjects = [f"{x}.example.org" for x in range(50)]
+
+        # The database is shared between all instances.
+        with patch.dict(WhoisDB.database):
+            whois_db = WhoisDB(parent_process=True)
+
+            def add(subject):
+                whois_db.add(subject, "14-sep-2050")
+
+            with patch.object(WhoisDB, "mark_dirty", side_effect=self.write):
+                self.run_concurrently(add, subjects)
+
+            expected = subjects
+            actual = [x for x in subjects if x in whois_db]
+
+            self.assertEqual(expected, actual)
+
+        expected = 1
+        actual = self.maximal_writing
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -66,7 +66,7 @@ from unittest import main as launch_tests
 from unittest.mock import Mock, patch
 
 import PyFunceble
-from PyFunceble.database.inactive import InactiveDB
+from PyFunceble.database.inactive import InactiveDB, InactiveRecord
 from time_zone import TZ
 
 
@@ -101,6 +101,7 @@ class TestInactiveDB(TestCase):
         Setups everything needed after a test.
         """
 
+        PyFunceble.database.WriteBehind.discard(self.storage_file)
         PyFunceble.helpers.File(self.storage_file).delete()
 
     def test_load_file_does_not_exists(self):
@@ -155,9 +156,9 @@ class TestInactiveDB(TestCase):
             "this_is_a_well_informed_ghost": {
                 "example.com": {
                     "included_at_epoch": 0.0,
-                    "included_at_iso": "1970-01-01T01:00:00",
+                    "included_at_iso": our_value.isoformat(),
                     "last_retested_at_epoch": 0.0,
-                    "last_retested_at_iso": "1970-01-01T01:00:00",
+                    "last_retested_at_iso": our_value.isoformat(),
                     "status": PyFunceble.STATUS.official.invalid,
                 },
             },
@@ -301,6 +302,41 @@ class TestInactiveDB(TestCase):
 
         self.assertEqual(expected, self.inactive_db.get_already_tested())
 
+    def test_is_already_tested(self):
+        """
+        Tests of the method which checks if a subject was already tested.
+        """
+
+        past = datetime.now() - timedelta(days=300)
+        to_write = {
+            self.file_to_test: {
+                "example.net": {
+                    "included_at_epoch": past.timestamp(),
+                    "included_at_iso": past.isoformat(),
+                    "last_retested_at_epoch": past.timestamp(),
+                    "last_retested_at_iso": past.isoformat(),
+                    "status": PyFunceble.STATUS.official.invalid,
+                },
+            },
+        }
+
+        PyFunceble.helpers.Dict(to_write).to_json_file(self.storage_file)
+
+        self.inactive_db.load()
+
+        self.assertFalse(self.inactive_db.is_already_tested("example.net"))
+        self.assertFalse(self.inactive_db.is_already_tested("example.com"))
+
+        self.inactive_db.add("example.com", PyFunceble.STATUS.official.invalid)
+        self.inactive_db.add("example.net", PyFunceble.STATUS.official.invalid)
+
+        self.assertTrue(self.inactive_db.is_already_tested("example.com"))
+        self.assertTrue(self.inactive_db.is_already_tested("example.net"))
+
+        self.inactive_db.remove("example.com")
+
+        self.assertFalse(self.inactive_db.is_already_tested("example.com"))
+
     def test_get_to_clean(self):
         """
         Tests of the method which gives us the list of subject to clean.
@@ -371,6 +407,66 @@ class TestInactiveDB(TestCase):
             expected, PyFunceble.helpers.Dict().from_json_file(self.storage_file)
         )
 
+    def test_save_compact_records(self):
+        """
+        Tests that our compact records are saved in the format
+        of the database file.
+        """
+
+        today = datetime.now()
+
+        expected = {
+            self.file_to_test: {
+                "example.com": {
+                    "included_at_epoch": 0.0,
+                    "included_at_iso": datetime.fromtimestamp(0.0).isoformat(),
+                    "last_retested_at_epoch": today.timestamp(),
+                    "last_retested_at_iso": today.isoformat(),
+                    "status": PyFunceble.STATUS.official.invalid,
+                },
+            },
+        }
+
+        self.inactive_db.database = {
+            self.file_to_test: {
+                "example.com": InactiveRecord(
+                    PyFunceble.STATUS.official.invalid, 0.0, today.timestamp()
+                )
+            }
+        }
+        self.inactive_db.save()
+
+        self.assertEqual(
+            expected, PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+        )
+
+    def test_compact_record(self):
+        """
+        Tests the conversion of a record of the database file.
+        """
+
+        record = {
+            "included_at_epoch": 0.0,
+            "included_at_iso": datetime.fromtimestamp(0.0).isoformat(),
+            "last_retested_at_epoch": 190.0,
+            "last_retested_at_iso": datetime.fromtimestamp(190.0).isoformat(),
+            "status": PyFunceble.STATUS.official.down,
+        }
+
+        actual = InactiveRecord.compact(record)
+
+        self.assertIsInstance(actual, InactiveRecord)
+        self.assertEqual(record, actual)
+        self.assertEqual(190.0, actual["last_retested_at_epoch"])
+        self.assertIs(
+            InactiveRecord.compact({"status": "INACTIVE"}).status,
+            InactiveRecord.compact({"status": "".join(["INAC", "TIVE"])}).status,
+        )
+
+        unknown = {"status": PyFunceble.STATUS.official.down, "hello": "world"}
+
+        self.assertIs(unknown, InactiveRecord.compact(unknown))
+
     def test_initiate_tested_path_does_not_exists(self):
         """
         Tests the initiate method for the case that the file
@@ -400,14 +496,15 @@ class TestInactiveDB(TestCase):
         patcher.start()
 
         subject = "hello.world"
+        our_iso = datetime.fromtimestamp(our_value.timestamp()).isoformat()
 
         expected = {
             self.file_to_test: {
                 subject: {
                     "included_at_epoch": our_value.timestamp(),
-                    "included_at_iso": our_value.isoformat(),
+                    "included_at_iso": our_iso,
                     "last_retested_at_epoch": our_value.timestamp(),
-                    "last_retested_at_iso": our_value.isoformat(),
+                    "last_retested_at_iso": our_iso,
                     "status": PyFunceble.STATUS.official.down,
                 }
             }
@@ -108,6 +108,7 @@ class TestWhoisDB(TestCase):
         Setups everything needed after a test.
         """
 
+        PyFunceble.database.WriteBehind.discard(self.storage_file)
         PyFunceble.helpers.File(self.storage_file).delete()
         del self.whois_db
 
@@ -134,6 +135,32 @@ class TestWhoisDB(TestCase):
 
         self.assertEqual(expected, self.whois_db.database)
 
+        expected = False
+        actual = self.whois_db.write_behind.dirty
+
+        self.assertEqual(expected, actual)
+
+    def test_load_file_old_format(self):
+        """
+        Tests the case that we load a file which is in the old format.
+        """
+
+        expected = self.our_dataset.copy()
+
+        PyFunceble.helpers.Dict({"hello.list": self.our_dataset.copy()}).to_json_file(
+            self.storage_file
+        )
+
+        self.whois_db.load()
+
+        self.assertEqual(expected, self.whois_db.database)
+
+        # The converted content has to be written.
+        expected = True
+        actual = self.whois_db.write_behind.dirty
+
+        self.assertEqual(expected, actual)
+
     def test_authorization(self):
         """
         Tests of the authorization method.
@@ -0,0 +1,269 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.database.write_behind.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.database.write_behind import WriteBehind
+
+
+class TestWriteBehind(TestCase):
+    """
+    Tests of PyFunceble.database.write_behind.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the test.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_write_behind_size": 3, "db_write_behind_interval": 3600},
+        )
+
+        # We work without the layers of the other databases.
+        self.layers = WriteBehind.layers.copy()
+        WriteBehind.layers.clear()
+
+        self.storage_file = PyFunceble.CONFIG_DIRECTORY + "write_behind_test.json"
+        self.content = {"hello": "world"}
+
+        self.write_behind = WriteBehind(self.storage_file, lambda: self.content)
+
+        PyFunceble.helpers.File(self.storage_file).delete()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        self.write_behind.changes = 0
+
+        WriteBehind.layers.clear()
+        WriteBehind.layers.update(self.layers)
+
+        PyFunceble.helpers.File(self.storage_file).delete()
+
+    def test_mark_dirty(self):
+        """
+        Tests that the file is only written once the size threshold is reached.
+        """
+
+        self.write_behind.mark_dirty()
+        self.write_behind.mark_dirty()
+
+        expected = True
+        actual = self.write_behind.dirty
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.storage_file).exists()
+
+        self.assertEqual(expected, actual)
+
+        self.write_behind.mark_dirty()
+
+        expected = False
+        actual = self.write_behind.dirty
+
+        self.assertEqual(expected, actual)
+
+        expected = self.content
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+    def test_mark_dirty_interval(self):
+        """
+        Tests that the file is written once the time threshold is reached.
+        """
+
+        PyFunceble.CONFIGURATION.db_write_behind_interval = 0
+
+        self.write_behind.mark_dirty()
+
+        expected = self.content
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+    def test_flush(self):
+        """
+        Tests that only dirty layers are written unless we force it.
+        """
+
+        flushes = WriteBehind.flushes.get(self.storage_file, 0)
+
+        expected = False
+        actual = self.write_behind.flush()
+
+        self.assertEqual(expected, actual)
+
+        expected = True
+        actual = self.write_behind.flush(force=True)
+
+        self.assertEqual(expected, actual)
+
+        expected = flushes + 1
+        actual = WriteBehind.flushes[self.storage_file]
+
+        self.assertEqual(expected, actual)
+
+    def test_flush_all(self):
+        """
+        Tests that all dirty layers are written at once.
+        """
+
+        self.write_behind.mark_dirty()
+
+        WriteBehind.flush_all()
+
+        expected = self.content
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.storage_file + ".tmp").exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_one_layer_per_file(self):
+        """
+        Tests that a new layer replaces the previous layer of the same file
+        once its pending changes are written.
+        """
+
+        self.write_behind.mark_dirty()
+
+        write_behind = WriteBehind(self.storage_file, lambda: {"world": "hello"})
+
+        expected = {self.storage_file: write_behind}
+        actual = WriteBehind.layers
+
+        self.assertEqual(expected, actual)
+
+        expected = self.content
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+    def test_close(self):
+        """
+        Tests that a closed layer writes its pending changes and is not
+        flushed anymore.
+        """
+
+        self.write_behind.mark_dirty()
+        self.write_behind.close()
+
+        expected = {}
+        actual = WriteBehind.layers
+
+        self.assertEqual(expected, actual)
+
+        expected = self.content
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.helpers.File(self.storage_file).delete()
+
+        self.write_behind.changes = 1
+        WriteBehind.flush_all()
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.storage_file).exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_discard(self):
+        """
+        Tests that a discarded layer never writes its pending changes.
+        """
+
+        self.write_behind.mark_dirty()
+
+        WriteBehind.discard(self.storage_file)
+        WriteBehind.flush_all()
+
+        expected = {}
+        actual = WriteBehind.layers
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = self.write_behind.dirty
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.storage_file).exists()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
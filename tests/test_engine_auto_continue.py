@@ -266,6 +266,196 @@ class TestAutoContinue(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_is_already_tested(self):
+        """
+        Tests of the method which checks if a subject was already tested.
+        """
+
+        self.auto_continue.database = {}
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+
+        self.assertTrue(self.auto_continue.is_already_tested("hello.world"))
+        self.assertFalse(self.auto_continue.is_already_tested("world.hello"))
+
+        self.auto_continue.add("world.hello", "INACTIVE")
+
+        self.assertEqual(
+            {"hello.world", "world.hello"}, self.auto_continue.already_tested
+        )
+        self.assertTrue(self.auto_continue.is_already_tested("world.hello"))
+
+        self.auto_continue.clean()
+
+        self.assertFalse(self.auto_continue.is_already_tested("hello.world"))
+
+
+class TestAutoContinueJournal(TestCase):
+    """
+    Tests of PyFunceble.engine.auto_continue with the json_journal database type.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_type": "json_journal", "auto_continue_journal_size": 3},
+        )
+
+        self.storage_file = (
+            PyFunceble.OUTPUT_DIRECTORY
+            + PyFunceble.OUTPUTS.parent_directory
+            + PyFunceble.OUTPUTS.logs.filenames.auto_continue
+        )
+        self.journal_file = self.storage_file + ".journal"
+
+        self.file_to_test = "this_file_is_a_ghost"
+
+        self.tearDown()
+
+        self.auto_continue = AutoContinue(self.file_to_test, parent_process=True)
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        for file in [
+            self.storage_file,
+            self.journal_file,
+            self.journal_file + ".compacting",
+        ]:
+            PyFunceble.helpers.File(file).delete()
+
+    def test_add(self):
+        """
+        Tests that the addition only appends into the journal.
+        """
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+        self.auto_continue.add("world.hello", "INACTIVE")
+
+        expected = {self.file_to_test: {}}
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+        expected = 2
+        actual = len(PyFunceble.helpers.File(self.journal_file).read().splitlines())
+
+        self.assertEqual(expected, actual)
+
+    def test_compaction(self):
+        """
+        Tests that the journal is compacted into the usual format once
+        the configured number of records is reached.
+        """
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+        self.auto_continue.add("world.hello", "ACTIVE")
+        self.auto_continue.add("hello.world.hello", "INACTIVE")
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.journal_file).exists()
+
+        self.assertEqual(expected, actual)
+
+        expected = {
+            self.file_to_test: {
+                "ACTIVE": ["hello.world", "world.hello"],
+                "INACTIVE": ["hello.world.hello"],
+            }
+        }
+        actual = PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+
+        self.assertEqual(expected, actual)
+
+    def test_replay(self):
+        """
+        Tests that an interrupted journal is replayed at load time.
+        """
+
+        PyFunceble.helpers.Dict(
+            {self.file_to_test: {"ACTIVE": ["hello.world"]}}
+        ).to_json_file(self.storage_file)
+
+        # The record of hello.world was already compacted, the last line was
+        # interrupted while being written.
+        PyFunceble.helpers.File(self.journal_file).write(
+            '{"op": "add", "file": "this_file_is_a_ghost", '
+            '"status": "ACTIVE", "subject": "hello.world"}\n'
+            '{"op": "add", "file": "this_file_is_a_ghost", '
+            '"status": "INACTIVE", "subject": "world.hello"}\n'
+            '{"op": "add", "file": "this_file_is'
+        )
+
+        auto_continue = AutoContinue(self.file_to_test, parent_process=True)
+
+        expected = {
+            self.file_to_test: {"ACTIVE": ["hello.world"], "INACTIVE": ["world.hello"]}
+        }
+
+        self.assertEqual(expected, auto_continue.database)
+        self.assertEqual(
+            expected, PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+        )
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.journal_file).exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_clean(self):
+        """
+        Tests that the cleaning is not overwritten by the journal.
+        """
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+        self.auto_continue.clean()
+
+        expected = {self.file_to_test: {}}
+
+        self.assertEqual(expected, self.auto_continue.database)
+        self.assertEqual(
+            expected, PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+        )
+
+    def test_remove_complement(self):
+        """
+        Tests that the removal of a tested complement only appends into the
+        journal and is replayed at load time.
+        """
+
+        self.auto_continue.database[self.file_to_test]["complements"] = [
+            "hello.world",
+            "world.hello",
+        ]
+        self.auto_continue.save()
+
+        self.auto_continue.remove_complement("hello.world")
+        self.auto_continue.remove_complement("not.a.complement")
+
+        expected = {self.file_to_test: {"complements": ["world.hello"]}}
+
+        self.assertEqual(expected, self.auto_continue.database)
+
+        expected = 1
+        actual = len(PyFunceble.helpers.File(self.journal_file).read().splitlines())
+
+        self.assertEqual(expected, actual)
+
+        auto_continue = AutoContinue(self.file_to_test, parent_process=True)
+
+        expected = {self.file_to_test: {"complements": ["world.hello"]}}
+
+        self.assertEqual(expected, auto_continue.database)
+        self.assertEqual(
+            expected, PyFunceble.helpers.Dict().from_json_file(self.storage_file)
+        )
+
 
 if __name__ == "__main__":
     launch_tests()
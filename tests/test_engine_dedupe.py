@@ -0,0 +1,227 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of the in-run deduplication.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.engine import Dedupe, ScalableBloomFilter
+
+
+class TestDedupe(TestCase):
+    """
+    Tests of PyFunceble.engine.dedupe
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+        PyFunceble.CONFIGURATION.dedupe = True
+
+        self.result = {
+            "tested": "example.org",
+            "status": "ACTIVE",
+            "status_source": "DNSLOOKUP",
+            "expiration_date": None,
+            "http_status_code": "***",
+            "whois_server": "whois.pir.org",
+            "ipv4_syntax_validation": False,
+            "ipv6_syntax_validation": False,
+            "dns_lookup": {"A": ["93.184.216.34"]},
+        }
+
+    def test_is_duplicate(self):
+        """
+        Tests the detection of the duplicates.
+        """
+
+        dedupe = Dedupe()
+
+        self.assertFalse(dedupe.is_duplicate("example.org"))
+        self.assertTrue(dedupe.is_duplicate("example.org"))
+        self.assertFalse(dedupe.is_duplicate("example.net"))
+
+    def test_not_authorized(self):
+        """
+        Tests that nothing is a duplicate when we are deactivated.
+        """
+
+        PyFunceble.CONFIGURATION.dedupe = False
+
+        dedupe = Dedupe()
+
+        self.assertFalse(dedupe.is_duplicate("example.org"))
+        self.assertFalse(dedupe.is_duplicate("example.org"))
+
+    def test_remember_and_get(self):
+        """
+        Tests that we replay only what we need.
+        """
+
+        dedupe = Dedupe()
+
+        dedupe.is_duplicate("example.org")
+
+        self.assertIsNone(dedupe.get("example.org"))
+        self.assertEqual(0, dedupe.remember("example.org", self.result))
+
+        expected = {x: y for x, y in self.result.items() if x != "dns_lookup"}
+
+        self.assertEqual(expected, dedupe.get("example.org"))
+        self.assertIsNone(dedupe.get("example.net"))
+
+    def test_wait(self):
+        """
+        Tests that the duplicates of a subject under test wait for its result.
+        """
+
+        dedupe = Dedupe()
+
+        dedupe.is_duplicate("example.org")
+
+        self.assertTrue(dedupe.wait("example.org"))
+        self.assertTrue(dedupe.wait("example.org"))
+        self.assertFalse(dedupe.wait("example.net"))
+
+        self.assertEqual(2, dedupe.remember("example.org", self.result))
+        self.assertFalse(dedupe.wait("example.org"))
+
+    def test_above_max_exact(self):
+        """
+        Tests that the subjects above the limit are not deduplicated
+        when the Bloom filter is not activated.
+        """
+
+        dedupe = Dedupe(max_exact=2)
+
+        for subject in ["a.org", "b.org", "c.org", "d.org"]:
+            self.assertFalse(dedupe.is_duplicate(subject))
+
+        self.assertEqual(2, len(dedupe.results))
+        self.assertIsNone(dedupe.bloom)
+
+        for subject in ["a.org", "b.org"]:
+            self.assertTrue(dedupe.is_duplicate(subject))
+
+        for subject in ["c.org", "d.org"]:
+            self.assertFalse(dedupe.is_duplicate(subject))
+
+        self.assertEqual(0, dedupe.bloom_skipped)
+
+        dedupe.remember("a.org", dict(self.result, tested="a.org"))
+
+        self.assertEqual("a.org", dedupe.get("a.org")["tested"])
+
+    def test_bloom_filter(self):
+        """
+        Tests the switch to the Bloom filter.
+        """
+
+        dedupe = Dedupe(max_exact=2, bloom=True)
+
+        for subject in ["a.org", "b.org", "c.org", "d.org"]:
+            self.assertFalse(dedupe.is_duplicate(subject))
+
+        self.assertEqual(2, len(dedupe.results))
+        self.assertEqual(2, len(dedupe.bloom))
+
+        for subject in ["a.org", "b.org", "c.org", "d.org"]:
+            self.assertTrue(dedupe.is_duplicate(subject))
+
+        # The duplicates skipped through the Bloom filter are counted.
+        self.assertEqual(2, dedupe.bloom_skipped)
+
+        self.assertEqual(0, dedupe.remember("c.org", self.result))
+        self.assertIsNone(dedupe.get("c.org"))
+        self.assertFalse(dedupe.wait("c.org"))
+
+
+class TestScalableBloomFilter(TestCase):
+    """
+    Tests of PyFunceble.engine.dedupe.ScalableBloomFilter
+    """
+
+    def test_add_and_contains(self):
+        """
+        Tests that we grow without losing anything.
+        """
+
+        bloom = ScalableBloomFilter(100, 0.001)
+        subjects = [f"{x}.example.org" for x in range(1000)]
+
+        for subject in subjects:
+            bloom.add(subject)
+
+        self.assertEqual(1000, len(bloom))
+        self.assertGreater(len(bloom.filters), 1)
+        self.assertTrue(all(x in bloom for x in subjects))
+
+        false_positives = sum(f"{x}.example.net" in bloom for x in range(1000))
+
+        self.assertLess(false_positives, 10)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -105,6 +105,8 @@ class TestMining(TestCase):
         Setups everything needed after the tests.
         """
 
+        PyFunceble.database.WriteBehind.discard(self.storage_file)
+
         self.file_to_test_instance.delete()
         self.storage_file_instance.delete()
 
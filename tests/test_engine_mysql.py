@@ -0,0 +1,242 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.engine.mysql.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from os import getpid
+from time import time
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import pymysql
+
+import PyFunceble
+from PyFunceble.engine import MySQL
+
+
+class FakeConnection:  # pylint: disable=too-few-public-methods
+    """
+    Provides a connection which does not need a server.
+    """
+
+    def __init__(self):
+        self.open = True
+        self.pinged = 0
+
+    def close(self):
+        """
+        Closes the connection.
+        """
+
+        self.open = False
+
+    def ping(self, reconnect=True):  # pylint: disable=unused-argument
+        """
+        Pings the server.
+        """
+
+        self.pinged += 1
+
+
+class DeadConnection(FakeConnection):  # pylint: disable=too-few-public-methods
+    """
+    Provides a connection whose server went away.
+    """
+
+    def ping(self, reconnect=True):
+        """
+        Pings the server.
+        """
+
+        raise pymysql.err.OperationalError(2006, "MySQL server has gone away")
+
+
+class TestMySQLPool(TestCase):
+    """
+    Tests of the connection pool of PyFunceble.engine.mysql
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={
+                "db_type": "json",
+                "mysql_pool_size": 2,
+                "mysql_pool_idle_timeout": 300.0,
+            },
+        )
+
+        MySQL.pool = []
+        MySQL.pool_pid = None
+
+        self.mysql = MySQL()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        MySQL.pool = []
+        MySQL.pool_pid = None
+
+    def test_reuse(self):
+        """
+        Tests that a released connection is reused.
+        """
+
+        with patch.object(MySQL, "connect", side_effect=FakeConnection):
+            connection = self.mysql.acquire()
+            self.mysql.release(connection)
+
+            self.assertIs(connection, self.mysql.acquire())
+
+        actual = MySQL.get_pool_stats()
+
+        self.assertEqual(1, actual["reused"])
+        self.assertEqual(1, actual["in_use"])
+        self.assertEqual(0, actual["idle"])
+        self.assertEqual(getpid(), actual["pid"])
+
+    def test_max_size(self):
+        """
+        Tests that we don't keep more than the maximal number of connections.
+        """
+
+        with patch.object(MySQL, "connect", side_effect=FakeConnection):
+            connections = [self.mysql.acquire() for _ in range(3)]
+
+        for connection in connections:
+            self.mysql.release(connection)
+
+        actual = MySQL.get_pool_stats()
+
+        self.assertEqual(2, actual["idle"])
+        self.assertEqual(1, actual["discarded"])
+        self.assertFalse(connections[-1].open)
+
+    def test_broken(self):
+        """
+        Tests that a broken connection is not given back to the pool.
+        """
+
+        with patch.object(MySQL, "connect", side_effect=FakeConnection):
+            connection = self.mysql.acquire()
+            self.mysql.release(connection, broken=True)
+
+            self.assertIsNot(connection, self.mysql.acquire())
+
+        self.assertFalse(connection.open)
+
+    def test_idle_timeout(self):
+        """
+        Tests that the connections which were idle for too long are closed.
+        """
+
+        connection = FakeConnection()
+        MySQL.pool_pid = getpid()
+        MySQL.pool = [(connection, 0)]
+
+        with patch.object(MySQL, "connect", side_effect=FakeConnection):
+            self.assertIsNot(connection, self.mysql.acquire())
+
+        self.assertFalse(connection.open)
+        self.assertEqual(1, MySQL.get_pool_stats()["expired"])
+
+    def test_ping(self):
+        """
+        Tests that a connection which was idle for a while is checked
+        before its reuse and replaced if it's dead.
+        """
+
+        connection = FakeConnection()
+        dead_connection = DeadConnection()
+
+        MySQL.pool_pid = getpid()
+        MySQL.pool = [(connection, 1), (dead_connection, 1)]
+        PyFunceble.CONFIGURATION.mysql_pool_idle_timeout = float("inf")
+
+        self.assertIs(connection, self.mysql.acquire())
+        self.assertFalse(dead_connection.open)
+        self.assertEqual(1, connection.pinged)
+        self.assertEqual(1, MySQL.get_pool_stats()["checked"])
+
+    def test_fork(self):
+        """
+        Tests that we forget (without closing) the pool of our parent process.
+        """
+
+        connection = FakeConnection()
+        MySQL.pool_pid = -1
+        MySQL.pool = [(connection, time())]
+
+        actual = MySQL.get_pool_stats()
+
+        self.assertEqual(0, actual["idle"])
+        self.assertEqual(getpid(), actual["pid"])
+        self.assertTrue(connection.open)
+
+
+if __name__ == "__main__":
+    launch_tests()
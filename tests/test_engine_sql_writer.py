@@ -0,0 +1,228 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.engine.sql_writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+# pylint: enable=line-too-long
+
+from os import getpid
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.engine import SQL, SQLite, SQLWriter
+
+
+class TestSQLWriter(TestCase):
+    """
+    Tests of PyFunceble.engine.sql_writer
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_type": "sqlite", "db_batch_insert_size": 3},
+        )
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS.default_files.sqlite_db
+        )
+        self.table_name = SQL.tables["inactive"]
+
+        self.tearDown()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        SQLWriter.pending = {}
+
+        if SQLite.connection is not None and SQLite.connection_pid == getpid():
+            SQLite.connection.close()
+
+        SQLite.connection = None
+        SQLite.connection_pid = None
+        SQLite.pending = 0
+
+        for suffix in ["", "-wal", "-shm"]:
+            PyFunceble.helpers.File(self.database_file + suffix).delete()
+
+    def add(self, subject, status):
+        """
+        Adds the given subject into our writer.
+        """
+
+        SQLWriter.add(
+            self.table_name,
+            {
+                "file_path": "hello.list",
+                "subject": subject,
+                "status": status,
+                "digest": subject,
+            },
+            update=["status"],
+        )
+
+    def get_rows(self):
+        """
+        Provides the rows of our table.
+        """
+
+        with SQL() as connection, connection.cursor() as cursor:
+            cursor.execute(f"SELECT subject, status FROM {self.table_name}")
+
+            return {x["subject"]: x["status"] for x in cursor.fetchall()}
+
+    def test_get_query(self):
+        """
+        Tests the construction of our queries.
+        """
+
+        expected = (
+            "INSERT INTO hello (subject, digest) VALUES (%(subject)s, %(digest)s) "
+            "ON DUPLICATE KEY UPDATE subject = VALUES(subject)"
+        )
+        actual = SQLWriter.get_query(
+            "mysql", "hello", ("subject", "digest"), ("subject",)
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = (
+            "INSERT INTO hello (subject, digest) VALUES (%(subject)s, %(digest)s) "
+            "ON CONFLICT(digest) DO UPDATE SET subject = excluded.subject"
+        )
+        actual = SQLWriter.get_query(
+            "sqlite", "hello", ("subject", "digest"), ("subject",)
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = (
+            "INSERT INTO hello (subject, digest) VALUES (%(subject)s, %(digest)s) "
+            "ON CONFLICT(digest) DO NOTHING"
+        )
+        actual = SQLWriter.get_query("sqlite", "hello", ("subject", "digest"), ())
+
+        self.assertEqual(expected, actual)
+
+    def test_batch(self):
+        """
+        Tests that we only write once the batch is full.
+        """
+
+        self.add("hello.world", "INACTIVE")
+        self.add("world.hello", "INACTIVE")
+
+        self.assertEqual({}, self.get_rows())
+        self.assertEqual(
+            "INACTIVE", SQLWriter.get(self.table_name, "hello.world")["status"]
+        )
+        self.assertEqual(2, len(SQLWriter.get_pending(self.table_name)))
+
+        self.add("hello.hello", "INVALID")
+
+        expected = {
+            "hello.world": "INACTIVE",
+            "world.hello": "INACTIVE",
+            "hello.hello": "INVALID",
+        }
+
+        self.assertEqual(expected, self.get_rows())
+        self.assertEqual([], SQLWriter.get_pending(self.table_name))
+        self.assertIsNone(SQLWriter.get(self.table_name, "hello.world"))
+
+    def test_flush_update(self):
+        """
+        Tests that we update the already known rows.
+        """
+
+        self.add("hello.world", "INACTIVE")
+        SQLWriter.flush()
+
+        self.add("hello.world", "INVALID")
+        self.add("hello.world", "ACTIVE")
+
+        self.assertEqual(1, len(SQLWriter.get_pending(self.table_name)))
+
+        SQLWriter.flush(self.table_name)
+
+        expected = {"hello.world": "ACTIVE"}
+
+        self.assertEqual(expected, self.get_rows())
+
+    def test_fork(self):
+        """
+        Tests that we forget the rows of our parent process.
+        """
+
+        self.add("hello.world", "INACTIVE")
+
+        SQLWriter.pending_pid = -1
+
+        self.assertEqual([], SQLWriter.get_pending(self.table_name))
+
+
+if __name__ == "__main__":
+    launch_tests()
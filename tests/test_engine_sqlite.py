@@ -0,0 +1,235 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.engine.sqlite.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from os import getpid
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.engine import SQL, AutoContinue, SQLite
+from PyFunceble.engine.sqlite import SQLiteCursor
+
+
+class TestSQLiteCursor(TestCase):
+    """
+    Tests of PyFunceble.engine.sqlite.SQLiteCursor
+    """
+
+    def test_translate(self):
+        """
+        Tests of the translation of our (pyformat) queries.
+        """
+
+        expected = "SELECT * FROM hello WHERE subject = :subject AND status = ?"
+        actual = SQLiteCursor.translate(
+            "SELECT * FROM hello WHERE subject = %(subject)s AND status = %s"
+        )
+
+        self.assertEqual(expected, actual)
+
+        expected = "SELECT * FROM hello WHERE subject LIKE '%.com'"
+        actual = SQLiteCursor.translate(
+            "SELECT * FROM hello WHERE subject LIKE '%%.com'"
+        )
+
+        self.assertEqual(expected, actual)
+
+
+class TestSQLite(TestCase):
+    """
+    Tests of PyFunceble.engine.sqlite
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_type": "sqlite", "sqlite_batch_size": 100},
+        )
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS.default_files.sqlite_db
+        )
+
+        self.tearDown()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        if SQLite.connection is not None and SQLite.connection_pid == getpid():
+            SQLite.connection.close()
+
+        SQLite.connection = None
+        SQLite.connection_pid = None
+        SQLite.pending = 0
+
+        for suffix in ["", "-wal", "-shm"]:
+            PyFunceble.helpers.File(self.database_file + suffix).delete()
+
+    def test_sql_facade(self):
+        """
+        Tests that the SQL facade gives us the right engine.
+        """
+
+        self.assertIsInstance(SQL().engine, SQLite)
+        self.assertEqual("INTEGER", SQL.get_int_cast_type())
+
+        PyFunceble.CONFIGURATION.db_type = "mysql"
+
+        self.assertEqual("SIGNED", SQL.get_int_cast_type())
+
+    def test_structure(self):
+        """
+        Tests the creation of the database.
+        """
+
+        with SQL() as connection, connection.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            self.assertEqual("wal", cursor.fetchone()["journal_mode"])
+
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            actual = {x["name"] for x in cursor.fetchall()}
+
+        for table_name in SQLite.tables.values():
+            self.assertIn(table_name, actual)
+
+    def test_unix_timestamp(self):
+        """
+        Tests that we provide the UNIX_TIMESTAMP() function.
+        """
+
+        with SQL() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT UNIX_TIMESTAMP('1970-01-02 00:00:00') AS hello, "
+                "CAST(UNIX_TIMESTAMP() AS INTEGER) > 0 AS world"
+            )
+            actual = cursor.fetchone()
+
+        self.assertEqual({"hello": 86400, "world": 1}, actual)
+
+    def test_batched_commit(self):
+        """
+        Tests that we commit our changes by batch.
+        """
+
+        PyFunceble.CONFIGURATION.sqlite_batch_size = 2
+
+        query = (
+            "INSERT INTO pyfunceble_auto_continue "
+            "(file_path, subject, status, is_complement, digest) "
+            "VALUES (%(file)s, %(subject)s, %(status)s, 0, %(digest)s)"
+        )
+
+        with SQL() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                query,
+                {"file": "hello", "subject": "a", "status": "ACTIVE", "digest": "a"},
+            )
+
+        self.assertTrue(SQLite.connection.in_transaction)
+        self.assertEqual(1, SQLite.pending)
+
+        with SQL() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                query,
+                {"file": "hello", "subject": "b", "status": "ACTIVE", "digest": "b"},
+            )
+
+        self.assertFalse(SQLite.connection.in_transaction)
+        self.assertEqual(0, SQLite.pending)
+
+    def test_auto_continue(self):
+        """
+        Tests that our auto continue subsystem works with SQLite.
+        """
+
+        PyFunceble.CONFIGURATION.auto_continue = True
+        PyFunceble.CONFIGURATION.no_files = False
+
+        auto_continue = AutoContinue("this_file_is_a_ghost", parent_process=True)
+
+        self.assertTrue(auto_continue.is_empty())
+
+        auto_continue.add("hello.world", "ACTIVE")
+        auto_continue.add("world.hello", "INACTIVE")
+
+        self.assertFalse(auto_continue.is_empty())
+        self.assertIn("hello.world", auto_continue)
+        self.assertNotIn("hello.hello", auto_continue)
+
+        expected = {"hello.world", "world.hello"}
+        actual = auto_continue.get_already_tested()
+
+        self.assertEqual(expected, actual)
+
+        auto_continue.clean()
+
+        self.assertTrue(auto_continue.is_empty())
+
+
+if __name__ == "__main__":
+    launch_tests()
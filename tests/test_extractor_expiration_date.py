@@ -60,10 +60,11 @@ License:
 """
 # pylint: enable=line-too-long
 
-from random import choice
+from random import Random, choice
 from unittest import TestCase
 from unittest import main as launch_tests
 
+import PyFunceble.helpers as helpers
 from PyFunceble.extractor import ExpirationDate
 
 
@@ -183,5 +184,155 @@ class TestExpirationDate(TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestExpirationDatePatterns(TestCase):
+    """
+    Tests that our (precompiled) patterns give the same results as the
+    :code:`findall()` based ones we used to run through helpers.Regex.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        TestExpirationDate.setUp(self)
+
+        filler = [
+            "Domain Name: EXAMPLE.COM",
+            "Registry Domain ID: 2336799_DOMAIN_COM-VRSN",
+            "Registrar WHOIS Server: whois.example-registrar.com",
+            "Updated Date: 2019-08-14T07:04:41Z",
+            "Creation Date: 1995-08-14T04:00:00Z",
+            "Registrar: Example Registrar, Inc.",
+            "Domain Status: clientTransferProhibited",
+            "Name Server: A.IANA-SERVERS.NET",
+            "NOTICE: The expiration date displayed in this record is the date the "
+            "registrar's sponsorship of the domain name registration in the "
+            "registry is currently set to expire.",
+            ">>> Last update of whois database: 2020-03-03T10:45:41Z <<<",
+        ]
+
+        # We want the same records from a run to another.
+        random = Random(42)
+
+        self.records = []
+
+        for marker in self.expiration_date_markers:
+            for date in self.dates_samples:
+                # A record with one marker.
+                lines = filler[:]
+                lines.insert(random.randrange(len(lines) + 1), f"{marker}{date}")
+
+                self.records.append("\n".join(lines))
+
+            # A record without date.
+            self.records.append("\n".join(filler + [f"{marker}"]))
+
+            # A record with (the variations of) the wildcards of the patterns.
+            self.records.append(
+                "\n".join(
+                    filler
+                    + [
+                        marker.replace(".", "-") + choice(self.dates_samples),
+                        marker.replace(":", "-") + choice(self.dates_samples),
+                    ]
+                )
+            )
+
+        for _ in range(200):
+            # Records with multiple markers.
+            lines = filler[:]
+
+            for _ in range(3):
+                lines.insert(
+                    random.randrange(len(lines) + 1),
+                    random.choice(self.expiration_date_markers)
+                    + random.choice(self.dates_samples + ["no date"]),
+                )
+
+            self.records.append("\n".join(lines))
+
+        self.records.append(
+            f"Record expires on {choice(self.dates_samples)} (YYYY-MM-DD)"
+        )
+        self.records.append("")
+
+    def test_expiration_patterns(self):
+        """
+        Tests that the first group of the first match is the first element
+        of the (flatten) list of all matches.
+        """
+
+        for record in self.records:
+            for pattern, (_, compiled) in zip(
+                ExpirationDate.expiration_patterns,
+                ExpirationDate.compiled_expiration_patterns,
+            ):
+                old = helpers.Regex(pattern).match(
+                    record, return_match=True, rematch=True, group=0
+                )
+                new = compiled.search(record)
+
+                if old:
+                    expected = old[0]
+                    actual = new.group(1) if new else None
+                else:
+                    expected = None
+                    actual = new
+
+                self.assertEqual(expected, actual, (pattern, record))
+
+    def test_keywords(self):
+        """
+        Tests that the keyword of a pattern is in every record the pattern
+        matches. In other words, that we never skip a pattern which would
+        have matched.
+        """
+
+        matched = set()
+
+        for record in self.records:
+            for pattern, (keyword, _) in zip(
+                ExpirationDate.expiration_patterns,
+                ExpirationDate.compiled_expiration_patterns,
+            ):
+                self.assertTrue(keyword, pattern)
+
+                for match in helpers.Regex(pattern).compiled.finditer(record):
+                    matched.add(pattern)
+
+                    self.assertTrue(
+                        match.group(0).startswith(keyword), (pattern, record)
+                    )
+
+        # Every pattern was tested against at least one match.
+        expected = set(ExpirationDate.expiration_patterns)
+        actual = matched
+
+        self.assertEqual(expected, actual)
+
+    def test_date_patterns(self):
+        """
+        Tests that the groups of the first match are the first elements
+        of the (flatten) list of all matches.
+        """
+
+        for date in self.dates_samples:
+            for index, compiled in ExpirationDate.compiled_regex_dates:
+                old = helpers.Regex(ExpirationDate.regex_dates[index]).match(
+                    date, return_match=True, rematch=True
+                )
+                new = compiled.search(date)
+
+                if old:
+                    expected = old[: compiled.groups]
+                    actual = list(new.groups()) if new else None
+                else:
+                    expected = None
+                    actual = new
+
+                self.assertEqual(expected, actual, (index, date))
+
+
 if __name__ == "__main__":
     launch_tests()
@@ -260,6 +260,73 @@ class TestDict(TestCase):
 
         File(output_file).delete()
 
+    def test_to_json_file_compact(self):
+        """
+        Tests the method which let us save a dict into a compact JSON file.
+        """
+
+        output_file = "this_file_is_a_ghost"
+        File(output_file).delete()
+
+        Dict(self.test_subject.copy()).to_json_file(output_file, indent=None)
+
+        expected = (
+            '{"Hello":"world","Py":"Funceble","World":{"world":"hello"},'
+            '"funilrys":["Fun","Ilrys"],"pyfunceble":["funilrys"]}'
+        )
+        actual = File(output_file).read()
+
+        self.assertEqual(expected, actual)
+
+        expected = self.test_subject.copy()
+        actual = Dict().from_json_file(output_file)
+
+        self.assertEqual(expected, actual)
+
+        File(output_file).delete()
+
+    def test_iter_json_file(self):
+        """
+        Tests the method which let us read a JSON file
+        item by item.
+        """
+
+        output_file = "this_file_is_a_ghost"
+        File(output_file).delete()
+
+        Dict(self.test_subject.copy()).to_json_file(output_file)
+
+        expected = [
+            (("Hello",), "world"),
+            (("Py",), "Funceble"),
+            (("World",), {"world": "hello"}),
+            (("funilrys",), ["Fun", "Ilrys"]),
+            (("pyfunceble",), ["funilrys"]),
+        ]
+        actual = list(Dict().iter_json_file(output_file))
+
+        self.assertEqual(expected, actual)
+
+        expected = [
+            (("Hello",), "world"),
+            (("Py",), "Funceble"),
+            (("World", "world"), "hello"),
+            (("funilrys",), ["Fun", "Ilrys"]),
+            (("pyfunceble",), ["funilrys"]),
+        ]
+        actual = list(Dict().iter_json_file(output_file, depth=2))
+
+        self.assertEqual(expected, actual)
+
+        File(output_file).write("[1, 2, 3]", overwrite=True)
+
+        expected = [((), [1, 2, 3])]
+        actual = list(Dict().iter_json_file(output_file))
+
+        self.assertEqual(expected, actual)
+
+        File(output_file).delete()
+
     def test_to_json(self):
         """
         Tests the method which let us get the JSON
@@ -289,6 +356,14 @@ class TestDict(TestCase):
 
         self.assertEqual(expected, actual)
 
+        expected = (
+            '{"Hello":"world","Py":"Funceble","World":{"world":"hello"},'
+            '"funilrys":["Fun","Ilrys"],"pyfunceble":["funilrys"]}'
+        )
+        actual = Dict(self.test_subject.copy()).to_json(indent=None)
+
+        self.assertEqual(expected, actual)
+
     def test_to_yaml_file_non_dict(self):
         """
         Tests the method which let us save a dict into a YAML file
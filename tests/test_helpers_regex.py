@@ -60,10 +60,12 @@ License:
 """
 # pylint: enable=line-too-long
 
+from re import IGNORECASE
 from unittest import TestCase
 from unittest import main as launch_tests
 
 from PyFunceble.helpers import Regex
+from PyFunceble.helpers.regex import get_compiled
 
 
 class TestRegex(TestCase):
@@ -163,6 +165,76 @@ class TestRegex(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_compiled(self):
+        """
+        Tests that the compiled regex is given by our cache.
+        """
+
+        regex = "fun"
+
+        expected = get_compiled(regex)
+        actual = Regex(regex).compiled
+
+        self.assertIs(expected, actual)
+
+        actual = Regex(regex, flags=IGNORECASE).compiled
+
+        self.assertIsNot(expected, actual)
+        self.assertEqual(IGNORECASE, actual.flags & IGNORECASE)
+
+    def test_match_no_return_match(self):
+        """
+        Tests the matching method for the case that we only want to
+        know if there is a match.
+        """
+
+        regex = r"([a-z]{1,})\s([a-z]{1,})\s"
+
+        expected = True
+        actual = Regex(regex).match(self.data, return_match=False)
+
+        self.assertEqual(expected, actual)
+
+        actual = Regex(regex).match(self.data, rematch=True, return_match=False)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = Regex("PyFunceble").match(self.data, return_match=False)
+
+        self.assertEqual(expected, actual)
+
+    def test_fullmatch(self):
+        """
+        Tests the method which let us check if the whole data match.
+        """
+
+        expected = True
+        actual = Regex("[a-z]+").fullmatch("funilrys")
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = Regex("[a-z]+").fullmatch("PyFunceble")
+
+        self.assertEqual(expected, actual)
+
+    def test_sub(self):
+        """
+        Tests the substitution method.
+        """
+
+        regex = "th"
+        expected = "Hello, is is Fun Ilrys. I just wanted to know how ings goes around e tests."  # pylint: disable=line-too-long
+        actual = Regex(regex).sub(self.data, "")
+
+        self.assertEqual(expected, actual)
+
+        expected = "Hello, is is Fun Ilrys. I just wanted to know how things goes around the tests."  # pylint: disable=line-too-long
+        actual = Regex(regex).sub(self.data, "", occurences=1)
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -60,13 +60,15 @@ License:
 """
 # pylint: enable=line-too-long
 
+from threading import current_thread
+from time import monotonic, sleep
 from unittest import TestCase
 from unittest import main as launch_tests
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from dns.resolver import NXDOMAIN, YXDOMAIN, NoAnswer, NoNameservers
 
-from PyFunceble.lookup import Dns
+from PyFunceble.lookup import Dns, DNSQueryPool
 
 
 class TestDNSLookup(TestCase):
@@ -213,6 +215,235 @@ class TestDNSLookup(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_request_fallback(self):
+        """
+        Tests the method which let us request the records of a subject
+        for the case that no NS record is found.
+        """
+
+        self.dns_lookup.ns_record = Mock(return_value=None)
+        self.dns_lookup.cname_record = Mock(return_value=None)
+        self.dns_lookup.dname_record = Mock(return_value=None)
+        self.dns_lookup.a_record = Mock(return_value=["140.82.121.4"])
+        self.dns_lookup.aaaa_record = Mock(return_value=["::1"])
+
+        expected = {
+            "A": ["140.82.121.4"],
+            "nameservers": self.dns_lookup.resolver.nameservers,
+        }
+        actual = self.dns_lookup.request("github.com")
+
+        self.assertEqual(expected, actual)
+
+    def test_request_complete_deadline(self):
+        """
+        Tests the method which let us request the complete DNS spectrum
+        of a subject for the case that a query is slower than the lifetime.
+        """
+
+        def slow_txt_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(2)
+            return ["Hello, World!"]
+
+        self.dns_lookup.resolver.lifetime = 0.2
+
+        self.dns_lookup.ns_record = Mock(return_value=["ns1.github.com."])
+        self.dns_lookup.a_record = Mock(return_value=["140.82.121.4"])
+        self.dns_lookup.aaaa_record = Mock(return_value=None)
+        self.dns_lookup.cname_record = Mock(return_value=None)
+        self.dns_lookup.dname_record = Mock(return_value=None)
+        self.dns_lookup.mx_record = Mock(return_value=None)
+        self.dns_lookup.txt_record = slow_txt_record
+        self.dns_lookup.ptr_record = Mock(return_value=["lb-140-82-121-4.github.com."])
+
+        # The deadline is reached before we could request the PTR records.
+        expected = {
+            "NS": ["ns1.github.com."],
+            "A": ["140.82.121.4"],
+            "nameservers": self.dns_lookup.resolver.nameservers,
+        }
+
+        start = monotonic()
+        actual = self.dns_lookup.request("github.com", complete=True)
+
+        self.assertEqual(expected, actual)
+        self.assertLess(monotonic() - start, 2)
+
+    def test_request_complete_single_deadline(self):
+        """
+        Tests that the PTR records are requested within what is left of the
+        deadline of the complete DNS spectrum.
+        """
+
+        def slow_a_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(0.3)
+            return ["140.82.121.4"]
+
+        def slow_ptr_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(2)
+            return ["lb-140-82-121-4.github.com."]
+
+        self.dns_lookup.resolver.lifetime = 0.4
+
+        self.dns_lookup.ns_record = Mock(return_value=["ns1.github.com."])
+        self.dns_lookup.a_record = slow_a_record
+        self.dns_lookup.aaaa_record = Mock(return_value=None)
+        self.dns_lookup.cname_record = Mock(return_value=None)
+        self.dns_lookup.dname_record = Mock(return_value=None)
+        self.dns_lookup.mx_record = Mock(return_value=None)
+        self.dns_lookup.txt_record = Mock(return_value=None)
+        self.dns_lookup.ptr_record = slow_ptr_record
+
+        expected = {
+            "NS": ["ns1.github.com."],
+            "A": ["140.82.121.4"],
+            "nameservers": self.dns_lookup.resolver.nameservers,
+        }
+
+        start = monotonic()
+        actual = self.dns_lookup.request("github.com", complete=True)
+
+        self.assertEqual(expected, actual)
+        self.assertLess(monotonic() - start, 0.6)
+
+    def test_request_fallback_single_deadline(self):
+        """
+        Tests that the fallbacks share a single deadline which starts once
+        the NS record was requested.
+        """
+
+        def slow_ns_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(0.3)
+
+        def slow_a_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(2)
+            return ["140.82.121.4"]
+
+        self.dns_lookup.resolver.lifetime = 0.4
+
+        self.dns_lookup.ns_record = slow_ns_record
+        self.dns_lookup.cname_record = Mock(return_value=None)
+        self.dns_lookup.dname_record = Mock(return_value=None)
+        self.dns_lookup.a_record = slow_a_record
+        self.dns_lookup.aaaa_record = Mock(return_value=None)
+
+        expected = {}
+
+        start = monotonic()
+        actual = self.dns_lookup.request("github.com")
+
+        self.assertEqual(expected, actual)
+        self.assertLess(monotonic() - start, 1)
+
+    def test_request_fallback_after_ns_timeout(self):
+        """
+        Tests that the fallbacks are still requested when the NS record
+        timed out.
+        """
+
+        def timed_out_ns_record(subject, tcp=None):  # pylint: disable=unused-argument
+            # The resolver gives up once its lifetime is exceeded.
+            sleep(0.4)
+
+        def a_record(subject, tcp=None):  # pylint: disable=unused-argument
+            sleep(0.1)
+            return ["140.82.121.4"]
+
+        self.dns_lookup.resolver.lifetime = 0.4
+
+        self.dns_lookup.ns_record = timed_out_ns_record
+        self.dns_lookup.cname_record = Mock(return_value=None)
+        self.dns_lookup.dname_record = Mock(return_value=None)
+        self.dns_lookup.a_record = a_record
+        self.dns_lookup.aaaa_record = Mock(return_value=None)
+
+        expected = ["140.82.121.4"]
+        actual = self.dns_lookup.request("github.com").get("A")
+
+        self.assertEqual(expected, actual)
+
+    def test_shared_executor(self):
+        """
+        Tests that the queries of all instances are run into the same
+        pool of threads and that a new pool is started after a fork.
+        """
+
+        # pylint: disable=protected-access
+        threads = []
+
+        def a_record(subject, tcp=None):  # pylint: disable=unused-argument
+            threads.append(current_thread())
+            return ["140.82.121.4"]
+
+        for dns_lookup in [self.dns_lookup, Dns()]:
+            dns_lookup.ns_record = Mock(return_value=None)
+            dns_lookup.cname_record = Mock(return_value=None)
+            dns_lookup.dname_record = Mock(return_value=None)
+            dns_lookup.a_record = a_record
+            dns_lookup.aaaa_record = Mock(return_value=None)
+
+            dns_lookup.request("github.com")
+
+        executor = DNSQueryPool.get_executor()
+
+        expected = True
+        actual = all(x in executor._threads for x in threads)
+
+        self.assertEqual(expected, actual)
+
+        with patch("PyFunceble.lookup.dns_query_pool.getpid", return_value=-1):
+            self.assertIsNot(executor, DNSQueryPool.get_executor())
+
+        self.assertIsNot(executor, DNSQueryPool.get_executor())
+
+    def test_request_many(self):
+        """
+        Tests the method which let us request the records of many subjects.
+        """
+
+        self.dns_lookup.request = Mock(
+            side_effect=lambda subject, complete=False, tcp=None: {"NS": [subject]}
+        )
+
+        given = [f"example{x}.org" for x in range(50)]
+
+        expected = {x: {"NS": [x]} for x in given}
+        actual = dict(self.dns_lookup.request_many(given, concurrency=5))
+
+        self.assertEqual(expected, actual)
+
+    def test_request_many_round_robin(self):
+        """
+        Tests that the method which let us request the records of many subjects
+        distribute the subjects between the nameservers.
+        """
+
+        dns_lookup = Dns(dns_server=["192.0.2.1", "192.0.2.2"])
+
+        expected = [["192.0.2.1", "192.0.2.2"], ["192.0.2.2", "192.0.2.1"]]
+        actual = [
+            x.resolver.nameservers
+            for x in DNSQueryPool.get_round_robin_lookups(dns_lookup)
+        ]
+
+        self.assertEqual(expected, actual)
+
+        expected = ["192.0.2.1", "192.0.2.2"]
+        actual = dns_lookup.resolver.nameservers
+
+        self.assertEqual(expected, actual)
+
+    def test_request_many_wrong_concurrency(self):
+        """
+        Tests the method which let us request the records of many subjects
+        for the case that a wrong concurrency is given.
+        """
+
+        self.assertRaises(
+            ValueError,
+            lambda: list(self.dns_lookup.request_many(["github.com"], concurrency=0)),
+        )
+
 
 class TestDNSLookupA(TestCase):
     """
@@ -828,5 +1059,112 @@ class TestDNSLookupPTR(TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestDNSLookupCache(TestCase):
+    """
+    Tests of the PyFunceble.lookup.dns for the case that the
+    cache is activated.
+    """
+
+    # pylint: disable=invalid-name
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.dns_lookup = Dns(cache_size=10)
+        self.dns_lookup.cache.clear()
+        self.subject = "github.com"
+
+    def tearDown(self):
+        """
+        Cleanups everything after the tests.
+        """
+
+        self.dns_lookup.cache.clear()
+
+    def test_no_cache(self):
+        """
+        Tests that the cache is not activated by default.
+        """
+
+        self.assertIsNone(Dns().cache)
+
+    def test_shared_cache(self):
+        """
+        Tests that the cache is shared accross instances.
+        """
+
+        self.assertIs(self.dns_lookup.cache, Dns(cache_size=10).cache)
+
+    def test_record_cached(self):
+        """
+        Tests that a positive answer is given by the cache.
+        """
+
+        answer = Mock()
+        answer.__iter__ = Mock(return_value=iter(["140.82.121.4"]))
+        answer.rrset.ttl = 60
+
+        self.dns_lookup.resolver.query = Mock(return_value=answer)
+
+        expected = ["140.82.121.4"]
+
+        actual = self.dns_lookup.a_record(self.subject)
+        self.assertEqual(expected, actual)
+
+        actual = self.dns_lookup.a_record(self.subject.upper())
+        self.assertEqual(expected, actual)
+
+        self.assertEqual(1, self.dns_lookup.resolver.query.call_count)
+        self.assertEqual(1, self.dns_lookup.cache.hits)
+        self.assertEqual(1, self.dns_lookup.cache.misses)
+
+    def test_record_not_cached_zero_ttl(self):
+        """
+        Tests that an answer with a TTL of 0 is not cached.
+        """
+
+        answer = Mock()
+        answer.__iter__ = Mock(side_effect=lambda: iter(["140.82.121.4"]))
+        answer.rrset.ttl = 0
+
+        self.dns_lookup.resolver.query = Mock(return_value=answer)
+
+        self.dns_lookup.a_record(self.subject)
+        self.dns_lookup.a_record(self.subject)
+
+        self.assertEqual(2, self.dns_lookup.resolver.query.call_count)
+
+    def test_record_NXDOMAIN_cached(self):
+        """
+        Tests that a NXDOMAIN answer is cached.
+        """
+
+        self.dns_lookup.resolver.query = Mock(side_effect=NXDOMAIN())
+
+        expected = None
+
+        actual = self.dns_lookup.a_record(self.subject)
+        self.assertEqual(expected, actual)
+
+        actual = self.dns_lookup.a_record(self.subject)
+        self.assertEqual(expected, actual)
+
+        self.assertEqual(1, self.dns_lookup.resolver.query.call_count)
+
+    def test_record_NoNameservers_not_cached(self):
+        """
+        Tests that a NoNameservers answer is not cached.
+        """
+
+        self.dns_lookup.resolver.query = Mock(side_effect=NoNameservers())
+
+        self.dns_lookup.a_record(self.subject)
+        self.dns_lookup.a_record(self.subject)
+
+        self.assertEqual(2, self.dns_lookup.resolver.query.call_count)
+
+
 if __name__ == "__main__":
     launch_tests()
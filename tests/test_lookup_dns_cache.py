@@ -0,0 +1,192 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.lookup.dns_cache
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from time import sleep
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyFunceble.lookup import DNSCache
+
+
+class TestDNSCache(TestCase):
+    """
+    Tests of the PyFunceble.lookup.dns_cache.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.cache = DNSCache(maximal_size=2)
+
+    def test_get_unknown(self):
+        """
+        Tests the case that we get an unknown key.
+        """
+
+        expected = None
+        actual = self.cache.get(("github.com", "A", ()))
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_set_get(self):
+        """
+        Tests the saving and the reading of an entry.
+        """
+
+        key = ("github.com", "A", ())
+        self.cache.set(key, ["140.82.121.4"], 60)
+
+        expected = ["140.82.121.4"]
+        actual = self.cache.get(key)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(1, self.cache.hits)
+        self.assertIn(key, self.cache)
+
+    def test_set_no_ttl(self):
+        """
+        Tests that an entry without TTL is not saved.
+        """
+
+        key = ("github.com", "A", ())
+        self.cache.set(key, ["140.82.121.4"], 0)
+
+        self.assertEqual(0, len(self.cache))
+
+    def test_expiration(self):
+        """
+        Tests that an entry is dropped once its TTL is over.
+        """
+
+        key = ("github.com", "A", ())
+        self.cache.set(key, ["140.82.121.4"], 0.01)
+
+        sleep(0.02)
+
+        expected = None
+        actual = self.cache.get(key)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, len(self.cache))
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used entry is dropped first.
+        """
+
+        self.cache.set("a", 1, 60)
+        self.cache.set("b", 2, 60)
+
+        # We use "a" so that "b" becomes the least recently used.
+        self.cache.get("a")
+
+        self.cache.set("c", 3, 60)
+
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(1, self.cache.evictions)
+
+    def test_resize(self):
+        """
+        Tests the resizing of the cache.
+        """
+
+        self.cache.set("a", 1, 60)
+        self.cache.set("b", 2, 60)
+
+        self.cache.resize(1)
+
+        self.assertNotIn("a", self.cache)
+        self.assertIn("b", self.cache)
+
+    def test_stats(self):
+        """
+        Tests the statistics of the cache.
+        """
+
+        self.cache.set("a", 1, 60)
+        self.cache.get("a")
+        self.cache.get("b")
+
+        expected = {
+            "size": 1,
+            "maximal_size": 2,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+        }
+        actual = self.cache.stats()
+
+        self.assertEqual(expected, actual)
+
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.hits)
+
+
+if __name__ == "__main__":
+    launch_tests()
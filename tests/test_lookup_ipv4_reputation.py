@@ -0,0 +1,144 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.lookup.ipv4_reputation
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyFunceble.helpers import File
+from PyFunceble.lookup import IPv4Reputation
+
+
+class TestIPv4Reputation(TestCase):
+    """
+    Tests of PyFunceble.lookup.ipv4_reputation.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.file = File("this_reputation_file_is_a_ghost")
+        self.index_file = File(self.file.path + IPv4Reputation.index_file_extension)
+
+        self.file.write(
+            "1.2.3.4#4#1#Malicious Host\n"
+            "5.6.7.8#4#2#Scanning Host\n"
+            "10.0.0.0/8#4#1#Malicious Network\n"
+            "10.1.0.0/24#4#1#Malicious Network\n"
+            "192.168.1.0/24#4#1#Malicious Network\n"
+            "hello#4#1#Invalid\n",
+            overwrite=True,
+        )
+
+        IPv4Reputation.index = None
+
+        self.reputation = IPv4Reputation()
+        self.reputation.input_file = self.file.path
+        self.reputation.index_file = self.index_file.path
+
+    def tearDown(self):
+        """
+        Setups everything needed after the tests.
+        """
+
+        IPv4Reputation.index = None
+
+        self.file.delete()
+        self.index_file.delete()
+
+    def test_is_present(self):
+        """
+        Tests the lookup of IPv4 which are into the reputation file.
+        """
+
+        for subject in ["1.2.3.4", "5.6.7.8", "10.0.0.0", "10.2.0.1", "192.168.1.7"]:
+            self.assertIn(subject, self.reputation, subject)
+
+    def test_is_not_present(self):
+        """
+        Tests the lookup of IPv4 which are not into the reputation file.
+        """
+
+        for subject in ["1.2.3.45", "5.6.7.9", "11.0.0.0", "192.168.2.1"]:
+            self.assertNotIn(subject, self.reputation, subject)
+
+    def test_index_file(self):
+        """
+        Tests that the index is saved, reused and rebuilt once the
+        reputation file changed.
+        """
+
+        self.assertIn("1.2.3.4", self.reputation)
+        self.assertTrue(self.index_file.exists())
+
+        IPv4Reputation.index = None
+
+        self.assertIn("1.2.3.4", self.reputation)
+
+        self.file.write("", overwrite=True)
+
+        self.assertNotIn("1.2.3.4", self.reputation)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,159 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.lookup.whois_scheduler
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from threading import Lock, Thread
+from time import monotonic, sleep
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyFunceble.lookup import WhoisScheduler
+
+
+class TestWhoisScheduler(TestCase):
+    """
+    Tests of the PyFunceble.lookup.whois_scheduler.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        self.lock = Lock()
+        self.running = {}
+        self.maximal_running = {}
+
+    def request(self, scheduler, server):
+        """
+        Simulates a request to the given server.
+        """
+
+        with scheduler.slot(server):
+            with self.lock:
+                self.running[server] = self.running.get(server, 0) + 1
+                self.maximal_running[server] = max(
+                    self.maximal_running.get(server, 0), self.running[server]
+                )
+
+            sleep(0.05)
+
+            with self.lock:
+                self.running[server] -= 1
+
+    def run_requests(self, scheduler, servers):
+        """
+        Runs a request to each of the given servers concurrently.
+        """
+
+        threads = [Thread(target=self.request, args=(scheduler, x)) for x in servers]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    def test_concurrency(self):
+        """
+        Tests that the concurrency is limited per server.
+        """
+
+        scheduler = WhoisScheduler(concurrency=2)
+
+        self.run_requests(
+            scheduler, ["whois.example.org"] * 6 + ["whois.example.net"] * 6
+        )
+
+        expected = {"whois.example.org": 2, "whois.example.net": 2}
+        actual = self.maximal_running
+
+        self.assertEqual(expected, actual)
+
+    def test_no_concurrency_limit(self):
+        """
+        Tests the case that the concurrency is not limited.
+        """
+
+        scheduler = WhoisScheduler(concurrency=None)
+
+        self.run_requests(scheduler, ["whois.example.org"] * 4)
+
+        expected = {"whois.example.org": 4}
+        actual = self.maximal_running
+
+        self.assertEqual(expected, actual)
+
+    def test_interval(self):
+        """
+        Tests that the requests to the same server are spread over time.
+        """
+
+        scheduler = WhoisScheduler(concurrency=None, interval=0.1)
+
+        start = monotonic()
+        self.run_requests(scheduler, ["whois.example.org"] * 3)
+
+        self.assertGreaterEqual(monotonic() - start, 0.2)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,142 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.output.collector.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import call, patch
+
+import PyFunceble
+from PyFunceble.output import OutputCollector
+
+
+class TestOutputCollector(TestCase):
+    """
+    Tests of PyFunceble.output.collector.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+    def test_print_collected(self):
+        """
+        Tests that the collected data are printed file by file, once asked.
+        """
+
+        collector = OutputCollector()
+
+        with patch("PyFunceble.output.Prints") as prints:
+            collector.print_on_file(["example.org"], "PlainDomain", "hello")
+            collector.print_on_file(["example.net"], "PlainDomain", "world")
+            collector.print_on_file(["example.com"], "PlainDomain", "hello")
+
+            expected = 3
+            actual = len(collector)
+
+            self.assertEqual(expected, actual)
+            prints.assert_not_called()
+
+            collector.print_collected()
+
+            expected = [
+                call(["example.org"], "PlainDomain", "hello", True),
+                call().bulk_data([["example.org"], ["example.com"]]),
+                call(["example.net"], "PlainDomain", "world", True),
+                call().bulk_data([["example.net"]]),
+            ]
+
+            self.assertEqual(expected, prints.mock_calls)
+
+        expected = 0
+        actual = len(collector)
+
+        self.assertEqual(expected, actual)
+
+    def test_print_on_file_not_bulk(self):
+        """
+        Tests that the data are printed as we get them when we are not
+        in bulk mode.
+        """
+
+        collector = OutputCollector(bulk=False)
+
+        with patch("PyFunceble.output.Prints") as prints:
+            collector.print_on_file(["example.org"], "PlainDomain", "hello")
+
+            expected = [
+                call(["example.org"], "PlainDomain", "hello", True),
+                call().data(),
+            ]
+
+            self.assertEqual(expected, prints.mock_calls)
+
+        expected = 0
+        actual = len(collector)
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
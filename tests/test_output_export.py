@@ -0,0 +1,215 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.output.export.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from csv import DictReader
+from os import getpid
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.output.export import ResultsExport
+
+
+class TestResultsExport(TestCase):
+    """
+    Tests of PyFunceble.output.export.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the test.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"export_chunk_size": 2}
+        )
+
+        self.file = PyFunceble.CONFIG_DIRECTORY + "export_test.csv"
+        PyFunceble.helpers.File(self.file).delete()
+
+        self.data = {
+            "tested": "example.org",
+            "dns_lookup": {"A": ["93.184.216.34"]},
+            "domain_syntax_validation": True,
+            "expiration_date": None,
+            "http_status_code": 200,
+            "ipv4_syntax_validation": False,
+            "status": "ACTIVE",
+            "status_source": "DNSLOOKUP",
+        }
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        PyFunceble.helpers.File(self.file).delete()
+
+    def read(self):
+        """
+        Provides the rows of our file.
+        """
+
+        with open(self.file, "r", encoding="utf-8", newline="") as file_stream:
+            return list(DictReader(file_stream))
+
+    def test_get_file_path_and_format(self):
+        """
+        Tests that a CSV file is written as CSV.
+        """
+
+        expected = (self.file, "csv")
+        actual = ResultsExport.get_file_path_and_format(self.file)
+
+        self.assertEqual(expected, actual)
+
+    def test_format_row(self):
+        """
+        Tests of the formatting of a row.
+        """
+
+        actual = ResultsExport.format_row(self.data, file_path="hello.list")
+
+        self.assertEqual(ResultsExport.columns, list(actual.keys()))
+
+        self.assertEqual("example.org", actual["tested"])
+        self.assertEqual("hello.list", actual["file_path"])
+        self.assertEqual('{"A": ["93.184.216.34"]}', actual["dns_lookup"])
+        self.assertEqual(True, actual["domain_syntax_validation"])
+        self.assertEqual(False, actual["ipv4_syntax_validation"])
+        self.assertEqual(None, actual["expiration_date"])
+        self.assertEqual("200", actual["http_status_code"])
+
+    def test_add(self):
+        """
+        Tests that the rows are written by chunk.
+        """
+
+        export = ResultsExport(self.file)
+
+        export.add(self.data, file_path="hello.list")
+
+        expected = 0
+        actual = export.exported
+
+        self.assertEqual(expected, actual)
+
+        export.add(self.data, file_path="hello.list")
+
+        expected = 2
+        actual = export.exported
+
+        self.assertEqual(expected, actual)
+
+        export.add(dict(self.data, tested="example.net"))
+        export.close()
+
+        actual = self.read()
+
+        self.assertEqual(ResultsExport.columns, list(actual[0].keys()))
+
+        expected = ["example.org", "example.org", "example.net"]
+
+        self.assertEqual(expected, [x["tested"] for x in actual])
+
+        expected = ["hello.list", "hello.list", ""]
+
+        self.assertEqual(expected, [x["file_path"] for x in actual])
+
+    def test_add_not_owner(self):
+        """
+        Tests that only the process which created the export writes.
+        """
+
+        export = ResultsExport(self.file)
+        export.owner = getpid() + 1
+
+        export.add(self.data)
+        export.close()
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.file).exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_close_empty(self):
+        """
+        Tests that we write the header even if nothing was added.
+        """
+
+        export = ResultsExport(self.file)
+        export.flush()
+        export.close()
+
+        expected = []
+        actual = self.read()
+
+        self.assertEqual(expected, actual)
+
+        expected = ",".join(ResultsExport.columns) + "\n"
+        actual = PyFunceble.helpers.File(self.file).read()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,161 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.output.logs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.output import Logs
+
+
+class TestLogs(TestCase):
+    """
+    Tests of PyFunceble.output.logs.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the test.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"debug": True, "logs": True, "share_logs": False},
+        )
+
+        self.file = PyFunceble.CONFIG_DIRECTORY + "logs_test.json"
+        self.json_lines_file = PyFunceble.output.Prints.get_json_lines_file(
+            self.file
+        )
+
+        PyFunceble.helpers.File(self.file).delete()
+        PyFunceble.helpers.File(self.json_lines_file).delete()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        PyFunceble.output.OutputSink.close_all()
+
+        PyFunceble.helpers.File(self.file).delete()
+        PyFunceble.helpers.File(self.json_lines_file).delete()
+
+    def test_append(self):
+        """
+        Tests that our records are appended as JSON Lines.
+        """
+
+        logs = Logs(output=self.file)
+        logs.current_time = "1"
+        logs.whois("example.org", "Hello, World!")
+
+        logs = Logs(output=self.file)
+        logs.current_time = "2"
+        logs.referer_not_found("example.org", "org")
+
+        PyFunceble.output.OutputSink.flush()
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.file).exists()
+
+        self.assertEqual(expected, actual)
+
+        expected = (
+            '{"1":{"domain":"example.org","record":"Hello, World!"}}\n'
+            '{"2":{"domain":"example.org","extension":"org"}}\n'
+        )
+        actual = PyFunceble.helpers.File(self.json_lines_file).read()
+
+        self.assertEqual(expected, actual)
+
+    def test_convert_json_lines(self):
+        """
+        Tests the conversion of our JSON Lines into the old format.
+        """
+
+        PyFunceble.helpers.Dict(
+            {"0": {"domain": "example.net", "extension": "net"}}
+        ).to_json_file(self.file)
+
+        logs = Logs(output=self.file)
+        logs.current_time = "1"
+        logs.referer_not_found("example.org", "org")
+
+        Logs.convert_json_lines(self.file)
+
+        expected = {
+            "0": {"domain": "example.net", "extension": "net"},
+            "1": {"domain": "example.org", "extension": "org"},
+        }
+        actual = PyFunceble.helpers.Dict().from_json_file(self.file)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.json_lines_file).exists()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,128 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.output.logs_sharer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.output import LogsSharer
+
+
+class TestLogsSharer(TestCase):
+    """
+    Tests of PyFunceble.output.logs_sharer.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the test.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+    def test_share(self):
+        """
+        Tests that the queued records are posted from our thread.
+        """
+
+        with patch("PyFunceble.lookup.Requests.post") as post:
+            for index in range(3):
+                LogsSharer.share("https://example.org", {"index": index})
+
+            LogsSharer.flush()
+
+            expected = [{"index": x} for x in range(3)]
+            actual = [x[1]["data"] for x in post.call_args_list]
+
+            self.assertEqual(expected, actual)
+
+            expected = True
+            actual = LogsSharer.thread.is_alive()
+
+            self.assertEqual(expected, actual)
+
+    def test_share_error(self):
+        """
+        Tests that our thread survives a failed post.
+        """
+
+        with patch(
+            "PyFunceble.lookup.Requests.post",
+            side_effect=PyFunceble.lookup.Requests.exceptions.ConnectionError(),
+        ) as post:
+            LogsSharer.share("https://example.org", {"hello": "world"})
+            LogsSharer.flush()
+
+            post.side_effect = None
+
+            LogsSharer.share("https://example.org", {"world": "hello"})
+            LogsSharer.flush()
+
+            expected = [{"hello": "world"}, {"world": "hello"}]
+            actual = [x[1]["data"] for x in post.call_args_list]
+
+            self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -168,6 +168,24 @@ class TestPercentage(StdoutBase):
 
         self.assertEqual(expected, actual)
 
+    def test_count_duplicate(self):
+        """
+        Tests the counter and the calculation of the duplicates.
+        """
+
+        PyFunceble.INTERN["counter"]["number"].update(
+            {"up": 3, "down": 1, "invalid": 0, "tested": 4}
+        )
+
+        Percentage.count_duplicate()
+        Percentage.count_duplicate()
+
+        self.assertEqual(2, PyFunceble.INTERN["counter"]["number"]["duplicate"])
+
+        Percentage().calculate()
+
+        self.assertEqual(50, PyFunceble.INTERN["counter"]["percentage"]["duplicate"])
+
     def test_log(self):
         """
         Tests the log system.
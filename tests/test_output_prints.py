@@ -85,6 +85,14 @@ class TestPrints(StdoutBase):
 
         PyFunceble.load_config()
 
+        # We keep the current values so that we can restore them once done.
+        self.header_printed = PyFunceble.CONFIGURATION.header_printed
+        self.http_code_active = PyFunceble.HTTP_CODE.active
+
+        # The sizes we print with depend on both.
+        PyFunceble.CONFIGURATION.header_printed = False
+        PyFunceble.HTTP_CODE.active = True
+
         StdoutBase.setUp(self)
 
         self.file = "the_file_is_a_ghost"
@@ -105,6 +113,9 @@ class TestPrints(StdoutBase):
 
         self.file_instance.delete()
 
+        PyFunceble.CONFIGURATION.header_printed = self.header_printed
+        PyFunceble.HTTP_CODE.active = self.http_code_active
+
         StdoutBase.tearDown(self)
 
     @patch("datetime.datetime")
@@ -350,5 +361,84 @@ Hello World
         self.assertEqual(expected, actual)
 
 
+    def test_consolidate_json_lines(self):
+        """
+        Tests the method which consolidates the JSON Lines
+        we wrote into their JSON file.
+        """
+
+        json_lines_file = PyFunceble.helpers.File(
+            Prints.get_json_lines_file(self.file_instance.path)
+        )
+        json_lines_file.delete()
+
+        PyFunceble.helpers.Dict(["hello.world", "world.hello"]).to_json_file(
+            self.file_instance.path
+        )
+
+        for subject in ["example.org", "hello.world", "example.net"]:
+            Prints([subject], "JSON", output_file=self.file_instance.path).data()
+
+        expected = ["hello.world", "world.hello"]
+        actual = PyFunceble.helpers.Dict().from_json_file(self.file_instance.path)
+
+        self.assertEqual(expected, actual)
+
+        Prints.consolidate_json_lines(self.file_instance.path)
+
+        expected = ["example.net", "example.org", "hello.world", "world.hello"]
+        actual = PyFunceble.helpers.Dict().from_json_file(self.file_instance.path)
+
+        self.assertEqual(expected, actual)
+
+        expected = False
+        actual = json_lines_file.exists()
+
+        self.assertEqual(expected, actual)
+
+    def test_bulk_data(self):
+        """
+        Tests that the method which writes multiple rows at once writes
+        what we write row by row.
+        """
+
+        rows = {
+            "PlainDomain": [["example.org"], ["hello.world"]],
+            "FullHosts": [["0.0.0.0", "example.org"], ["0.0.0.0", "hello.world"]],
+            "Simple": [["example.org", "VALID"], ["hello.world", "INVALID"]],
+            PyFunceble.STATUS.official.invalid: [
+                ["example.org", "SYNTAX", "XXX", "2020-01-01T00:00:00"],
+                ["hello.world", "SYNTAX", "XXX", "2020-01-01T00:00:00"],
+            ],
+        }
+
+        for template, data in rows.items():
+            for row in data:
+                Prints(row, template, self.file, True).data()
+
+            PyFunceble.output.OutputSink.close_all()
+
+            expected = [
+                x
+                for x in self.file_instance.read().splitlines()
+                if not x.startswith("# Date of generation")
+            ]
+
+            self.file_instance.delete()
+
+            Prints(data[0], template, self.file, True).bulk_data(data)
+            PyFunceble.output.OutputSink.close_all()
+
+            actual = [
+                x
+                for x in self.file_instance.read().splitlines()
+                if not x.startswith("# Date of generation")
+            ]
+
+            self.file_instance.delete()
+
+            self.assertEqual(expected, actual)
+
+
 if __name__ == "__main__":
     launch_tests()
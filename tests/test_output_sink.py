@@ -0,0 +1,218 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4, IPv6 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Tests of PyFunceble.output.sink.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io///en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019, 2020 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.output.sink import OutputSink
+
+
+class TestOutputSink(TestCase):
+    """
+    Tests of PyFunceble.output.sink.
+    """
+
+    def setUp(self):
+        """
+        Setups everything needed for the test.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={
+                "output_buffer_size": 3,
+                "output_buffer_interval": 3600,
+                "output_max_open_files": 2,
+            },
+        )
+
+        self.files = [
+            PyFunceble.CONFIG_DIRECTORY + f"output_sink_test_{x}" for x in range(3)
+        ]
+
+        OutputSink.close_all()
+
+        for file in self.files:
+            PyFunceble.helpers.File(file).delete()
+
+    def tearDown(self):
+        """
+        Setups everything needed after a test.
+        """
+
+        OutputSink.close_all()
+
+        for file in self.files:
+            PyFunceble.helpers.File(file).delete()
+
+    def test_write(self):
+        """
+        Tests that the lines are only written once the size threshold is reached.
+        """
+
+        OutputSink.write(self.files[0], "hello\n")
+        OutputSink.write(self.files[0], "world\n")
+
+        expected = False
+        actual = PyFunceble.helpers.File(self.files[0]).exists()
+
+        self.assertEqual(expected, actual)
+
+        OutputSink.write(self.files[0], "!\n")
+
+        expected = "hello\nworld\n!\n"
+        actual = PyFunceble.helpers.File(self.files[0]).read()
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = OutputSink.pending_size
+
+        self.assertEqual(expected, actual)
+
+    def test_write_interval(self):
+        """
+        Tests that the lines are written once the time threshold is reached.
+        """
+
+        PyFunceble.CONFIGURATION.output_buffer_interval = 0
+
+        OutputSink.write(self.files[0], "hello\n")
+
+        expected = "hello\n"
+        actual = PyFunceble.helpers.File(self.files[0]).read()
+
+        self.assertEqual(expected, actual)
+
+    def test_flush_append(self):
+        """
+        Tests that we append to the existing content of the files.
+        """
+
+        PyFunceble.helpers.File(self.files[0]).write("# Header\n")
+
+        OutputSink.write(self.files[0], "hello\n")
+        OutputSink.flush()
+
+        OutputSink.write(self.files[0], "world\n")
+        OutputSink.flush(self.files[0])
+
+        expected = "# Header\nhello\nworld\n"
+        actual = PyFunceble.helpers.File(self.files[0]).read()
+
+        self.assertEqual(expected, actual)
+
+    def test_handles_limit(self):
+        """
+        Tests that we never keep more handles than allowed.
+        """
+
+        for file in self.files:
+            OutputSink.write(file, f"{file}\n")
+            OutputSink.flush()
+
+        expected = self.files[1:]
+        actual = list(OutputSink.handles)
+
+        self.assertEqual(expected, actual)
+
+        OutputSink.write(self.files[0], "world\n")
+        OutputSink.close_all()
+
+        expected = {}
+        actual = dict(OutputSink.handles)
+
+        self.assertEqual(expected, actual)
+
+        expected = f"{self.files[0]}\nworld\n"
+        actual = PyFunceble.helpers.File(self.files[0]).read()
+
+        self.assertEqual(expected, actual)
+
+    def test_reset_if_forked(self):
+        """
+        Tests that we forget what we inherited from our parent process.
+        """
+
+        OutputSink.write(self.files[0], "hello\n")
+        OutputSink.flush()
+        OutputSink.write(self.files[0], "world\n")
+
+        # We simulate the fork.
+        OutputSink.pending_pid = -1
+
+        OutputSink.flush()
+
+        expected = {}
+        actual = dict(OutputSink.handles)
+
+        self.assertEqual(expected, actual)
+
+        expected = "hello\n"
+        actual = PyFunceble.helpers.File(self.files[0]).read()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()